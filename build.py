@@ -2,22 +2,39 @@
 """
 Build script for Windows Driver Updater
 Creates a standalone executable using PyInstaller
+
+Usage: python build.py
+The bundled modules are compiled at PYTHON_OPTIMIZE, which strips their
+asserts.
 """
 
+import hashlib
+import importlib.metadata
+import importlib.util
 import os
+import re
 import shutil
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 
 def check_pyinstaller():
-    """Check if PyInstaller is installed"""
+    """Check if PyInstaller 6 or later is installed"""
+    # find_spec locates the package without executing its __init__
+    if importlib.util.find_spec("PyInstaller") is None:
+        return False
     try:
-        import PyInstaller
-
-        return True
-    except ImportError:
+        major = importlib.metadata.version("pyinstaller").split(".")[0]
+        return int(major) >= 6
+    except (importlib.metadata.PackageNotFoundError, ValueError):
         return False
 
 
@@ -25,29 +42,117 @@ def install_pyinstaller():
     """Install PyInstaller"""
     try:
         print("Installing PyInstaller...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install", "pyinstaller>=6"]
+        )
         return True
     except subprocess.CalledProcessError:
         return False
 
 
+def _write_all(path, content):
+    """Write a generated text file with a single write call"""
+    data = content.encode("utf-8")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        if hasattr(os, "writev"):
+            os.writev(fd, [memoryview(data)])
+        else:
+            os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _parallel_rmtree(root):
+    """Remove a directory tree, unlinking files from a thread pool"""
+    files = []
+    dirs = [root]
+
+    # Walk the tree with scandir so DirEntry type info avoids extra stat calls
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                    pending.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    # Each unlink releases the GIL, so threads overlap the syscall latency
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(os.unlink, files))
+
+    # Directories were discovered parent-first, so remove them in reverse
+    for dir_path in reversed(dirs):
+        os.rmdir(dir_path)
+
+
+# PyInstaller's work directory (build/) is kept between builds so it can
+# reuse its previous Analysis; DRIVERUPDATER_CLEAN=1 forces a full rebuild
+FULL_CLEAN = os.environ.get("DRIVERUPDATER_CLEAN") == "1"
+
+
 def clean_build_dirs():
     """Clean previous build directories"""
-    dirs_to_clean = ["build", "dist"]
+    dirs_to_clean = ["build", "dist"] if FULL_CLEAN else ["dist"]
+    present = set(os.listdir("."))
 
     for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
+        if dir_name in present:
             print(f"Cleaning {dir_name} directory...")
-            shutil.rmtree(dir_name)
+            _parallel_rmtree(dir_name)
+
+    # Per-job PyInstaller config dirs from CI builds are never reused
+    if not FULL_CLEAN and "build" in present:
+        with os.scandir("build") as entries:
+            stale = [e.path for e in entries if e.name.startswith("pyi-cache-")]
+        for path in stale:
+            _parallel_rmtree(path)
+
+
+HIDDEN_IMPORTS = (
+    "tkinter",
+    "tkinter.ttk",
+    "wmi",
+    "win32api",
+    "win32con",
+    "requests",
+    "psutil",
+    "bs4",
+    "packaging",
+    "packaging.version",
+    "packaging.specifiers",
+    "packaging.requirements",
+)
 
+# Optimization level PyInstaller compiles the bundled modules at (-O). Not
+# -OO: that would strip docstrings from wmi, pywin32 and bs4 as well.
+# Analysis(optimize=...) needs PyInstaller 6.0 or later. The build script
+# itself can still be run as `python -OO build.py`; the bundle ignores that.
+PYTHON_OPTIMIZE = 1
 
-def create_spec_file():
-    """Create PyInstaller spec file"""
-    spec_content = """
+SPEC_TEMPLATE = """
 # -*- mode: python ; coding: utf-8 -*-
 
+import os
+
 block_cipher = None
 
+# UPX is opt-in (DRIVERUPDATER_UPX=1): compression slows the build, adds
+# decompression cost to every launch and is a common source of antivirus
+# false positives, for little size benefit in a onedir bundle. Whether upx
+# is installed is resolved when this spec is generated.
+use_upx = {upx_available} and os.environ.get('DRIVERUPDATER_UPX') == '1'
+
+# Stripping symbol tables is opt-in too (DRIVERUPDATER_STRIP=1): PyInstaller
+# advises against it on Windows, where GNU strip from Git or MSYS can corrupt
+# DLLs. It runs before UPX when both are enabled, and only when a strip tool
+# was found when this spec was generated.
+use_strip = {strip_available} and os.environ.get('DRIVERUPDATER_STRIP') == '1'
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -58,29 +163,21 @@ a = Analysis(
         ('requirements.txt', '.'),
     ],
     hiddenimports=[
-        'tkinter',
-        'tkinter.ttk',
-        'wmi',
-        'win32api',
-        'win32con',
-        'requests',
-        'psutil',
-        'bs4',
-        'packaging',
-        'packaging.version',
-        'packaging.specifiers',
-        'packaging.requirements',
+        {hidden_imports},
     ],
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
     excludes=[],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
-    noarchive=False,
+    noarchive=True,
+    optimize={optimize},
 )
 
+# PYZ entries are zlib-compressed individually and decompressed lazily on
+# import; PyInstaller exposes no alternative codec (zstd/lz4) for them.
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
 exe = EXE(
@@ -91,8 +188,8 @@ exe = EXE(
     name='DriverUpdater',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
+    strip=use_strip,
+    upx=use_upx,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -108,15 +205,40 @@ coll = COLLECT(
     a.binaries,
     a.zipfiles,
     a.datas,
-    strip=False,
-    upx=True,
+    strip=use_strip,
+    upx=use_upx,
     upx_exclude=[],
     name='DriverUpdater',
 )
 """
 
-    with open("DriverUpdater.spec", "w") as f:
-        f.write(spec_content.strip())
+
+def _strip_available():
+    """Check whether PyInstaller can strip binaries on this machine"""
+    # PyInstaller shells out to a program named "strip"; llvm-strip only
+    # works when it is installed (or aliased) under that name
+    if shutil.which("strip"):
+        return True
+    if os.environ.get("DRIVERUPDATER_STRIP") != "1":
+        return False
+    if shutil.which("llvm-strip"):
+        print("Warning: llvm-strip found but not as 'strip'; symbols will not be stripped")
+    else:
+        print("Warning: strip not found; symbols will not be stripped")
+    return False
+
+
+def create_spec_file():
+    """Create PyInstaller spec file"""
+    # Bake machine-specific values in now instead of probing at build time
+    spec_content = SPEC_TEMPLATE.format(
+        hidden_imports=",\n            ".join(repr(m) for m in HIDDEN_IMPORTS),
+        upx_available=shutil.which("upx") is not None,
+        strip_available=_strip_available(),
+        optimize=PYTHON_OPTIMIZE,
+    )
+
+    _write_all("DriverUpdater.spec", spec_content.strip())
 
     print("Created PyInstaller spec file")
 
@@ -155,29 +277,201 @@ VSVersionInfo(
 )
 """
 
-    with open("version_info.txt", "w") as f:
-        f.write(version_info.strip())
+    _write_all("version_info.txt", version_info.strip())
 
     print("Created version info file")
 
 
+BUILD_CACHE_DIR = ".build-cache"
+# Cached bundles kept; older ones are removed after each fresh build
+BUILD_CACHE_KEEP = 3
+DIST_APP_DIR = os.path.join("dist", "DriverUpdater")
+
+
+def _toolchain_versions():
+    """Describe the Python, PyInstaller and dependency versions in use"""
+    names = ["pyinstaller"]
+    try:
+        with open("requirements.txt", encoding="utf-8") as f:
+            for line in f:
+                requirement = line.split("#", 1)[0].strip()
+                if requirement:
+                    names.append(re.split(r"[\s<>=!~;\[]", requirement, 1)[0])
+    except OSError:
+        pass
+
+    lines = [sys.version]
+    for name in names:
+        try:
+            version = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            version = "missing"
+        lines.append(f"{name}=={version}")
+    return "\n".join(lines)
+
+
+def _build_cache_key():
+    """Hash every input that ends up in the bundle"""
+    inputs = sorted(
+        str(path)
+        for pattern in ("*.py", "utils/*.py", "config/*")
+        for path in Path(".").glob(pattern)
+    )
+    inputs += [
+        "requirements.txt",
+        "README.md",
+        "DriverUpdater.spec",
+        "version_info.txt",
+        "icon.ico",
+    ]
+
+    # blake3 hashes with SIMD across all cores; blake2b is the stdlib fallback
+    if blake3 is not None:
+        digest = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    else:
+        digest = hashlib.blake2b()
+
+    # A toolchain or dependency upgrade changes the bundle too
+    digest.update(_toolchain_versions().encode("utf-8") + b"\0")
+    # So do the build switches the spec reads when PyInstaller runs it
+    switches = (
+        f"UPX={os.environ.get('DRIVERUPDATER_UPX', '')}\n"
+        f"STRIP={os.environ.get('DRIVERUPDATER_STRIP', '')}\n"
+        f"OPTIMIZE={PYTHON_OPTIMIZE}"
+    )
+    digest.update(switches.encode("utf-8") + b"\0")
+
+    for name in inputs:
+        if os.path.isfile(name):
+            digest.update(name.encode("utf-8") + b"\0")
+            if blake3 is not None:
+                digest.update_mmap(name)
+            else:
+                with open(name, "rb") as f:
+                    digest.update(f.read())
+            digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def _parallel_copytree(src, dst):
+    """Copy a directory tree, copying files from a thread pool"""
+    copies = []
+
+    pending = [(src, dst)]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, target))
+                else:
+                    copies.append((entry.path, target))
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda pair: _fastcopy(*pair), copies))
+
+
+def _store_build_cache(cached_build):
+    """Save the freshly built bundle for later incremental builds"""
+    try:
+        if os.path.isdir(DIST_APP_DIR):
+            partial = cached_build + ".tmp"
+            if os.path.isdir(partial):
+                _parallel_rmtree(partial)
+            _parallel_copytree(DIST_APP_DIR, partial)
+            os.replace(partial, cached_build)
+            _prune_build_cache()
+    except OSError as e:
+        print(f"Warning: could not update build cache: {e}")
+
+
+def _prune_build_cache():
+    """Keep only the BUILD_CACHE_KEEP most recently used cached bundles"""
+    with os.scandir(BUILD_CACHE_DIR) as entries:
+        builds = [
+            entry
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False) and not entry.name.endswith(".tmp")
+        ]
+    builds.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in builds[BUILD_CACHE_KEEP:]:
+        print(f"Removing old cached build {entry.name[:12]}")
+        _parallel_rmtree(entry.path)
+
+
 def build_executable():
     """Build the executable using PyInstaller"""
     try:
         print("Building executable...")
 
-        # Run PyInstaller
-        result = subprocess.run(
-            [sys.executable, "-m", "PyInstaller", "--clean", "DriverUpdater.spec"],
-            capture_output=True,
-            text=True,
+        # Reuse a previous build when none of its inputs have changed,
+        # unless a full rebuild was asked for
+        cache_key = _build_cache_key()
+        cached_build = os.path.join(BUILD_CACHE_DIR, cache_key)
+        if not FULL_CLEAN and os.path.isdir(cached_build):
+            print(f"Inputs unchanged, reusing cached build {cache_key[:12]}")
+            _parallel_copytree(cached_build, DIST_APP_DIR)
+            # Mark it as recently used so pruning keeps it
+            os.utime(cached_build)
+            print("Executable built successfully!")
+            return True
+
+        pyinstaller_args = ["--noconfirm", "DriverUpdater.spec"]
+        if FULL_CLEAN:
+            pyinstaller_args.insert(0, "--clean")
+
+        # Keep PyInstaller's binary cache in build/ so it stays warm between
+        # builds; under CI each job gets its own, so a matrix of concurrent
+        # builds never contends for it. This must be set before PyInstaller
+        # is imported.
+        cache_name = f"pyi-cache-{os.getpid()}" if os.environ.get("CI") else "pyi-cache"
+        os.environ.setdefault(
+            "PYINSTALLER_CONFIG_DIR", os.path.abspath(os.path.join("build", cache_name))
         )
 
-        if result.returncode == 0:
+        # Run PyInstaller in-process to skip a second interpreter start-up
+        try:
+            import PyInstaller.__main__ as pyinstaller_main
+        except ImportError:
+            pyinstaller_main = None
+
+        if pyinstaller_main is not None:
+            try:
+                pyinstaller_main.run(pyinstaller_args)
+            except SystemExit as e:
+                if e.code not in (None, 0):
+                    print(f"Build failed: PyInstaller exited with code {e.code}")
+                    return False
+
+            _store_build_cache(cached_build)
+            print("Executable built successfully!")
+            return True
+
+        # Fall back to a PyInstaller subprocess, streaming its output and
+        # keeping only the tail for the failure report
+        process = subprocess.Popen(
+            [sys.executable, "-m", "PyInstaller", *pyinstaller_args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        output_tail = deque(maxlen=200)
+        for line in process.stdout:
+            sys.stdout.write(line)
+            output_tail.append(line)
+        returncode = process.wait()
+
+        if returncode == 0:
+            _store_build_cache(cached_build)
             print("Executable built successfully!")
             return True
         else:
-            print(f"Build failed: {result.stderr}")
+            print(f"Build failed: {''.join(output_tail)}")
             return False
 
     except Exception as e:
@@ -185,6 +479,51 @@ def build_executable():
         return False
 
 
+def _fastcopy(src, dst):
+    """Copy a file using the OS copy primitive where available"""
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+
+    if sys.platform == "win32":
+        import ctypes
+
+        # CopyFile2 copies in the kernel and preserves attributes/timestamps
+        hresult = ctypes.windll.kernel32.CopyFile2(
+            ctypes.c_wchar_p(src), ctypes.c_wchar_p(dst), None
+        )
+        if hresult == 0:
+            return
+    elif hasattr(os, "sendfile"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                src_fd = fsrc.fileno()
+                dst_fd = fdst.fileno()
+                while os.sendfile(dst_fd, src_fd, None, 2**30):
+                    pass
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+
+    # Fallback: userspace copy
+    _copy_readinto(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _copy_readinto(src, dst):
+    """Copy a file through one reused 1 MiB buffer"""
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += fdst.write(view[written:n])
+
+
 def copy_additional_files():
     """Copy additional files to dist directory"""
     additional_files = [
@@ -196,10 +535,17 @@ def copy_additional_files():
 
     dist_dir = Path("dist/DriverUpdater")
 
-    for file_name in additional_files:
-        if os.path.exists(file_name):
-            shutil.copy2(file_name, dist_dir / file_name)
-            print(f"Copied {file_name}")
+    def copy_file(file_name):
+        _fastcopy(file_name, dist_dir / file_name)
+        print(f"Copied {file_name}")
+
+    # Issue the copies concurrently so the step takes as long as the
+    # slowest file rather than the sum of all of them
+    present = {entry.name for entry in os.scandir(".")}
+    to_copy = [f for f in additional_files if f in present]
+    if to_copy:
+        with ThreadPoolExecutor(max_workers=len(to_copy)) as executor:
+            list(executor.map(copy_file, to_copy))
 
 
 def create_installer():
@@ -211,6 +557,9 @@ def create_installer():
 !define APP_WEBSITE "https://github.com/your-repo/driver-updater"
 !define APP_EXE "DriverUpdater.exe"
 
+; Compress dist\\DriverUpdater as one solid LZMA stream instead of per file
+SetCompressor /SOLID lzma
+
 Name "${APP_NAME}"
 OutFile "DriverUpdaterInstaller.exe"
 InstallDir "$PROGRAMFILES\\${APP_NAME}"
@@ -249,13 +598,24 @@ Section "Uninstall"
 SectionEnd
 """
 
-    with open("installer.nsi", "w") as f:
-        f.write(nsis_script.strip())
+    _write_all("installer.nsi", nsis_script.strip())
 
     print("Created NSIS installer script")
     print("To build installer, run: makensis installer.nsi")
 
 
+def _report_failures(steps):
+    """Wait for every step's future and print each failure; True if none"""
+    wait(steps.values())
+    ok = True
+    for name, future in steps.items():
+        error = future.exception()
+        if error is not None:
+            print(f"ERROR: {name} failed: {error}")
+            ok = False
+    return ok
+
+
 def main():
     """Main build function"""
     print("Windows Driver Updater - Build Script")
@@ -263,27 +623,40 @@ def main():
 
     # Check PyInstaller
     if not check_pyinstaller():
-        print("PyInstaller not found. Installing...")
+        print("PyInstaller 6 or later not found. Installing...")
         if not install_pyinstaller():
             print("ERROR: Failed to install PyInstaller")
             return False
 
-    # Clean previous builds
-    clean_build_dirs()
-
-    # Create spec and version files
-    create_spec_file()
-    create_version_info()
-
-    # Build executable
-    if not build_executable():
-        return False
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Cleaning and writing the spec, version and installer files are
+        # independent of each other, so run them side by side
+        clean_future = executor.submit(clean_build_dirs)
+        spec_future = executor.submit(create_spec_file)
+        version_future = executor.submit(create_version_info)
+        installer_future = executor.submit(create_installer)
+
+        # The build needs a clean tree plus the spec and version files
+        prepared = _report_failures(
+            {
+                "Cleaning build directories": clean_future,
+                "Creating spec file": spec_future,
+                "Creating version info": version_future,
+            }
+        )
 
-    # Copy additional files
-    copy_additional_files()
+        # Build executable
+        built = prepared and build_executable()
+        if built:
+            # Copy additional files
+            copy_additional_files()
 
-    # Create installer script
-    create_installer()
+        # Report the installer script whether or not the build worked
+        installer_created = _report_failures(
+            {"Creating installer script": installer_future}
+        )
+        if not (built and installer_created):
+            return False
 
     print("\n" + "=" * 40)
     print("Build completed successfully!")
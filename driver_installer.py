@@ -1,10 +1,122 @@
+import hashlib
 import os
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Verified downloads are kept here so retries and repeated batches reuse them.
+# The directory is writable by any process of the user, so an entry is only
+# reused when it hashes to what this process itself stored there
+DOWNLOAD_CACHE_DIR = os.path.expandvars("%LOCALAPPDATA%\\DriverUpdater\\cache")
+DOWNLOAD_CACHE_MAX_BYTES = 4 * 1024 * 1024 * 1024
+
+# Characters Windows does not allow in file names
+_SANITIZE_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
+# Common silent installation parameters, probed in order
+_SILENT_PARAMS = (
+    "/S",  # NSIS
+    "/SILENT",  # InstallShield
+    "/VERYSILENT",  # Inno Setup
+    "/q",  # MSI-based
+    "/s",  # Generic
+    "-s",  # Alternative
+    "--silent",  # Alternative
+    "/quiet",  # Alternative
+)
+
+# Installer exit codes that mean success: 3010 = reboot required,
+# 1641 = installer initiated a reboot
+_SUCCESS_CODES = frozenset({0, 1641, 3010})
+
+_MSI_BASE_CMD = ("msiexec", "/i")
+_PNPUTIL_ADD_DRIVER = ("pnputil", "/add-driver")
+
+# Silent-install arguments for vendors whose installers are known
+VENDOR_SILENT_ARGS = {
+    "nvidia": ["-s", "-noreboot"],
+    "intel": ["-s"],
+    "amd": ["-INSTALL"],
+    "realtek": ["/S"],
+}
+
+# Silent-install arguments per installer framework, keyed by a marker string
+# found in the installer stub
+FRAMEWORK_SILENT_ARGS = {
+    b"Nullsoft": ["/S"],
+    b"Inno Setup": ["/VERYSILENT", "/SUPPRESSMSGBOXES", "/NORESTART"],
+    # /v/qn rather than /v"/qn": list2cmdline would escape the quotes
+    b"InstallShield": ["/s", "/v/qn"],
+}
+
+
+def _detect_silent_args(driver_file: str, manufacturer: str) -> Optional[List[str]]:
+    """Pick silent-install arguments from the vendor or installer framework"""
+    manufacturer = manufacturer.lower()
+    for vendor, args in VENDOR_SILENT_ARGS.items():
+        if vendor in manufacturer:
+            return args
+
+    # Framework markers live in the stub's resources, ahead of the payload
+    try:
+        with open(driver_file, "rb") as f:
+            header = f.read(4 * 1024 * 1024)
+    except OSError:
+        return None
+
+    for marker, args in FRAMEWORK_SILENT_ARGS.items():
+        if marker in header:
+            return args
+
+    return None
+
+
+def _noop(*args, **kwargs):
+    """Discard a verbose-only log message"""
+
+
+def _iter_driver_files(root: str):
+    """Yield driver files under root, recursively"""
+    # scandir reuses the directory listing's file type instead of a stat per entry
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_driver_files(entry.path)
+            elif entry.name.endswith((".inf", ".sys", ".cat")):
+                yield entry.path
+
+
+@lru_cache(maxsize=256)
+def _gen_filename(device_name: str, manufacturer: str, version: str) -> str:
+    """Build the download filename for a driver"""
+    # Sanitize filename
+    safe_device_name = DriverInstaller._sanitize_filename(device_name)
+    safe_manufacturer = DriverInstaller._sanitize_filename(manufacturer)
+
+    # Determine file extension based on manufacturer
+    if "nvidia" in manufacturer.lower():
+        ext = ".exe"
+    elif "amd" in manufacturer.lower():
+        ext = ".exe"
+    elif "intel" in manufacturer.lower():
+        ext = ".exe"
+    else:
+        ext = ".exe"
+
+    return f"{safe_manufacturer}_{safe_device_name}_{version}{ext}"
 
 
 class DriverInstaller:
@@ -16,14 +128,56 @@ class DriverInstaller:
         self.backup_dir = os.path.join(self.temp_dir, "driver_backups")
         os.makedirs(self.backup_dir, exist_ok=True)
 
+        # One pooled session for every download, so drivers hosted on the
+        # same CDN reuse the connection and TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         # Enhanced features
-        self.verbose_mode = False
+        self.set_verbose_mode(False)
         self.interactive_mode = False
 
+        # Windows Installer and PnP only handle one install at a time, so
+        # downloads and backups run concurrently but installs are serialized
+        self._install_lock = threading.Lock()
+
+        # The driver store is exported once per run, see _backup_current_driver
+        self._backup_lock = threading.Lock()
+        self._backup_attempted = False
+        self._backups_taken = False
+
+        # SHA-256 of each download cache entry stored by this process
+        self._download_digests = {}
+        self._download_digests_lock = threading.Lock()
+
+        # Restore point being created for the current batch, if any
+        self._restore_point_future = None
+        # Windows Update work runs on one COM thread, so a batch searches
+        # once and installs the IUpdate objects that search returned; see
+        # _install_via_windows_update
+        self._com_local = threading.local()
+        self._wu_executor = None
+        self._wu_executor_lock = threading.Lock()
+        self._wu_updates = None
+
     def set_verbose_mode(self, enabled):
         """Enable or disable verbose mode"""
         self.verbose_mode = enabled
 
+        # Verbose-only messages go through these, which are no-ops when off
+        if enabled:
+            self._vlog = self.logger.info
+            self._vlog_warning = self.logger.warning
+            self._vlog_error = self.logger.error
+        else:
+            self._vlog = self._vlog_warning = self._vlog_error = _noop
+
     def set_interactive_mode(self, enabled):
         """Enable or disable interactive mode"""
         self.interactive_mode = enabled
@@ -34,46 +188,111 @@ class DriverInstaller:
 
         success_count = 0
 
-        # Create system restore point before installation
         from utils.system_utils import SystemUtils
 
         system_utils = SystemUtils(self.logger)
-        restore_point_created = system_utils.create_restore_point(
-            "Driver Updater - Batch Installation"
-        )
 
-        if not restore_point_created:
-            self.logger.warning(
-                "Failed to create restore point, but continuing with installation"
+        # Check elevation once for the whole batch: installers started from a
+        # non-elevated process each raise their own UAC prompt or fail
+        if not system_utils.is_admin():
+            self.logger.error(
+                "Administrator privileges are required to install driver updates"
             )
+            return success_count
 
-        for i, update in enumerate(updates):
-            try:
+        self._start_windows_update_batch()
+
+        # Create system restore point in the background; it only has to exist
+        # before the first install, so downloads start right away
+        restore_executor = ThreadPoolExecutor(max_workers=1)
+        self._restore_point_future = restore_executor.submit(
+            system_utils.create_restore_point, "Driver Updater - Batch Installation"
+        )
+        restore_executor.shutdown(wait=False)
+
+        # Back up the current drivers once for the whole batch
+        if updates:
+            self._backup_current_driver({"device_name": "all devices"})
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {}
+            for i, update in enumerate(updates):
                 self.logger.info(
                     f"Installing update {i+1}/{len(updates)}: {update.get('device_name', 'Unknown')}"
                 )
+                futures[executor.submit(self._install_single_update, update)] = update
 
-                if self._install_single_update(update):
-                    success_count += 1
-                    self.logger.info(
-                        f"Successfully installed update for {update.get('device_name', 'Unknown')}"
-                    )
-                else:
+            for future in as_completed(futures):
+                update = futures[future]
+                try:
+                    if future.result():
+                        success_count += 1
+                        self.logger.info(
+                            f"Successfully installed update for {update.get('device_name', 'Unknown')}"
+                        )
+                    else:
+                        self.logger.error(
+                            f"Failed to install update for {update.get('device_name', 'Unknown')}"
+                        )
+
+                except Exception as e:
                     self.logger.error(
-                        f"Failed to install update for {update.get('device_name', 'Unknown')}"
+                        f"Error installing update for {update.get('device_name', 'Unknown')}: {str(e)}"
                     )
 
-            except Exception as e:
-                self.logger.error(
-                    f"Error installing update for {update.get('device_name', 'Unknown')}: {str(e)}"
-                )
-                continue
-
         self.logger.info(
             f"Installation completed. {success_count}/{len(updates)} updates installed successfully."
         )
         return success_count
 
+    def install_many(
+        self, updates: List[Dict[str, Any]], executor=None, on_progress=None
+    ) -> int:
+        """Install several updates interactively, overlapping their downloads"""
+        # Downloads run side by side; install_single_update_interactive
+        # still runs the installers themselves one at a time
+        self._start_windows_update_batch()
+
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=4)
+
+        success_count = 0
+        try:
+            futures = {
+                executor.submit(self.install_single_update_interactive, update): update
+                for update in updates
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                update = futures[future]
+                success = future.result()
+                if success:
+                    success_count += 1
+                if on_progress:
+                    on_progress(done, len(updates), update, success)
+        finally:
+            if own_executor:
+                executor.shutdown(wait=False)
+
+        return success_count
+
+    def _wait_for_restore_point(self):
+        """Wait for the batch's restore point before the first install"""
+        future = self._restore_point_future
+        if future is None:
+            return
+        self._restore_point_future = None
+
+        try:
+            restore_point_created = future.result(timeout=120)
+        except Exception:
+            restore_point_created = False
+
+        if not restore_point_created:
+            self.logger.warning(
+                "Failed to create restore point, but continuing with installation"
+            )
+
     def _install_single_update(self, update: Dict[str, Any]) -> bool:
         """Install a single driver update"""
         try:
@@ -86,7 +305,9 @@ class DriverInstaller:
 
             # Handle special cases
             if download_url == "windows_update":
-                return self._install_via_windows_update(update)
+                with self._install_lock:
+                    self._wait_for_restore_point()
+                    return self._install_via_windows_update(update)
             elif download_url == "generic_update":
                 self.logger.info(
                     f"Generic update for {device_name} - skipping automatic installation"
@@ -102,7 +323,9 @@ class DriverInstaller:
             self._backup_current_driver(update)
 
             # Install the driver
-            return self._install_driver_file(driver_file, update)
+            with self._install_lock:
+                self._wait_for_restore_point()
+                return self._install_driver_file(driver_file, update)
 
         except Exception as e:
             self.logger.error(f"Error in single update installation: {str(e)}")
@@ -114,56 +337,56 @@ class DriverInstaller:
             device_name = update.get("device_name", "Unknown")
             download_url = update.get("download_url")
 
-            if self.verbose_mode:
-                self.logger.info(
-                    f"🔄 Starting interactive installation for: {device_name}"
-                )
-                self.logger.info(f"  Download URL: {download_url}")
-                self.logger.info(
-                    f"  Current version: {update.get('current_version', 'Unknown')}"
-                )
-                self.logger.info(
-                    f"  New version: {update.get('new_version', 'Unknown')}"
-                )
+            self._vlog(
+                f"🔄 Starting interactive installation for: {device_name}"
+            )
+            self._vlog(f"  Download URL: {download_url}")
+            self._vlog(
+                f"  Current version: {update.get('current_version', 'Unknown')}"
+            )
+            self._vlog(
+                f"  New version: {update.get('new_version', 'Unknown')}"
+            )
 
             if not download_url:
-                if self.verbose_mode:
-                    self.logger.error(f"❌ No download URL for {device_name}")
+                self._vlog_error(f"❌ No download URL for {device_name}")
                 return False
 
             # Handle special cases
             if download_url == "windows_update":
-                if self.verbose_mode:
-                    self.logger.info(f"📥 Installing via Windows Update: {device_name}")
-                return self._install_via_windows_update_interactive(update)
+                self._vlog(f"📥 Installing via Windows Update: {device_name}")
+                with self._install_lock:
+                    return self._install_via_windows_update_interactive(update)
             elif download_url == "generic_update":
-                if self.verbose_mode:
-                    self.logger.info(
-                        f"⚠️ Generic update for {device_name} - manual installation recommended"
-                    )
+                self._vlog(
+                    f"⚠️ Generic update for {device_name} - manual installation recommended"
+                )
                 return False
 
             # Create backup of current driver
-            if self.verbose_mode:
-                self.logger.info(f"💾 Creating backup for: {device_name}")
+            self._vlog(f"💾 Creating backup for: {device_name}")
             backup_success = self._backup_current_driver(update)
 
-            if backup_success and self.verbose_mode:
-                self.logger.info(f"✅ Backup created successfully")
-            elif self.verbose_mode:
-                self.logger.warning(f"⚠️ Backup creation failed, continuing anyway")
+            if backup_success:
+                self._vlog(f"✅ Backup created successfully")
+            else:
+                self._vlog_warning(f"⚠️ Backup creation failed, continuing anyway")
+
+            # ZIP packages are extracted straight from the download stream
+            if download_url.lower().endswith(".zip"):
+                return self._install_zip_from_url_interactive(update)
 
             # Download the driver
-            if self.verbose_mode:
-                self.logger.info(f"📥 Downloading driver for: {device_name}")
+            self._vlog(f"📥 Downloading driver for: {device_name}")
             driver_file = self._download_driver_interactive(update)
             if not driver_file:
                 return False
 
-            # Install the driver
-            if self.verbose_mode:
-                self.logger.info(f"⚡ Installing driver for: {device_name}")
-            return self._install_driver_file_interactive(driver_file, update)
+            # Install the driver; callers may download several updates at
+            # once, but installers run one at a time
+            self._vlog(f"⚡ Installing driver for: {device_name}")
+            with self._install_lock:
+                return self._install_driver_file_interactive(driver_file, update)
 
         except Exception as e:
             if self.verbose_mode:
@@ -186,13 +409,22 @@ class DriverInstaller:
             filename = self._generate_driver_filename(update)
             download_path = os.path.join(self.temp_dir, filename)
 
+            update_checker = UpdateChecker(self.logger, self.session)
+
+            # Reuse a copy of the same download if this run stored it and it
+            # is unchanged; the file will be run elevated
+            cache_path = self._download_cache_path(update, filename)
+            if self._copy_from_download_cache(cache_path, download_path):
+                self.logger.info(f"Using cached download for {device_name}")
+                return download_path
+
             # Download using update checker
-            update_checker = UpdateChecker(self.logger)
             if update_checker.download_driver(update, download_path):
                 # Verify download
                 if update_checker.verify_download(
                     download_path, update.get("download_size")
                 ):
+                    self._store_in_download_cache(download_path, cache_path)
                     return download_path
                 else:
                     self.logger.error(f"Download verification failed for {device_name}")
@@ -205,14 +437,87 @@ class DriverInstaller:
             self.logger.error(f"Error downloading driver: {str(e)}")
             return None
 
+    def _download_cache_path(self, update: Dict[str, Any], filename: str) -> str:
+        """Get the download cache path for an update"""
+        key = hashlib.sha256(
+            f"{update.get('download_url')}|{update.get('download_size')}".encode()
+        ).hexdigest()
+        # Keep the extension, verify_download checks it
+        return os.path.join(DOWNLOAD_CACHE_DIR, key + os.path.splitext(filename)[1])
+
+    def _copy_hashed(self, src: str, dst: str) -> str:
+        """Copy src to dst and return the SHA-256 of the bytes copied"""
+        # A real copy, not a hardlink: the cache entry can be rewritten in
+        # place after the check, and a link would share those writes
+        digest = hashlib.sha256()
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            for chunk in iter(lambda: fsrc.read(1024 * 1024), b""):
+                digest.update(chunk)
+                fdst.write(chunk)
+        return digest.hexdigest()
+
+    def _copy_from_download_cache(self, cache_path: str, download_path: str) -> bool:
+        """Copy a cache entry stored by this process, if it is unchanged"""
+        with self._download_digests_lock:
+            expected = self._download_digests.get(cache_path)
+        if expected is None:
+            return False
+
+        try:
+            if self._copy_hashed(cache_path, download_path) == expected:
+                os.utime(cache_path)
+                return True
+            self.logger.warning(f"Cached download was modified, ignoring it: {cache_path}")
+        except OSError:
+            pass
+
+        with self._download_digests_lock:
+            self._download_digests.pop(cache_path, None)
+        try:
+            os.remove(download_path)
+        except OSError:
+            pass
+        return False
+
+    def _store_in_download_cache(self, download_path: str, cache_path: str):
+        """Add a verified download to the download cache"""
+        try:
+            os.makedirs(DOWNLOAD_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            digest = self._copy_hashed(download_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+            with self._download_digests_lock:
+                self._download_digests[cache_path] = digest
+            self._evict_download_cache()
+        except Exception as e:
+            self.logger.warning(f"Error caching download: {str(e)}")
+
+    def _evict_download_cache(self):
+        """Remove least recently used downloads beyond the cache size limit"""
+        entries = []
+        with os.scandir(DOWNLOAD_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= DOWNLOAD_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
     def _download_driver_interactive(self, update: Dict[str, Any]) -> Optional[str]:
         """Download driver file with interactive progress"""
         device_name = update.get("device_name", "Unknown")
         download_url = update.get("download_url")
 
-        if self.verbose_mode:
-            self.logger.info(f"📥 Starting download for {device_name}")
-            self.logger.info(f"  URL: {download_url}")
+        self._vlog(f"📥 Starting download for {device_name}")
+        self._vlog(f"  URL: {download_url}")
 
         try:
             response = self.session.get(download_url, stream=True, timeout=30)
@@ -224,26 +529,27 @@ class DriverInstaller:
                 self.logger.info(f"  File size: {total_size / (1024*1024):.1f} MB")
 
             # Generate filename
-            filename = self._generate_driver_filename(update, response)
+            filename = self._generate_driver_filename(update)
             file_path = os.path.join(self.temp_dir, filename)
 
             # Download with progress
             downloaded = 0
+            next_log = 0
             with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
 
                         if self.verbose_mode and total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            if downloaded % (1024 * 1024) == 0:  # Log every MB
+                            if downloaded >= next_log:  # Log every 10 MB
+                                progress = (downloaded / total_size) * 100
                                 self.logger.info(
                                     f"  Progress: {progress:.1f}% ({downloaded / (1024*1024):.1f} MB)"
                                 )
+                                next_log = downloaded + 10 * 1024 * 1024
 
-            if self.verbose_mode:
-                self.logger.info(f"✅ Download completed: {file_path}")
+            self._vlog(f"✅ Download completed: {file_path}")
 
             return file_path
 
@@ -280,9 +586,8 @@ class DriverInstaller:
         """Install driver file with interactive feedback"""
         device_name = update.get("device_name", "Unknown")
 
-        if self.verbose_mode:
-            self.logger.info(f"⚡ Installing driver file: {driver_file}")
-            self.logger.info(f"  Device: {device_name}")
+        self._vlog(f"⚡ Installing driver file: {driver_file}")
+        self._vlog(f"  Device: {device_name}")
 
         try:
             # Check file type and install accordingly
@@ -291,14 +596,13 @@ class DriverInstaller:
             if file_ext == ".exe":
                 return self._install_exe_driver_interactive(driver_file, update)
             elif file_ext == ".msi":
-                return self._install_msi_driver_interactive(driver_file, update)
+                return self._install_msi_driver(driver_file, update)
             elif file_ext in [".inf", ".cat", ".sys"]:
-                return self._install_inf_driver_interactive(driver_file, update)
+                return self._install_inf_driver(driver_file, update)
             elif file_ext == ".zip":
                 return self._install_zip_driver_interactive(driver_file, update)
             else:
-                if self.verbose_mode:
-                    self.logger.warning(f"⚠️ Unknown driver file type: {file_ext}")
+                self._vlog_warning(f"⚠️ Unknown driver file type: {file_ext}")
                 return False
 
         except Exception as e:
@@ -313,22 +617,23 @@ class DriverInstaller:
         try:
             device_name = update.get("device_name", "Unknown")
 
-            # Common silent installation parameters
-            silent_params = [
-                "/S",  # NSIS
-                "/SILENT",  # InstallShield
-                "/VERYSILENT",  # Inno Setup
-                "/q",  # MSI-based
-                "/s",  # Generic
-                "-s",  # Alternative
-                "--silent",  # Alternative
-                "/quiet",  # Alternative
-            ]
+            # Use the vendor's or framework's known arguments when we can tell,
+            # then only probe the most common flags
+            known_args = _detect_silent_args(
+                driver_file, update.get("manufacturer", "")
+            )
+            if known_args:
+                candidates = [known_args] + [
+                    [param] for param in ("/S", "/s") if [param] != known_args
+                ]
+            else:
+                candidates = [[param] for param in _SILENT_PARAMS]
 
             # Try different silent installation methods
-            for param in silent_params:
+            for args in candidates:
+                param = " ".join(args)
                 try:
-                    cmd = [driver_file, param]
+                    cmd = [driver_file, *args]
                     self.logger.info(f"Attempting installation with parameter: {param}")
 
                     result = subprocess.run(
@@ -339,15 +644,12 @@ class DriverInstaller:
                         creationflags=subprocess.CREATE_NO_WINDOW,
                     )
 
-                    if result.returncode == 0:
+                    if result.returncode in _SUCCESS_CODES:
                         self.logger.info(
                             f"Successfully installed {device_name} using {param}"
                         )
-                        return True
-                    elif result.returncode == 3010:  # Reboot required
-                        self.logger.info(
-                            f"Successfully installed {device_name}, reboot required"
-                        )
+                        if result.returncode != 0:
+                            self.logger.info(f"Reboot required for {device_name}")
                         return True
 
                 except subprocess.TimeoutExpired:
@@ -369,46 +671,84 @@ class DriverInstaller:
             self.logger.error(f"Error installing EXE driver: {str(e)}")
             return False
 
+    def _run_streaming(
+        self, cmd: List[str], timeout: int, **kwargs
+    ) -> subprocess.CompletedProcess:
+        """Run an installer, logging its output as it is produced"""
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            **kwargs,
+        )
+
+        # Reading the pipe blocks until the process closes it, so enforce
+        # the timeout by killing the process from a timer
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            # Keep only the tail for error messages instead of the whole log
+            tail = deque(maxlen=50)
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    self.logger.debug(line)
+                    tail.append(line)
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            # Reading or decoding the output failed: don't leave the
+            # installer running behind us
+            if process.returncode is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return subprocess.CompletedProcess(cmd, returncode, "\n".join(tail), "")
+
     def _install_exe_driver_interactive(
         self, driver_file: str, update: Dict[str, Any]
     ) -> bool:
         """Install EXE driver with interactive monitoring"""
         device_name = update.get("device_name", "Unknown")
 
-        if self.verbose_mode:
-            self.logger.info(f"🔧 Installing EXE driver for: {device_name}")
+        self._vlog(f"🔧 Installing EXE driver for: {device_name}")
 
         try:
             # Run installer with silent mode
             cmd = [driver_file, "/S", "/silent", "/quiet", "/norestart"]
 
-            if self.verbose_mode:
-                self.logger.info(f"  Command: {' '.join(cmd)}")
+            self._vlog(f"  Command: {' '.join(cmd)}")
 
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=300  # 5 minutes timeout
-            )
+            result = self._run_streaming(cmd, timeout=300)  # 5 minutes timeout
 
-            if result.returncode == 0:
-                if self.verbose_mode:
-                    self.logger.info(f"✅ EXE installation completed successfully")
+            if result.returncode in _SUCCESS_CODES:
+                self._vlog(f"✅ EXE installation completed successfully")
                 return True
             else:
-                if self.verbose_mode:
-                    self.logger.error(
-                        f"❌ EXE installation failed with code {result.returncode}"
-                    )
-                    if result.stderr:
-                        self.logger.error(f"  Error output: {result.stderr}")
+                self._vlog_error(
+                    f"❌ EXE installation failed with code {result.returncode}"
+                )
+                if result.stdout:
+                    self._vlog_error(f"  Output: {result.stdout}")
                 return False
 
         except subprocess.TimeoutExpired:
-            if self.verbose_mode:
-                self.logger.error(f"❌ EXE installation timed out after 5 minutes")
+            self._vlog_error(f"❌ EXE installation timed out after 5 minutes")
             return False
         except Exception as e:
-            if self.verbose_mode:
-                self.logger.error(f"❌ EXE installation error: {str(e)}")
+            self._vlog_error(f"❌ EXE installation error: {str(e)}")
             return False
 
     def _install_msi_driver(self, driver_file: str, update: Dict[str, Any]) -> bool:
@@ -416,29 +756,23 @@ class DriverInstaller:
         try:
             device_name = update.get("device_name", "Unknown")
 
-            cmd = ["msiexec", "/i", driver_file, "/quiet", "/norestart"]
+            cmd = [*_MSI_BASE_CMD, driver_file, "/quiet", "/norestart"]
 
             self.logger.info(f"Installing MSI driver for {device_name}")
+            self._vlog(f"  Command: {' '.join(cmd)}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+            result = self._run_streaming(
+                cmd, timeout=300, creationflags=subprocess.CREATE_NO_WINDOW
             )
 
-            if result.returncode == 0:
+            if result.returncode in _SUCCESS_CODES:
                 self.logger.info(f"Successfully installed MSI driver for {device_name}")
-                return True
-            elif result.returncode == 3010:  # Reboot required
-                self.logger.info(
-                    f"Successfully installed MSI driver for {device_name}, reboot required"
-                )
+                if result.returncode != 0:
+                    self.logger.info(f"Reboot required for {device_name}")
                 return True
             else:
                 self.logger.error(
-                    f"MSI installation failed for {device_name}: {result.stderr}"
+                    f"MSI installation failed for {device_name}: {result.stdout}"
                 )
                 return False
 
@@ -446,71 +780,26 @@ class DriverInstaller:
             self.logger.error(f"Error installing MSI driver: {str(e)}")
             return False
 
-    def _install_msi_driver_interactive(
-        self, driver_file: str, update: Dict[str, Any]
-    ) -> bool:
-        """Install MSI driver with interactive monitoring"""
-        device_name = update.get("device_name", "Unknown")
-
-        if self.verbose_mode:
-            self.logger.info(f"🔧 Installing MSI driver for: {device_name}")
-
-        try:
-            # Run installer with silent mode
-            cmd = ["msiexec", "/i", driver_file, "/quiet", "/norestart"]
-
-            if self.verbose_mode:
-                self.logger.info(f"  Command: {' '.join(cmd)}")
-
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=300  # 5 minutes timeout
-            )
-
-            if result.returncode == 0:
-                if self.verbose_mode:
-                    self.logger.info(f"✅ MSI installation completed successfully")
-                return True
-            else:
-                if self.verbose_mode:
-                    self.logger.error(
-                        f"❌ MSI installation failed with code {result.returncode}"
-                    )
-                    if result.stderr:
-                        self.logger.error(f"  Error output: {result.stderr}")
-                return False
-
-        except subprocess.TimeoutExpired:
-            if self.verbose_mode:
-                self.logger.error(f"❌ MSI installation timed out after 5 minutes")
-            return False
-        except Exception as e:
-            if self.verbose_mode:
-                self.logger.error(f"❌ MSI installation error: {str(e)}")
-            return False
-
     def _install_inf_driver(self, driver_file: str, update: Dict[str, Any]) -> bool:
         """Install INF driver package"""
         try:
             device_name = update.get("device_name", "Unknown")
 
-            cmd = ["pnputil", "/add-driver", driver_file, "/install"]
+            cmd = [*_PNPUTIL_ADD_DRIVER, driver_file, "/install"]
 
             self.logger.info(f"Installing INF driver for {device_name}")
+            self._vlog(f"  Command: {' '.join(cmd)}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+            result = self._run_streaming(
+                cmd, timeout=300, creationflags=subprocess.CREATE_NO_WINDOW
             )
 
-            if result.returncode == 0:
+            if result.returncode in _SUCCESS_CODES:
                 self.logger.info(f"Successfully installed INF driver for {device_name}")
                 return True
             else:
                 self.logger.error(
-                    f"INF installation failed for {device_name}: {result.stderr}"
+                    f"INF installation failed for {device_name}: {result.stdout}"
                 )
                 return False
 
@@ -518,80 +807,107 @@ class DriverInstaller:
             self.logger.error(f"Error installing INF driver: {str(e)}")
             return False
 
-    def _install_inf_driver_interactive(
-        self, driver_file: str, update: Dict[str, Any]
-    ) -> bool:
-        """Install INF driver with interactive monitoring"""
+    def _install_zip_from_url_interactive(self, update: Dict[str, Any]) -> bool:
+        """Stream a ZIP driver package from its URL and install it"""
         device_name = update.get("device_name", "Unknown")
+        download_url = update.get("download_url")
 
-        if self.verbose_mode:
-            self.logger.info(f"🔧 Installing INF driver for: {device_name}")
+        self._vlog(f"📥 Streaming ZIP package for {device_name}")
+        self._vlog(f"  URL: {download_url}")
 
         try:
-            # Run installer with silent mode
-            cmd = ["pnputil", "/add-driver", driver_file, "/install"]
-
-            if self.verbose_mode:
-                self.logger.info(f"  Command: {' '.join(cmd)}")
-
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=300  # 5 minutes timeout
-            )
+            response = self.session.get(download_url, stream=True, timeout=30)
+            response.raise_for_status()
+            response.raw.decode_content = True
 
-            if result.returncode == 0:
-                if self.verbose_mode:
-                    self.logger.info(f"✅ INF installation completed successfully")
-                return True
-            else:
-                if self.verbose_mode:
-                    self.logger.error(
-                        f"❌ INF installation failed with code {result.returncode}"
-                    )
-                    if result.stderr:
-                        self.logger.error(f"  Error output: {result.stderr}")
-                return False
+            # Zip needs a seekable file; an unnamed temp file is deleted on
+            # close (SpooledTemporaryFile is not seekable before Python 3.11)
+            with tempfile.TemporaryFile(dir=self.temp_dir) as archive:
+                shutil.copyfileobj(response.raw, archive, 1024 * 1024)
+                archive.seek(0)
+                with self._install_lock:
+                    return self._install_zip_driver_interactive(archive, update)
 
-        except subprocess.TimeoutExpired:
-            if self.verbose_mode:
-                self.logger.error(f"❌ INF installation timed out after 5 minutes")
-            return False
         except Exception as e:
             if self.verbose_mode:
-                self.logger.error(f"❌ INF installation error: {str(e)}")
+                self.logger.error(f"❌ Download failed for {device_name}: {str(e)}")
+            else:
+                self.logger.error(f"Download failed: {str(e)}")
             return False
 
     def _install_zip_driver_interactive(
-        self, driver_file: str, update: Dict[str, Any]
+        self, driver_file, update: Dict[str, Any]
     ) -> bool:
         """Install ZIP driver package with interactive prompts"""
         device_name = update.get("device_name", "Unknown")
 
-        if self.verbose_mode:
-            self.logger.info(f"📦 Installing ZIP driver for: {device_name}")
+        self._vlog(f"📦 Installing ZIP driver for: {device_name}")
 
         try:
             # Create temporary directory for extraction
             with tempfile.TemporaryDirectory() as extract_dir:
                 self.logger.info(f"  Extracting ZIP file to: {extract_dir}")
 
-                # Extract ZIP file
-                shutil.unpack_archive(driver_file, extract_dir)
+                # Extract ZIP file (a path or an open file)
+                with zipfile.ZipFile(driver_file) as archive:
+                    archive.extractall(extract_dir)
 
-                # Find and install all drivers in the extracted folder
-                for root, _, files in os.walk(extract_dir):
-                    for file in files:
-                        if file.endswith((".inf", ".sys", ".cat")):
-                            file_path = os.path.join(root, file)
-                            self.logger.info(f"  Installing driver file: {file_path}")
-                            self._install_inf_driver_interactive(file_path, update)
+                # Find all drivers in the extracted folder
+                driver_files = list(_iter_driver_files(extract_dir))
+                has_inf = any(path.endswith(".inf") for path in driver_files)
 
-            if self.verbose_mode:
-                self.logger.info(f"✅ ZIP driver installation completed")
-            return True
+                if has_inf:
+                    # One pnputil run adds every INF in the tree
+                    success = self._install_inf_tree_interactive(extract_dir)
+                else:
+                    for file_path in driver_files:
+                        self.logger.info(f"  Installing driver file: {file_path}")
+                        self._install_inf_driver(file_path, update)
+                    success = True
+
+            if success:
+                self._vlog(f"✅ ZIP driver installation completed")
+            return success
 
         except Exception as e:
-            if self.verbose_mode:
-                self.logger.error(f"❌ ZIP driver installation error: {str(e)}")
+            self._vlog_error(f"❌ ZIP driver installation error: {str(e)}")
+            return False
+
+    def _install_inf_tree_interactive(self, folder: str) -> bool:
+        """Add and install every INF under a folder with a single pnputil call"""
+        cmd = [
+            *_PNPUTIL_ADD_DRIVER,
+            os.path.join(folder, "*.inf"),
+            "/subdirs",
+            "/install",
+        ]
+
+        self._vlog(f"  Command: {' '.join(cmd)}")
+
+        try:
+            result = self._run_streaming(
+                cmd, timeout=300, creationflags=subprocess.CREATE_NO_WINDOW
+            )  # 5 minutes timeout
+
+            added = re.search(r"Added driver packages:\s*(\d+)", result.stdout)
+            if added:
+                self.logger.info(f"  Added {added.group(1)} driver package(s)")
+
+            if result.returncode in _SUCCESS_CODES:
+                return True
+
+            self._vlog_error(
+                f"❌ INF installation failed with code {result.returncode}"
+            )
+            if result.stdout:
+                self._vlog_error(f"  Output: {result.stdout}")
+            return False
+
+        except subprocess.TimeoutExpired:
+            self._vlog_error(f"❌ INF installation timed out after 5 minutes")
+            return False
+        except Exception as e:
+            self._vlog_error(f"❌ INF installation error: {str(e)}")
             return False
 
     def _install_interactive(self, driver_file: str, update: Dict[str, Any]) -> bool:
@@ -609,7 +925,7 @@ class DriverInstaller:
             )
 
             # Assume success if installer exits normally
-            if result.returncode == 0 or result.returncode == 3010:
+            if result.returncode in _SUCCESS_CODES:
                 self.logger.info(
                     f"Interactive installation completed for {device_name}"
                 )
@@ -625,50 +941,96 @@ class DriverInstaller:
             self.logger.error(f"Error in interactive installation: {str(e)}")
             return False
 
+    def _get_update_session(self):
+        """Get the Windows Update COM session for the calling thread"""
+        # COM objects belong to the thread that created them, so each worker
+        # keeps its own session for the rest of the run
+        session = getattr(self._com_local, "update_session", None)
+        if session is None:
+            import pythoncom
+            import win32com.client
+
+            pythoncom.CoInitialize()
+            session = win32com.client.Dispatch("Microsoft.Update.Session")
+            self._com_local.update_session = session
+        return session
+
+    def _start_windows_update_batch(self):
+        """Make the next Windows Update install search again"""
+        # Updates found for an earlier batch may be installed by now. The
+        # IUpdate objects are released on the thread that owns them; the
+        # single worker runs this before any of the batch's installs
+        with self._wu_executor_lock:
+            executor = self._wu_executor
+        if executor is not None:
+            executor.submit(setattr, self, "_wu_updates", None)
+
+    def _search_windows_update_drivers(self) -> List[Tuple[str, Any]]:
+        """Search Windows Update for pending driver updates"""
+        # The search contacts the update servers and can take a minute, so
+        # it runs once per batch and every device is matched against the
+        # result. Only called on the Windows Update thread, which owns the
+        # IUpdate objects
+        if self._wu_updates is None:
+            searcher = self._get_update_session().CreateUpdateSearcher()
+            search_result = searcher.Search("IsInstalled=0 and Type='Driver'")
+
+            self._wu_updates = [
+                (wu_update.Title.lower(), wu_update)
+                for wu_update in search_result.Updates
+            ]
+        return self._wu_updates
+
     def _install_via_windows_update(self, update: Dict[str, Any]) -> bool:
         """Install driver via Windows Update"""
+        # COM objects belong to the thread that created them, so all Windows
+        # Update calls go through a single dedicated thread
+        with self._wu_executor_lock:
+            if self._wu_executor is None:
+                self._wu_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="windows-update"
+                )
+            executor = self._wu_executor
+        return executor.submit(self._install_via_windows_update_on_thread, update).result()
+
+    def _install_via_windows_update_on_thread(self, update: Dict[str, Any]) -> bool:
+        """Install driver via Windows Update, on the Windows Update thread"""
         try:
+            import win32com.client
+
             device_name = update.get("device_name", "Unknown")
 
             self.logger.info(f"Installing {device_name} via Windows Update")
 
-            # Use PowerShell to trigger Windows Update for specific device
-            powershell_script = f"""
-            $Session = New-Object -ComObject Microsoft.Update.Session
-            $Searcher = $Session.CreateUpdateSearcher()
-            $SearchResult = $Searcher.Search("IsInstalled=0 and Type='Driver'")
-            
-            foreach ($Update in $SearchResult.Updates) {{
-                if ($Update.Title -like "*{device_name}*") {{
-                    $UpdatesToDownload = New-Object -ComObject Microsoft.Update.UpdateColl
-                    $UpdatesToDownload.Add($Update)
-                    
-                    $Downloader = $Session.CreateUpdateDownloader()
-                    $Downloader.Updates = $UpdatesToDownload
-                    $Downloader.Download()
-                    
-                    $UpdatesToInstall = New-Object -ComObject Microsoft.Update.UpdateColl
-                    $UpdatesToInstall.Add($Update)
-                    
-                    $Installer = $Session.CreateUpdateInstaller()
-                    $Installer.Updates = $UpdatesToInstall
-                    $InstallationResult = $Installer.Install()
-                    
-                    exit $InstallationResult.ResultCode
-                }}
-            }}
-            exit 1
-            """
-
-            result = subprocess.run(
-                ["powershell", "-Command", powershell_script],
-                capture_output=True,
-                text=True,
-                timeout=300,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+            name = device_name.lower()
+            match = next(
+                (
+                    wu_update
+                    for title, wu_update in self._search_windows_update_drivers()
+                    if name in title
+                ),
+                None,
             )
+            if match is None:
+                self.logger.error(
+                    f"Windows Update installation failed for {device_name}"
+                )
+                return False
+
+            # Download and install only the matched update
+            session = self._get_update_session()
+            updates_to_install = win32com.client.Dispatch("Microsoft.Update.UpdateColl")
+            updates_to_install.Add(match)
+
+            downloader = session.CreateUpdateDownloader()
+            downloader.Updates = updates_to_install
+            downloader.Download()
 
-            if result.returncode == 2:  # orcSucceeded
+            installer = session.CreateUpdateInstaller()
+            installer.Updates = updates_to_install
+            installation_result = installer.Install()
+
+            if installation_result.ResultCode == 2:  # orcSucceeded
                 self.logger.info(
                     f"Successfully installed {device_name} via Windows Update"
                 )
@@ -687,102 +1049,67 @@ class DriverInstaller:
         """Install via Windows Update with interactive feedback"""
         device_name = update.get("device_name", "Unknown")
 
-        if self.verbose_mode:
-            self.logger.info(f"🪟 Installing via Windows Update: {device_name}")
-
-        try:
-            # Use PowerShell to trigger Windows Update
-            ps_script = f"""
-            Get-WindowsUpdate -AcceptAll -Install -IgnoreReboot | Where-Object {{$_.Title -like "*{device_name}*"}}
-            """
-
-            cmd = ["powershell", "-Command", ps_script]
+        self._vlog(f"🪟 Installing via Windows Update: {device_name}")
+        self._vlog(f"  Executing Windows Update search...")
 
-            if self.verbose_mode:
-                self.logger.info(f"  Executing Windows Update search...")
-
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=600  # 10 minutes timeout
-            )
-
-            if result.returncode == 0:
-                if self.verbose_mode:
-                    self.logger.info(f"✅ Windows Update installation completed")
-                return True
-            else:
-                if self.verbose_mode:
-                    self.logger.info(f"ℹ️ No Windows Update available for this device")
-                return False
-
-        except Exception as e:
-            if self.verbose_mode:
-                self.logger.error(f"❌ Windows Update installation error: {str(e)}")
+        if self._install_via_windows_update(update):
+            self._vlog(f"✅ Windows Update installation completed")
+            return True
+        else:
+            self._vlog(f"ℹ️ No Windows Update available for this device")
             return False
 
-    def _backup_current_driver(self, update: Dict[str, Any]):
+    def _backup_current_driver(self, update: Dict[str, Any]) -> bool:
         """Create backup of current driver"""
-        try:
-            device_name = update.get("device_name", "Unknown")
+        # "pnputil /export-driver *" exports the whole driver store, so a
+        # single export per run backs up every device. A failed export is not
+        # retried for each following device either.
+        with self._backup_lock:
+            if self._backup_attempted:
+                return self._backups_taken
+            self._backup_attempted = True
 
-            # Create device-specific backup directory
-            device_backup_dir = os.path.join(
-                self.backup_dir, self._sanitize_filename(device_name)
-            )
-            os.makedirs(device_backup_dir, exist_ok=True)
+            try:
+                device_name = update.get("device_name", "Unknown")
 
-            # Export current driver using pnputil
-            cmd = ["pnputil", "/export-driver", "*", device_backup_dir]
+                # Export current drivers using pnputil
+                cmd = ["pnputil", "/export-driver", "*", self.backup_dir]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=60,
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                )
 
-            if result.returncode == 0:
-                self.logger.info(f"Created driver backup for {device_name}")
-            else:
-                self.logger.warning(f"Failed to create driver backup for {device_name}")
+                if result.returncode == 0:
+                    self._backups_taken = True
+                    self.logger.info(f"Created driver backup for {device_name}")
+                else:
+                    self.logger.warning(
+                        f"Failed to create driver backup for {device_name}"
+                    )
 
-        except Exception as e:
-            self.logger.warning(f"Error creating driver backup: {str(e)}")
+            except Exception as e:
+                self.logger.warning(f"Error creating driver backup: {str(e)}")
+
+            return self._backups_taken
 
     def _generate_driver_filename(self, update: Dict[str, Any]) -> str:
         """Generate appropriate filename for driver download"""
-        device_name = update.get("device_name", "Unknown")
-        manufacturer = update.get("manufacturer", "Unknown")
-        version = update.get("new_version", "1.0.0.0")
-
-        # Sanitize filename
-        safe_device_name = self._sanitize_filename(device_name)
-        safe_manufacturer = self._sanitize_filename(manufacturer)
-
-        # Determine file extension based on manufacturer
-        if "nvidia" in manufacturer.lower():
-            ext = ".exe"
-        elif "amd" in manufacturer.lower():
-            ext = ".exe"
-        elif "intel" in manufacturer.lower():
-            ext = ".exe"
-        else:
-            ext = ".exe"
-
-        return f"{safe_manufacturer}_{safe_device_name}_{version}{ext}"
+        return _gen_filename(
+            update.get("device_name", "Unknown"),
+            update.get("manufacturer", "Unknown"),
+            update.get("new_version", "1.0.0.0"),
+        )
 
-    def _sanitize_filename(self, filename: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _sanitize_filename(filename: str) -> str:
         """Sanitize filename for Windows filesystem"""
-        # Remove invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-
-        # Limit length
-        if len(filename) > 50:
-            filename = filename[:50]
-
-        return filename.strip()
+        # Replace invalid characters in one pass, then limit length
+        return filename.translate(_SANITIZE_TABLE)[:50].strip()
 
     def rollback_driver(self, device_name: str) -> bool:
         """Rollback driver to previous version"""
@@ -813,6 +1140,8 @@ class DriverInstaller:
 
     def cleanup(self):
         """Clean up temporary files"""
+        if self._wu_executor is not None:
+            self._wu_executor.shutdown(wait=False)
         try:
             if os.path.exists(self.temp_dir):
                 shutil.rmtree(self.temp_dir)
@@ -820,6 +1149,8 @@ class DriverInstaller:
         except Exception as e:
             self.logger.warning(f"Error cleaning up temporary files: {str(e)}")
 
-    def __del__(self):
-        """Destructor to ensure cleanup"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.cleanup()
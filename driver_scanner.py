@@ -1,45 +1,536 @@
+import ctypes
 import json
+import os
 import re
 import subprocess
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import wintypes
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
 
+import pythoncom
 import win32api
 import win32con
-import wmi
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SYSTEM_ROOT = os.environ.get("SystemRoot", "C:\\Windows")
+DRIVERS_DIR = os.path.join(SYSTEM_ROOT, "System32", "drivers")
+
+# Only the columns the scan reads, so WMI does not marshal every property
+PNP_ENTITY_QUERY = (
+    "SELECT Name, DeviceID, Status, Manufacturer, HardwareID, CompatibleID, "
+    "ClassGuid, Service FROM Win32_PnPEntity"
+)
+PNP_SIGNED_DRIVER_QUERY = (
+    "SELECT DeviceID, DeviceName, DriverName, Location, DriverVersion, "
+    "DriverDate, DriverProviderName, IsSigned FROM Win32_PnPSignedDriver"
+)
+SYSTEM_DRIVER_QUERY = "SELECT Name, PathName, State FROM Win32_SystemDriver"
+# Single-device form of PNP_SIGNED_DRIVER_QUERY, filtered by WMI itself
+PNP_SIGNED_DRIVER_BY_ID_QUERY = PNP_SIGNED_DRIVER_QUERY + " WHERE DeviceID = '{}'"
+
+# WinVerifyTrust, called directly instead of through Get-AuthenticodeSignature
+WINTRUST_ACTION_GENERIC_VERIFY_V2 = "00AAC56B-CD44-11D0-8CC2-00C04FC295EE"
+DRIVER_ACTION_VERIFY = "F750E6C3-38EE-11D1-85E5-00C04FC295EE"
+WTD_UI_NONE = 2
+WTD_REVOKE_NONE = 0
+WTD_CHOICE_FILE = 1
+WTD_CHOICE_CATALOG = 2
+WTD_STATEACTION_VERIFY = 1
+WTD_STATEACTION_CLOSE = 2
+TRUST_E_NOSIGNATURE = ctypes.c_int32(0x800B0100).value
+GENERIC_READ = 0x80000000
+FILE_SHARE_READ = 1
+OPEN_EXISTING = 3
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", wintypes.DWORD),
+        ("Data2", wintypes.WORD),
+        ("Data3", wintypes.WORD),
+        ("Data4", wintypes.BYTE * 8),
+    ]
+
+    @classmethod
+    def from_string(cls, value):
+        u = uuid.UUID(value)
+        data4 = (wintypes.BYTE * 8)(*u.bytes[8:])
+        return cls(u.time_low, u.time_mid, u.time_hi_version, data4)
+
+
+class WINTRUST_FILE_INFO(ctypes.Structure):
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("pcwszFilePath", wintypes.LPCWSTR),
+        ("hFile", wintypes.HANDLE),
+        ("pgKnownSubject", ctypes.c_void_p),
+    ]
+
+
+class WINTRUST_CATALOG_INFO(ctypes.Structure):
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("dwCatalogVersion", wintypes.DWORD),
+        ("pcwszCatalogFilePath", wintypes.LPCWSTR),
+        ("pcwszMemberTag", wintypes.LPCWSTR),
+        ("pcwszMemberFilePath", wintypes.LPCWSTR),
+        ("hMemberFile", wintypes.HANDLE),
+        ("pbCalculatedFileHash", ctypes.POINTER(wintypes.BYTE)),
+        ("cbCalculatedFileHash", wintypes.DWORD),
+        ("pcCatalogContext", ctypes.c_void_p),
+        ("hCatAdmin", wintypes.HANDLE),
+    ]
+
+
+class WINTRUST_DATA(ctypes.Structure):
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("pPolicyCallbackData", ctypes.c_void_p),
+        ("pSIPClientData", ctypes.c_void_p),
+        ("dwUIChoice", wintypes.DWORD),
+        ("fdwRevocationChecks", wintypes.DWORD),
+        ("dwUnionChoice", wintypes.DWORD),
+        ("pInfo", ctypes.c_void_p),
+        ("dwStateAction", wintypes.DWORD),
+        ("hWVTStateData", wintypes.HANDLE),
+        ("pwszURLReference", wintypes.LPCWSTR),
+        ("dwProvFlags", wintypes.DWORD),
+        ("dwUIContext", wintypes.DWORD),
+        ("pSignatureSettings", ctypes.c_void_p),
+    ]
+
+
+class CATALOG_INFO(ctypes.Structure):
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("wszCatalogFile", wintypes.WCHAR * wintypes.MAX_PATH),
+    ]
+
+
+def _win_verify_trust(action: str, union_choice: int, info) -> int:
+    """Run WinVerifyTrust on a file or catalog member and release its state"""
+    wintrust = ctypes.windll.wintrust
+    action_id = GUID.from_string(action)
+
+    data = WINTRUST_DATA()
+    data.cbStruct = ctypes.sizeof(data)
+    data.dwUIChoice = WTD_UI_NONE
+    data.fdwRevocationChecks = WTD_REVOKE_NONE
+    data.dwUnionChoice = union_choice
+    data.pInfo = ctypes.cast(ctypes.pointer(info), ctypes.c_void_p)
+    data.dwStateAction = WTD_STATEACTION_VERIFY
+
+    result = wintrust.WinVerifyTrust(None, ctypes.byref(action_id), ctypes.byref(data))
+
+    data.dwStateAction = WTD_STATEACTION_CLOSE
+    wintrust.WinVerifyTrust(None, ctypes.byref(action_id), ctypes.byref(data))
+    return result
+
+
+def _verify_catalog_signature(file_path: str) -> Optional[bool]:
+    """Check whether a file is signed through a system catalog"""
+    wintrust = ctypes.windll.wintrust
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    wintrust.CryptCATAdminEnumCatalogFromHash.restype = wintypes.HANDLE
+
+    cat_admin = wintypes.HANDLE()
+    action_id = GUID.from_string(DRIVER_ACTION_VERIFY)
+    if not wintrust.CryptCATAdminAcquireContext2(
+        ctypes.byref(cat_admin), ctypes.byref(action_id), "SHA256", None, 0
+    ):
+        return None
+
+    try:
+        handle = kernel32.CreateFileW(
+            file_path, GENERIC_READ, FILE_SHARE_READ, None, OPEN_EXISTING, 0, None
+        )
+        if handle in (None, INVALID_HANDLE_VALUE):
+            return None
+
+        try:
+            handle = wintypes.HANDLE(handle)
+            hash_size = wintypes.DWORD(0)
+            wintrust.CryptCATAdminCalcHashFromFileHandle2(
+                cat_admin, handle, ctypes.byref(hash_size), None, 0
+            )
+            file_hash = (wintypes.BYTE * hash_size.value)()
+            if not wintrust.CryptCATAdminCalcHashFromFileHandle2(
+                cat_admin, handle, ctypes.byref(hash_size), file_hash, 0
+            ):
+                return None
+        finally:
+            kernel32.CloseHandle(handle)
+
+        cat_context = wintrust.CryptCATAdminEnumCatalogFromHash(
+            cat_admin, file_hash, hash_size, 0, None
+        )
+        if not cat_context:
+            # Not listed in any catalog either, so the file is unsigned
+            return False
+
+        cat_context = wintypes.HANDLE(cat_context)
+        try:
+            cat_info = CATALOG_INFO()
+            cat_info.cbStruct = ctypes.sizeof(cat_info)
+            if not wintrust.CryptCATCatalogInfoFromContext(
+                cat_context, ctypes.byref(cat_info), 0
+            ):
+                return None
+
+            info = WINTRUST_CATALOG_INFO()
+            info.cbStruct = ctypes.sizeof(info)
+            info.pcwszCatalogFilePath = cat_info.wszCatalogFile
+            info.pcwszMemberTag = bytes(file_hash).hex().upper()
+            info.pcwszMemberFilePath = file_path
+            info.pbCalculatedFileHash = ctypes.cast(
+                file_hash, ctypes.POINTER(wintypes.BYTE)
+            )
+            info.cbCalculatedFileHash = hash_size
+            info.hCatAdmin = cat_admin
+
+            result = _win_verify_trust(DRIVER_ACTION_VERIFY, WTD_CHOICE_CATALOG, info)
+            return result == 0
+        finally:
+            wintrust.CryptCATAdminReleaseCatalogContext(cat_admin, cat_context, 0)
+    finally:
+        wintrust.CryptCATAdminReleaseContext(cat_admin, 0)
+
+
+def _verify_signature(file_path: str) -> Optional[bool]:
+    """Check a file's Authenticode signature, embedded or catalog-based"""
+    info = WINTRUST_FILE_INFO()
+    info.cbStruct = ctypes.sizeof(info)
+    info.pcwszFilePath = file_path
+
+    result = _win_verify_trust(
+        WINTRUST_ACTION_GENERIC_VERIFY_V2, WTD_CHOICE_FILE, info
+    )
+    if result == TRUST_E_NOSIGNATURE:
+        # Inbox drivers are usually signed through a catalog, not embedded
+        return _verify_catalog_signature(file_path)
+    return result == 0
+
+
+@lru_cache(maxsize=1)
+def _dos_device_prefixes() -> Dict[str, str]:
+    """Map NT device names such as \\Device\\HarddiskVolume3 to drive letters"""
+    prefixes = {}
+    buffer = ctypes.create_unicode_buffer(1024)
+    for drive in win32api.GetLogicalDriveStrings().split("\0"):
+        drive = drive.rstrip("\\")
+        if drive and ctypes.windll.kernel32.QueryDosDeviceW(
+            drive, buffer, len(buffer)
+        ):
+            prefixes[buffer.value] = drive
+    return prefixes
+
+
+def _get_string_file_version(file_path: str) -> str:
+    """Read FileVersion from a file's version string table via version.dll"""
+    version_dll = ctypes.windll.version
+    size = version_dll.GetFileVersionInfoSizeW(file_path, None)
+    if not size:
+        return "Unknown"
+
+    data = ctypes.create_string_buffer(size)
+    if not version_dll.GetFileVersionInfoW(file_path, 0, size, data):
+        return "Unknown"
+
+    value = ctypes.c_void_p()
+    length = wintypes.UINT()
+    if not version_dll.VerQueryValueW(
+        data, "\\VarFileInfo\\Translation", ctypes.byref(value), ctypes.byref(length)
+    ) or length.value < 4:
+        return "Unknown"
+
+    language, codepage = ctypes.cast(value, ctypes.POINTER(wintypes.WORD * 2)).contents
+    key = f"\\StringFileInfo\\{language:04x}{codepage:04x}\\FileVersion"
+    if not version_dll.VerQueryValueW(
+        data, key, ctypes.byref(value), ctypes.byref(length)
+    ) or not length.value:
+        return "Unknown"
+
+    return ctypes.wstring_at(value, length.value).rstrip("\0").strip() or "Unknown"
+
+
+# SetupAPI device enumeration, used instead of the Win32_PnPEntity query
+DIGCF_PRESENT = 0x2
+DIGCF_ALLCLASSES = 0x4
+SPDRP_DEVICEDESC = 0x0
+SPDRP_HARDWAREID = 0x1
+SPDRP_COMPATIBLEIDS = 0x2
+SPDRP_SERVICE = 0x4
+SPDRP_CLASSGUID = 0x8
+SPDRP_MFG = 0xB
+SPDRP_FRIENDLYNAME = 0xC
+REG_MULTI_SZ = 7
+ERROR_NO_MORE_ITEMS = 259
+
+
+class SP_DEVINFO_DATA(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("ClassGuid", GUID),
+        ("DevInst", wintypes.DWORD),
+        ("Reserved", ctypes.c_void_p),
+    ]
+
+
+def _get_device_property(setupapi, dev_info, devinfo_data, prop):
+    """Read a SetupAPI registry property as a string or list of strings"""
+    reg_type = wintypes.DWORD()
+    required = wintypes.DWORD()
+    setupapi.SetupDiGetDeviceRegistryPropertyW(
+        dev_info, ctypes.byref(devinfo_data), prop, None, None, 0,
+        ctypes.byref(required),
+    )
+    if not required.value:
+        return None
+
+    buffer = ctypes.create_unicode_buffer(required.value // 2 + 1)
+    if not setupapi.SetupDiGetDeviceRegistryPropertyW(
+        dev_info, ctypes.byref(devinfo_data), prop, ctypes.byref(reg_type),
+        buffer, ctypes.sizeof(buffer), None,
+    ):
+        return None
+
+    if reg_type.value == REG_MULTI_SZ:
+        return [item for item in buffer[: required.value // 2].split("\0") if item]
+    return buffer.value
+
+
+def _enumerate_present_devices() -> List[SimpleNamespace]:
+    """List present devices with the same fields as Win32_PnPEntity"""
+    setupapi = ctypes.windll.setupapi
+    cfgmgr32 = ctypes.windll.cfgmgr32
+    setupapi.SetupDiGetClassDevsW.restype = wintypes.HANDLE
+    setupapi.SetupDiGetClassDevsW.argtypes = [
+        ctypes.c_void_p, wintypes.LPCWSTR, wintypes.HWND, wintypes.DWORD,
+    ]
+    setupapi.SetupDiEnumDeviceInfo.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(SP_DEVINFO_DATA),
+    ]
+    setupapi.SetupDiGetDeviceRegistryPropertyW.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(SP_DEVINFO_DATA), wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p, wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD),
+    ]
+    setupapi.SetupDiGetDeviceInstanceIdW.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(SP_DEVINFO_DATA), wintypes.LPWSTR,
+        wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+    ]
+    setupapi.SetupDiDestroyDeviceInfoList.argtypes = [wintypes.HANDLE]
+
+    dev_info = setupapi.SetupDiGetClassDevsW(
+        None, None, None, DIGCF_ALLCLASSES | DIGCF_PRESENT
+    )
+    if dev_info in (None, INVALID_HANDLE_VALUE):
+        raise ctypes.WinError()
+
+    devices = []
+    instance_id = ctypes.create_unicode_buffer(512)
+    try:
+        index = 0
+        while True:
+            devinfo_data = SP_DEVINFO_DATA()
+            devinfo_data.cbSize = ctypes.sizeof(devinfo_data)
+            if not setupapi.SetupDiEnumDeviceInfo(
+                dev_info, index, ctypes.byref(devinfo_data)
+            ):
+                if ctypes.GetLastError() == ERROR_NO_MORE_ITEMS:
+                    break
+                raise ctypes.WinError()
+            index += 1
+
+            if not setupapi.SetupDiGetDeviceInstanceIdW(
+                dev_info, ctypes.byref(devinfo_data), instance_id,
+                len(instance_id), None,
+            ):
+                continue
+
+            def prop(code):
+                return _get_device_property(setupapi, dev_info, devinfo_data, code)
+
+            # Win32_PnPEntity reports "OK" unless the device has a problem code
+            status = wintypes.ULONG()
+            problem = wintypes.ULONG()
+            cr = cfgmgr32.CM_Get_DevNode_Status(
+                ctypes.byref(status), ctypes.byref(problem), devinfo_data.DevInst, 0
+            )
+
+            devices.append(
+                SimpleNamespace(
+                    Name=prop(SPDRP_FRIENDLYNAME) or prop(SPDRP_DEVICEDESC),
+                    DeviceID=instance_id.value,
+                    Status="OK" if cr == 0 and problem.value == 0 else "Error",
+                    Manufacturer=prop(SPDRP_MFG),
+                    HardwareID=prop(SPDRP_HARDWAREID),
+                    CompatibleID=prop(SPDRP_COMPATIBLEIDS),
+                    ClassGuid=prop(SPDRP_CLASSGUID),
+                    Service=prop(SPDRP_SERVICE),
+                )
+            )
+    finally:
+        setupapi.SetupDiDestroyDeviceInfoList(dev_info)
+
+    return devices
+
+
+def _with_slots(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs 3.10)"""
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    # Defaults already live in the generated __init__; slots replace them
+    for name in names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_with_slots
+@dataclass
+class DriverRecord:
+    """A single scanned driver"""
+
+    device_name: str
+    driver_name: str
+    driver_path: str
+    version: str
+    date: str
+    status: str
+    manufacturer: str
+    device_id: str
+    driver_type: str
+    digital_signature: Optional[bool] = None
+    hardware_id: Optional[str] = None
+    compatible_id: Optional[str] = None
+    class_guid: Optional[str] = None
+    service: Optional[str] = None
+    category: str = "Other"
+
+    def get(self, key: str, default=None):
+        """Dict-style lookup for callers that still treat drivers as dicts"""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
 
 class DriverScanner:
     """Class to scan and analyze system drivers"""
 
+    # WMI connections by namespace, shared by every scanner in the process
+    _conn_cache = {}
+
+    # Category keywords, checked in order; the first matching category wins
+    CATEGORY_PATTERNS = {
+        category: re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+        for category, keywords in (
+            (
+                "Graphics",
+                ("display", "graphics", "video", "nvidia", "amd", "intel hd", "radeon"),
+            ),
+            (
+                "Audio",
+                ("audio", "sound", "speaker", "microphone", "realtek", "hdmi audio"),
+            ),
+            (
+                "Network",
+                ("network", "ethernet", "wifi", "wireless", "bluetooth", "lan"),
+            ),
+            (
+                "Storage",
+                ("storage", "disk", "ssd", "hdd", "sata", "nvme", "usb mass"),
+            ),
+            ("Input", ("keyboard", "mouse", "hid", "input", "touchpad")),
+            (
+                "System",
+                ("system", "chipset", "acpi", "pci", "usb root", "processor"),
+            ),
+        )
+    }
+
+    @classmethod
+    def _classify(cls, device_name: str, hardware_id: Optional[str]) -> str:
+        """Return the category for a device name and hardware ID"""
+        # Newline-separated so no keyword can match across the two
+        haystack = f"{device_name}\n{hardware_id or ''}"
+        for category, pattern in cls.CATEGORY_PATTERNS.items():
+            if pattern.search(haystack):
+                return category
+        return "Other"
+
     def __init__(self, logger):
         self.logger = logger
         self.wmi_connection = None
+        # Modification times of the files in DRIVERS_DIR, by normcased name
+        self._driver_mtimes = {}
+        self._com_initialized = self._co_initialize()
         self.initialize_wmi()
 
-    def initialize_wmi(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _co_initialize(self) -> bool:
+        """Initialize COM for the calling thread"""
+        try:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+            return True
+        except pythoncom.com_error:
+            # Already initialized with a different threading model
+            return False
+
+    def close(self):
+        """Release the COM initialization made by this scanner"""
+        if self._com_initialized:
+            pythoncom.CoUninitialize()
+            self._com_initialized = False
+
+    def initialize_wmi(self, namespace="root\\cimv2"):
         """Initialize WMI connection with better error handling"""
         try:
-            self.wmi_connection = wmi.WMI()
+            connection = self._conn_cache.get(namespace)
+            if connection is None:
+                import wmi
+
+                connection = wmi.WMI(namespace=namespace, find_classes=False)
+                self._conn_cache[namespace] = connection
+            self.wmi_connection = connection
             self.logger.info("WMI connection initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize WMI connection: {str(e)}")
             self.wmi_connection = None
 
-    def scan_all_drivers(self) -> List[Dict[str, Any]]:
+    def scan_all_drivers(self) -> List[DriverRecord]:
         """Scan all system drivers and return detailed information"""
         self.logger.info("Starting comprehensive driver scan...")
 
-        drivers = []
-
         try:
-            # Get PnP devices and their drivers
-            pnp_drivers = self._scan_pnp_drivers()
-            drivers.extend(pnp_drivers)
-
-            # Get system drivers
-            system_drivers = self._scan_system_drivers()
-            drivers.extend(system_drivers)
+            # The two scans are independent and mostly wait on WMI, so run
+            # them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pnp_future = executor.submit(
+                    self._run_scan_in_worker, self._scan_pnp_drivers
+                )
+                system_future = executor.submit(
+                    self._run_scan_in_worker, self._scan_system_drivers
+                )
+                drivers = pnp_future.result() + system_future.result()
 
             # Remove duplicates based on driver file path
             unique_drivers = self._remove_duplicates(drivers)
@@ -53,23 +544,60 @@ class DriverScanner:
             self.logger.error(f"Error during driver scan: {str(e)}")
             raise
 
-    def _scan_pnp_drivers(self) -> List[Dict[str, Any]]:
+    def _run_scan_in_worker(self, scan) -> List[DriverRecord]:
+        """Run a scan on the current thread, sharing the cached MTA connection"""
+        com_initialized = self._co_initialize()
+        connection = None
+        try:
+            # A connection made in the MTA is usable from any MTA thread; one
+            # made in an STA is not, so open a fresh one for the worker then
+            if self.wmi_connection and com_initialized and self._com_initialized:
+                connection = self.wmi_connection
+            elif self.wmi_connection:
+                try:
+                    import wmi
+
+                    connection = wmi.WMI(namespace="root\\cimv2", find_classes=False)
+                except Exception as e:
+                    self.logger.warning(
+                        f"Falling back to the shared WMI connection: {str(e)}"
+                    )
+                    connection = self.wmi_connection
+            return scan(wmi_connection=connection)
+        finally:
+            # Release the connection before tearing down COM on this thread
+            connection = None
+            if com_initialized:
+                pythoncom.CoUninitialize()
+
+    def _scan_pnp_drivers(self, wmi_connection=None) -> List[DriverRecord]:
         """Scan Plug and Play drivers"""
+        wmi_connection = wmi_connection or self.wmi_connection
         self.logger.info("Scanning PnP drivers...")
         drivers = []
 
-        if not self.wmi_connection:
+        if not wmi_connection:
             self.logger.warning(
                 "WMI connection not available, skipping PnP driver scan"
             )
             return drivers
 
         try:
-            # Query PnP devices
-            pnp_entities = self.wmi_connection.Win32_PnPEntity()
+            # Query signed drivers once and index them by device
+            signed_map = {}
+            for driver in wmi_connection.query(PNP_SIGNED_DRIVER_QUERY):
+                signed_map.setdefault(driver.DeviceID, driver)
+
+            # Enumerate PnP devices through SetupAPI, which skips the WMI
+            # provider host; WMI remains the fallback
+            try:
+                pnp_entities = _enumerate_present_devices()
+            except Exception as e:
+                self.logger.warning(f"SetupAPI device enumeration failed: {str(e)}")
+                pnp_entities = wmi_connection.query(PNP_ENTITY_QUERY)
             for device in pnp_entities:
                 if device.Name and device.DeviceID:
-                    driver_info = self._get_driver_info_for_device(device)
+                    driver_info = self._get_driver_info_for_device(device, signed_map)
                     if driver_info:
                         drivers.append(driver_info)
 
@@ -79,45 +607,67 @@ class DriverScanner:
         self.logger.info(f"Found {len(drivers)} PnP drivers")
         return drivers
 
-    def _scan_system_drivers(self) -> List[Dict[str, Any]]:
+    def _scan_system_drivers(self, wmi_connection=None) -> List[DriverRecord]:
         """Scan system drivers with improved error handling"""
+        wmi_connection = wmi_connection or self.wmi_connection
         self.logger.info("Scanning system drivers...")
         drivers = []
 
-        if not self.wmi_connection:
+        if not wmi_connection:
             self.logger.warning(
                 "WMI connection not available, skipping system driver scan"
             )
             return drivers
 
+        # Most system drivers live in one directory; one listing replaces a
+        # stat call per driver
+        self._driver_mtimes = self._load_driver_mtimes()
+
         try:
             # Query system drivers with error handling
-            system_drivers = self.wmi_connection.Win32_SystemDriver()
+            system_drivers = wmi_connection.query(SYSTEM_DRIVER_QUERY)
 
+            # Read the WMI properties on this thread; COM objects must not
+            # cross into the worker threads below
+            entries = []
             for driver in system_drivers:
                 try:
-                    if driver.Name and driver.PathName:
-                        driver_info = {
-                            "device_name": driver.Name,
-                            "driver_name": driver.Name,
-                            "driver_path": driver.PathName,
-                            "version": self._get_file_version(driver.PathName),
-                            "date": self._get_file_date(driver.PathName),
-                            "status": driver.State or "Unknown",
-                            "manufacturer": "Microsoft",  # Most system drivers are Microsoft
-                            "device_id": f"SYS_{driver.Name}",
-                            "driver_type": "System Driver",
-                            "digital_signature": self._check_digital_signature(
-                                driver.PathName
-                            ),
-                        }
-                        drivers.append(driver_info)
+                    name = driver.Name
+                    path = driver.PathName
+                    if name and path:
+                        entries.append((name, path, driver.State))
                 except Exception as e:
                     self.logger.warning(
                         f"Error processing system driver {getattr(driver, 'Name', 'Unknown')}: {str(e)}"
                     )
                     continue
 
+            paths = [path for _, path, _ in entries]
+
+            # The file lookups are independent and mostly wait on I/O
+            with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+                versions = executor.map(self._get_file_version, paths)
+                dates = executor.map(self._get_file_date, paths)
+                signatures = executor.map(self._check_digital_signature, paths)
+
+                for (name, path, state), version, date, signature in zip(
+                    entries, versions, dates, signatures
+                ):
+                    driver_info = DriverRecord(
+                        device_name=name,
+                        driver_name=name,
+                        driver_path=path,
+                        version=version,
+                        date=date,
+                        status=state or "Unknown",
+                        manufacturer="Microsoft",  # Most system drivers are Microsoft
+                        device_id=f"SYS_{name}",
+                        driver_type="System Driver",
+                        digital_signature=signature,
+                        category=self._classify(name, None),
+                    )
+                    drivers.append(driver_info)
+
         except Exception as e:
             self.logger.error(f"Error scanning system drivers: {str(e)}")
             # Try alternative method using PowerShell/DISM if WMI fails
@@ -131,7 +681,7 @@ class DriverScanner:
         self.logger.info(f"Found {len(drivers)} system drivers")
         return drivers
 
-    def _scan_drivers_with_powershell(self) -> List[Dict[str, Any]]:
+    def _scan_drivers_with_powershell(self) -> List[DriverRecord]:
         """Alternative driver scanning using PowerShell"""
         self.logger.info("Using PowerShell to scan drivers...")
         drivers = []
@@ -152,20 +702,23 @@ class DriverScanner:
                     if isinstance(driver_data, list):
                         for driver in driver_data:
                             if driver.get("DeviceName"):
-                                driver_info = {
-                                    "device_name": driver.get("DeviceName", "Unknown"),
-                                    "driver_name": driver.get("DeviceName", "Unknown"),
-                                    "driver_path": driver.get("Location", ""),
-                                    "version": driver.get("DriverVersion", "Unknown"),
-                                    "date": driver.get("DriverDate", "Unknown"),
-                                    "status": "Unknown",
-                                    "manufacturer": driver.get(
+                                driver_info = DriverRecord(
+                                    device_name=driver.get("DeviceName", "Unknown"),
+                                    driver_name=driver.get("DeviceName", "Unknown"),
+                                    driver_path=driver.get("Location", ""),
+                                    version=driver.get("DriverVersion", "Unknown"),
+                                    date=driver.get("DriverDate", "Unknown"),
+                                    status="Unknown",
+                                    manufacturer=driver.get(
                                         "DriverProviderName", "Unknown"
                                     ),
-                                    "device_id": f"PS_{driver.get('DeviceName', 'Unknown')}",
-                                    "driver_type": "PowerShell Driver",
-                                    "digital_signature": None,
-                                }
+                                    device_id=f"PS_{driver.get('DeviceName', 'Unknown')}",
+                                    driver_type="PowerShell Driver",
+                                    digital_signature=None,
+                                    category=self._classify(
+                                        driver.get("DeviceName", "Unknown"), None
+                                    ),
+                                )
                                 drivers.append(driver_info)
                 except json.JSONDecodeError as e:
                     self.logger.error(f"Failed to parse PowerShell output: {str(e)}")
@@ -177,62 +730,76 @@ class DriverScanner:
 
         return drivers
 
-    def _get_driver_info_for_device(self, device) -> Dict[str, Any]:
+    def _get_driver_info_for_device(
+        self, device, signed_map=None
+    ) -> Optional[DriverRecord]:
         """Get detailed driver information for a specific device"""
         if not self.wmi_connection:
             return None
 
         try:
-            # Try to get associated driver files
-            for driver in self.wmi_connection.Win32_PnPSignedDriver():
-                if driver.DeviceID == device.DeviceID:
-                    driver_info = {
-                        "device_name": device.Name or "Unknown Device",
-                        "driver_name": driver.DeviceName
-                        or driver.DriverName
-                        or "Unknown Driver",
-                        "driver_path": driver.Location or "",
-                        "version": driver.DriverVersion or "Unknown",
-                        "date": self._format_driver_date(driver.DriverDate),
-                        "status": device.Status or "Unknown",
-                        "manufacturer": device.Manufacturer
-                        or driver.DriverProviderName
-                        or "Unknown",
-                        "device_id": device.DeviceID,
-                        "driver_type": "PnP Driver",
-                        "digital_signature": driver.IsSigned
-                        if hasattr(driver, "IsSigned")
-                        else None,
-                        "hardware_id": device.HardwareID[0]
-                        if device.HardwareID
-                        else None,
-                        "compatible_id": device.CompatibleID[0]
-                        if device.CompatibleID
-                        else None,
-                        "class_guid": device.ClassGuid,
-                        "service": device.Service,
-                    }
-                    return driver_info
+            # Each COM property read marshals the whole value (HardwareID and
+            # CompatibleID are arrays), so read every property once
+            device_id = device.DeviceID
+            device_name = device.Name or "Unknown Device"
+            status = device.Status or "Unknown"
+            manufacturer = device.Manufacturer
+            hardware_ids = device.HardwareID
+            compatible_ids = device.CompatibleID
+            hardware_id = hardware_ids[0] if hardware_ids else None
+            compatible_id = compatible_ids[0] if compatible_ids else None
+            class_guid = device.ClassGuid
+            service = device.Service
+            category = self._classify(device_name, hardware_id)
+
+            # Try to get associated driver files; full scans pass a map of
+            # every signed driver, single lookups let WMI do the filtering
+            if signed_map is not None:
+                driver = signed_map.get(device_id)
+            else:
+                driver = self._query_signed_driver(device_id)
+            if driver is not None:
+                driver_info = DriverRecord(
+                    device_name=device_name,
+                    driver_name=driver.DeviceName
+                    or driver.DriverName
+                    or "Unknown Driver",
+                    driver_path=driver.Location or "",
+                    version=driver.DriverVersion or "Unknown",
+                    date=self._format_driver_date(driver.DriverDate),
+                    status=status,
+                    manufacturer=manufacturer
+                    or driver.DriverProviderName
+                    or "Unknown",
+                    device_id=device_id,
+                    driver_type="PnP Driver",
+                    digital_signature=getattr(driver, "IsSigned", None),
+                    hardware_id=hardware_id,
+                    compatible_id=compatible_id,
+                    class_guid=class_guid,
+                    service=service,
+                    category=category,
+                )
+                return driver_info
 
             # If no signed driver found, create basic info
-            return {
-                "device_name": device.Name or "Unknown Device",
-                "driver_name": "Unknown Driver",
-                "driver_path": "",
-                "version": "Unknown",
-                "date": "Unknown",
-                "status": device.Status or "Unknown",
-                "manufacturer": device.Manufacturer or "Unknown",
-                "device_id": device.DeviceID,
-                "driver_type": "Basic Device Info",
-                "digital_signature": None,
-                "hardware_id": device.HardwareID[0] if device.HardwareID else None,
-                "compatible_id": device.CompatibleID[0]
-                if device.CompatibleID
-                else None,
-                "class_guid": device.ClassGuid,
-                "service": device.Service,
-            }
+            return DriverRecord(
+                device_name=device_name,
+                driver_name="Unknown Driver",
+                driver_path="",
+                version="Unknown",
+                date="Unknown",
+                status=status,
+                manufacturer=manufacturer or "Unknown",
+                device_id=device_id,
+                driver_type="Basic Device Info",
+                digital_signature=None,
+                hardware_id=hardware_id,
+                compatible_id=compatible_id,
+                class_guid=class_guid,
+                service=service,
+                category=category,
+            )
 
         except Exception as e:
             self.logger.error(
@@ -240,20 +807,24 @@ class DriverScanner:
             )
             return None
 
-    def _remove_duplicates(self, drivers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate drivers based on device ID and driver path"""
-        seen = set()
-        unique_drivers = []
+    def _query_signed_driver(self, device_id: str):
+        """Fetch the signed driver entry for one device, or None"""
+        # WQL string literals escape backslashes and quotes with a backslash
+        escaped = device_id.replace("\\", "\\\\").replace("'", "\\'")
+        results = self.wmi_connection.query(
+            PNP_SIGNED_DRIVER_BY_ID_QUERY.format(escaped)
+        )
+        return results[0] if results else None
 
+    def _remove_duplicates(self, drivers: List[DriverRecord]) -> List[DriverRecord]:
+        """Remove duplicate drivers based on device ID and driver path"""
+        # Keyed by device_id and driver_path; the first occurrence wins and
+        # dicts keep insertion order
+        unique_drivers = {}
         for driver in drivers:
-            # Create a unique key based on device_id and driver_path
-            key = (driver.get("device_id", ""), driver.get("driver_path", ""))
+            unique_drivers.setdefault((driver.device_id, driver.driver_path), driver)
 
-            if key not in seen:
-                seen.add(key)
-                unique_drivers.append(driver)
-
-        return unique_drivers
+        return list(unique_drivers.values())
 
     def _format_driver_date(self, date_str):
         """Format WMI date string to readable format"""
@@ -272,22 +843,35 @@ class DriverScanner:
 
         return date_str or "Unknown"
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_nt_path(file_path):
+        """Convert an NT-style driver path to a Win32 path"""
+        if file_path.startswith("\\??\\"):
+            file_path = file_path[4:]
+
+        lowered = file_path.lower()
+        if lowered.startswith("\\systemroot\\"):
+            file_path = SYSTEM_ROOT + file_path[len("\\SystemRoot") :]
+        elif lowered.startswith("\\device\\"):
+            for device, drive in _dos_device_prefixes().items():
+                if lowered.startswith(device.lower() + "\\"):
+                    file_path = drive + file_path[len(device) :]
+                    break
+        elif lowered.startswith("system32\\"):
+            file_path = os.path.join(SYSTEM_ROOT, file_path)
+        elif lowered.startswith("drivers\\"):
+            file_path = os.path.join(SYSTEM_ROOT, "System32", file_path)
+
+        return file_path
+
     def _get_file_version(self, file_path):
         """Get file version using Windows API"""
         if not file_path:
             return "Unknown"
 
         try:
-            # Clean the path
-            if file_path.startswith("\\??\\"):
-                file_path = file_path[4:]
-
-            if file_path.startswith("\\SystemRoot\\"):
-                import os
-
-                file_path = file_path.replace(
-                    "\\SystemRoot\\", os.environ["SystemRoot"] + "\\"
-                )
+            file_path = self._normalize_nt_path(file_path)
 
             # Get file version info
             try:
@@ -297,27 +881,27 @@ class DriverScanner:
                 version = f"{win32api.HIWORD(ms)}.{win32api.LOWORD(ms)}.{win32api.HIWORD(ls)}.{win32api.LOWORD(ls)}"
                 return version
             except Exception:
-                # Alternative method using subprocess
-                return self._get_version_with_powershell(file_path)
+                # No fixed version block, fall back to the string table
+                return _get_string_file_version(file_path)
 
         except Exception as e:
             self.logger.debug(f"Could not get version for {file_path}: {str(e)}")
             return "Unknown"
 
-    def _get_version_with_powershell(self, file_path):
-        """Get file version using PowerShell"""
+    def _load_driver_mtimes(self) -> Dict[str, float]:
+        """Read the modification time of every file in DRIVERS_DIR"""
+        mtimes = {}
         try:
-            cmd = [
-                "powershell",
-                "-Command",
-                f"(Get-ItemProperty '{file_path}').VersionInfo.FileVersion",
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return "Unknown"
+            with os.scandir(DRIVERS_DIR) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            mtimes[os.path.normcase(entry.name)] = entry.stat().st_mtime
+                    except OSError:
+                        continue
+        except OSError as e:
+            self.logger.debug(f"Could not list {DRIVERS_DIR}: {str(e)}")
+        return mtimes
 
     def _get_file_date(self, file_path):
         """Get file modification date"""
@@ -325,25 +909,18 @@ class DriverScanner:
             return "Unknown"
 
         try:
-            # Clean the path
-            if file_path.startswith("\\??\\"):
-                file_path = file_path[4:]
+            file_path = self._normalize_nt_path(file_path)
 
-            if file_path.startswith("\\SystemRoot\\"):
-                import os
-
-                file_path = file_path.replace(
-                    "\\SystemRoot\\", os.environ["SystemRoot"] + "\\"
-                )
-
-            import os
-
-            if os.path.exists(file_path):
-                import time
-
-                timestamp = os.path.getmtime(file_path)
-                return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+            directory, name = os.path.split(file_path)
+            timestamp = None
+            if os.path.normcase(directory) == os.path.normcase(DRIVERS_DIR):
+                timestamp = self._driver_mtimes.get(os.path.normcase(name))
+            if timestamp is None:
+                timestamp = os.stat(file_path).st_mtime
+            return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
 
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.debug(f"Could not get date for {file_path}: {str(e)}")
 
@@ -355,28 +932,9 @@ class DriverScanner:
             return None
 
         try:
-            # Clean the path
-            if file_path.startswith("\\??\\"):
-                file_path = file_path[4:]
-
-            if file_path.startswith("\\SystemRoot\\"):
-                import os
-
-                file_path = file_path.replace(
-                    "\\SystemRoot\\", os.environ["SystemRoot"] + "\\"
-                )
-
-            # Use PowerShell to check signature
-            cmd = [
-                "powershell",
-                "-Command",
-                f"(Get-AuthenticodeSignature '{file_path}').Status",
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            file_path = self._normalize_nt_path(file_path)
 
-            if result.returncode == 0:
-                status = result.stdout.strip()
-                return status == "Valid"
+            return _verify_signature(file_path)
 
         except Exception as e:
             self.logger.debug(f"Could not check signature for {file_path}: {str(e)}")
@@ -384,8 +942,8 @@ class DriverScanner:
         return None
 
     def get_driver_categories(
-        self, drivers: List[Dict[str, Any]]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        self, drivers: List[DriverRecord]
+    ) -> Dict[str, List[DriverRecord]]:
         """Categorize drivers by type"""
         categories = {
             "Graphics": [],
@@ -397,99 +955,31 @@ class DriverScanner:
             "Other": [],
         }
 
+        # The category is worked out once per driver during the scan
         for driver in drivers:
-            device_name = driver.get("device_name", "").lower()
-            hardware_id = (
-                driver.get("hardware_id", "").lower()
-                if driver.get("hardware_id")
-                else ""
-            )
-
-            # Categorize based on device name and hardware ID
-            if any(
-                keyword in device_name or keyword in hardware_id
-                for keyword in [
-                    "display",
-                    "graphics",
-                    "video",
-                    "nvidia",
-                    "amd",
-                    "intel hd",
-                    "radeon",
-                ]
-            ):
-                categories["Graphics"].append(driver)
-            elif any(
-                keyword in device_name or keyword in hardware_id
-                for keyword in [
-                    "audio",
-                    "sound",
-                    "speaker",
-                    "microphone",
-                    "realtek",
-                    "hdmi audio",
-                ]
-            ):
-                categories["Audio"].append(driver)
-            elif any(
-                keyword in device_name or keyword in hardware_id
-                for keyword in [
-                    "network",
-                    "ethernet",
-                    "wifi",
-                    "wireless",
-                    "bluetooth",
-                    "lan",
-                ]
-            ):
-                categories["Network"].append(driver)
-            elif any(
-                keyword in device_name or keyword in hardware_id
-                for keyword in [
-                    "storage",
-                    "disk",
-                    "ssd",
-                    "hdd",
-                    "sata",
-                    "nvme",
-                    "usb mass",
-                ]
-            ):
-                categories["Storage"].append(driver)
-            elif any(
-                keyword in device_name or keyword in hardware_id
-                for keyword in ["keyboard", "mouse", "hid", "input", "touchpad"]
-            ):
-                categories["Input"].append(driver)
-            elif any(
-                keyword in device_name or keyword in hardware_id
-                for keyword in [
-                    "system",
-                    "chipset",
-                    "acpi",
-                    "pci",
-                    "usb root",
-                    "processor",
-                ]
-            ):
-                categories["System"].append(driver)
-            else:
-                categories["Other"].append(driver)
+            categories[driver.category].append(driver)
 
         return categories
 
-    def save_driver_report(self, drivers: List[Dict[str, Any]], output_path: str):
+    def save_driver_report(self, drivers: List[DriverRecord], output_path: str):
         """Save driver scan results to JSON file"""
         try:
             report = {
                 "scan_date": datetime.now().isoformat(),
                 "total_drivers": len(drivers),
-                "drivers": drivers,
-                "categories": self.get_driver_categories(drivers),
+                "drivers": [driver.to_dict() for driver in drivers],
+                "categories": {
+                    category: [driver.to_dict() for driver in members]
+                    for category, members in self.get_driver_categories(drivers).items()
+                },
             }
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(output_path, "wb") as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False)
 
             self.logger.info(f"Driver report saved to {output_path}")
 
@@ -1,11 +1,22 @@
 import json
+import operator
 import os
+import platform
+import queue
+import re
+import shutil
 import sys
+import time
 import threading
 import tkinter as tk
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import partial
 from tkinter import font as tkFont
-from tkinter import messagebox, scrolledtext, ttk
+from tkinter import filedialog, messagebox, scrolledtext, ttk
+
+import psutil
 
 from driver_installer import DriverInstaller
 from driver_scanner import DriverScanner
@@ -13,8 +24,94 @@ from update_checker import UpdateChecker
 from utils.logger import Logger
 from utils.system_utils import SystemUtils
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Worker threads hand results to the Tk thread through a queue polled at
+# this interval, instead of scheduling a callback per event
+EVENT_PUMP_INTERVAL_MS = 50
+EVENT_BATCH_SIZE = 100
+# Minimum spacing of progress-label updates from worker threads
+PROGRESS_INTERVAL = 0.05
+# Seconds to let running downloads/installs finish after the window closes
+SHUTDOWN_TIMEOUT = 10
+
+# Values for a drivers tree row, read straight off a DriverRecord
+DRIVER_ROW = operator.attrgetter(
+    "device_name",
+    "driver_name",
+    "version",
+    "date",
+    "status",
+    "manufacturer",
+    "driver_type",
+)
+
+# Updates tree columns, and the positions read back when installing
+UPDATE_COLUMNS = (
+    "Select",
+    "Device",
+    "Current Version",
+    "New Version",
+    "Size",
+    "Priority",
+    "Status",
+)
+SELECT_COLUMN = UPDATE_COLUMNS.index("Select")
+DEVICE_COLUMN = UPDATE_COLUMNS.index("Device")
+
+# Device-name keywords for update priority: graphics, security and critical
+# drivers are high, audio and network medium
+HIGH_PRIORITY_PATTERN = re.compile(r"graphics|display|security|chipset", re.IGNORECASE)
+MEDIUM_PRIORITY_PATTERN = re.compile(r"audio|network|ethernet|wifi", re.IGNORECASE)
+
+# Delay before the drivers filter is applied after it changes
+FILTER_DEBOUNCE_MS = 150
+
+# Fixed text around the per-update lines of the installation confirmation
+_CONFIRM_HEADER = "The following driver updates will be installed:\n\n"
+_SAFETY_BLOCK = (
+    "SAFETY MEASURES:\n"
+    "✓ System restore point will be created automatically\n"
+    "✓ Current drivers will be backed up\n"
+    "✓ Digital signature verification (if enabled)\n"
+    "✓ Rollback available if installation fails"
+)
+
+# Rule above and below the section banners in the log
+_BAR = "=" * 60
+
+# Row tag for a driver status, by keyword; problems are checked first
+STATUS_TAGS = (
+    ("error", "problem"),
+    ("problem", "problem"),
+    ("ok", "ok"),
+    ("working", "ok"),
+)
+
+
+class TrackedThreadPool(ThreadPoolExecutor):
+    """ThreadPoolExecutor that can cancel its queued work on Python 3.8"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tracked = set()
+        self._tracked_lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        future = super().submit(fn, *args, **kwargs)
+        with self._tracked_lock:
+            self._tracked.add(future)
+        future.add_done_callback(self._untrack)
+        return future
+
+    def _untrack(self, future):
+        with self._tracked_lock:
+            self._tracked.discard(future)
+
+    def cancel_pending(self):
+        """Cancel work that has not started; return the futures still running"""
+        with self._tracked_lock:
+            futures = list(self._tracked)
+        # cancel() fails only for work that is already running
+        return [future for future in futures if not future.cancel()]
 
 
 class DriverUpdaterGUI:
@@ -32,23 +129,52 @@ class DriverUpdaterGUI:
 
         # Initialize components
         self.logger = Logger()
-        self.scanner = DriverScanner(self.logger)
+        # The scanner sets up COM and WMI, so it is created on the first scan
+        self._scanner = None
         self.update_checker = UpdateChecker(self.logger)
         self.installer = DriverInstaller(self.logger)
         self.system_utils = SystemUtils(self.logger)
 
         # Variables
         self.drivers_data = []
+        # Tree item IDs of every driver row in scan order, and by category;
+        # filtering detaches and reattaches these rather than rebuilding
+        self._driver_items = []
+        self._driver_items_by_category = defaultdict(list)
         self.updates_available = []
+        # updates_available indexed by device name, for row selection
+        self._updates_by_device = {}
         self.scanning = False
         self.checking_updates = False
         self.installing = False
         self.verbose_mode = tk.BooleanVar(value=True)
         self.auto_install = tk.BooleanVar(value=False)
         self.relaxed_validation = tk.BooleanVar(value=True)
+        self.force_refresh = tk.BooleanVar(value=False)
+
+        # Hardware/OS part of the System Info tab, gathered once on first use
+        self._static_sysinfo = None
+        self._system_report = None
+        self._sysinfo_loading = False
+
+        # Long-running operations share a small set of worker threads
+        self._pool = TrackedThreadPool(max_workers=4, thread_name_prefix="du")
+        # Selected updates download side by side; the installer serializes
+        # the install steps themselves
+        self.install_pool = TrackedThreadPool(
+            max_workers=4, thread_name_prefix="drv-install"
+        )
+
+        # Events posted by worker threads, drained on the Tk thread
+        self._events = queue.Queue()
+        self._last_progress_post = 0.0
+
+        # Installation confirmation dialog, built on first use and reused
+        self._confirm_dialog = None
 
         self.setup_ui()
         self.check_admin_privileges()
+        self._pump_events()
 
         # Add welcome message
         self.logger.info("Windows Driver Updater Enhanced v1.0.3 started")
@@ -56,6 +182,41 @@ class DriverUpdaterGUI:
             "Enhanced features: Verbose output, Interactive installation, Relaxed validation"
         )
 
+    def _post(self, callback, *args):
+        """Queue a callback to run on the Tk thread"""
+        self._events.put((callback, args))
+
+    def _post_progress(self, text, final=False):
+        """Queue a progress-label update, dropping ones that come too fast"""
+        now = time.monotonic()
+        if not final and now - self._last_progress_post < PROGRESS_INTERVAL:
+            return
+        self._last_progress_post = now
+        self._post(self.progress_label.config, {"text": text})
+
+    def _pump_events(self):
+        """Run queued worker events, a bounded batch per tick"""
+        try:
+            for _ in range(EVENT_BATCH_SIZE):
+                try:
+                    callback, args = self._events.get_nowait()
+                except queue.Empty:
+                    break
+                # One failing handler must not stop the pump for good
+                try:
+                    callback(*args)
+                except Exception as e:
+                    self.logger.exception("Error handling worker event: %s", e)
+        finally:
+            self.root.after(EVENT_PUMP_INTERVAL_MS, self._pump_events)
+
+    @property
+    def scanner(self):
+        """Driver scanner, created on first use"""
+        if self._scanner is None:
+            self._scanner = DriverScanner(self.logger)
+        return self._scanner
+
     def setup_styles(self):
         """Setup modern UI styles"""
         style = ttk.Style()
@@ -124,7 +285,13 @@ class DriverUpdaterGUI:
 
         ttk.Checkbutton(
             options_frame, text="Relaxed validation", variable=self.relaxed_validation
-        ).grid(row=0, column=2, sticky=tk.W)
+        ).grid(row=0, column=2, sticky=tk.W, padx=(0, 20))
+
+        ttk.Checkbutton(
+            options_frame,
+            text="Force refresh (ignore cached update checks)",
+            variable=self.force_refresh,
+        ).grid(row=0, column=3, sticky=tk.W)
 
         # Enhanced buttons frame
         buttons_frame = ttk.Frame(main_frame)
@@ -194,13 +361,18 @@ class DriverUpdaterGUI:
         self.notebook.add(self.system_frame, text="💻 System Info")
         self.setup_system_tab()
 
+        # System info is only rendered while its tab is showing
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
         # Enhanced status bar with icons
         status_frame = ttk.Frame(main_frame)
         status_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(15, 0))
         status_frame.columnconfigure(1, weight=1)
 
         self.status_var = tk.StringVar()
-        self.status_var.set("🟢 Ready - Select an operation to begin")
+        # Last status text set, so repeats skip the variable trace and redraw
+        self._last_status = None
+        self._set_status("🟢 Ready - Select an operation to begin")
 
         status_icon = ttk.Label(status_frame, text="ℹ️")
         status_icon.grid(row=0, column=0, padx=(0, 5))
@@ -220,34 +392,6 @@ class DriverUpdaterGUI:
 
         self.progress_label = ttk.Label(progress_frame, text="")
         self.progress_label.grid(row=1, column=0, pady=(2, 0))
-        self.notebook.add(self.drivers_frame, text="Drivers")
-        self.setup_drivers_tab()
-
-        # Updates tab
-        self.updates_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.updates_frame, text="Updates")
-        self.setup_updates_tab()
-
-        # Log tab
-        self.log_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.log_frame, text="Log")
-        self.setup_log_tab()
-
-        # Status bar
-        self.status_var = tk.StringVar()
-        self.status_var.set("Ready")
-        status_bar = ttk.Label(
-            main_frame, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W
-        )
-        status_bar.grid(
-            row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0)
-        )
-
-        # Progress bar
-        self.progress = ttk.Progressbar(main_frame, mode="indeterminate")
-        self.progress.grid(
-            row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0)
-        )
 
     def setup_drivers_tab(self):
         """Setup the enhanced drivers list tab"""
@@ -264,8 +408,11 @@ class DriverUpdaterGUI:
         filter_frame.pack(side=tk.RIGHT)
 
         ttk.Label(filter_frame, text="Filter:").pack(side=tk.LEFT, padx=(0, 5))
+        self.driver_filter_var = tk.StringVar(value="All")
+        self._filter_job = None
         self.driver_filter = ttk.Combobox(
             filter_frame,
+            textvariable=self.driver_filter_var,
             values=[
                 "All",
                 "Graphics",
@@ -275,9 +422,9 @@ class DriverUpdaterGUI:
                 "System",
             ],
         )
-        self.driver_filter.set("All")
         self.driver_filter.pack(side=tk.LEFT)
-        self.driver_filter.bind("<<ComboboxSelected>>", self.filter_drivers)
+        # Selections and typed text both change the variable; coalesce them
+        self.driver_filter_var.trace_add("write", self._schedule_filter)
 
         # Enhanced Treeview for drivers with more columns
         columns = (
@@ -308,6 +455,10 @@ class DriverUpdaterGUI:
             self.drivers_tree.heading(col, text=col)
             self.drivers_tree.column(col, width=column_widths.get(col, 100))
 
+        # Status colours are applied through row tags at insert time
+        self.drivers_tree.tag_configure("ok", foreground="#27ae60")
+        self.drivers_tree.tag_configure("problem", foreground="#e74c3c")
+
         # Scrollbars
         drivers_v_scrollbar = ttk.Scrollbar(
             self.drivers_frame, orient=tk.VERTICAL, command=self.drivers_tree.yview
@@ -350,15 +501,7 @@ class DriverUpdaterGUI:
         ).pack(side=tk.LEFT)
 
         # Enhanced Treeview for updates with checkboxes
-        columns = (
-            "Select",
-            "Device",
-            "Current Version",
-            "New Version",
-            "Size",
-            "Priority",
-            "Status",
-        )
+        columns = UPDATE_COLUMNS
         self.updates_tree = ttk.Treeview(
             self.updates_frame, columns=columns, show="headings", height=15
         )
@@ -471,25 +614,99 @@ class DriverUpdaterGUI:
         )
         self.system_info_text.pack(fill=tk.BOTH, expand=True)
 
-        # Load system info
+    def on_tab_changed(self, event=None):
+        """Refresh the System Info tab when it is shown"""
+        if self.notebook.select() != str(self.system_frame):
+            return
+
+        if self._sysinfo_loading:
+            return
+
+        # platform.processor() and the system report can take seconds on
+        # Windows, so gather them off the Tk thread; the last report is shown
+        # until the refreshed one arrives
+        self._sysinfo_loading = True
+        if self._static_sysinfo is not None:
+            self.load_system_info()
+        else:
+            self.system_info_text.config(state=tk.NORMAL)
+            self.system_info_text.replace(1.0, tk.END, "Loading system information...")
+            self.system_info_text.config(state=tk.DISABLED)
+        self._pool.submit(self._load_system_info_thread)
+
+    def _load_system_info_thread(self):
+        """Gather system info and status, then display them on the Tk thread"""
+        try:
+            self._get_static_system_info()
+            self._system_report = self.system_utils.get_full_report()
+        except Exception as e:
+            self.logger.error(f"Failed to load system info: {str(e)}")
+        self._post(self._finish_system_info)
+
+    def _finish_system_info(self):
+        """Display the gathered system info and allow another refresh"""
+        self._sysinfo_loading = False
         self.load_system_info()
 
+    def _schedule_filter(self, *args):
+        """Run filter_drivers once the filter has stopped changing"""
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(FILTER_DEBOUNCE_MS, self.filter_drivers)
+
     def filter_drivers(self, event=None):
         """Filter drivers by category"""
+        self._filter_job = None
         filter_value = self.driver_filter.get()
-        # Implementation for filtering drivers by category
-        # This will be enhanced based on driver categories
-        pass
+        if filter_value == "All":
+            visible = self._driver_items
+        else:
+            visible = self._driver_items_by_category.get(filter_value, [])
+
+        if self._driver_items:
+            self.drivers_tree.detach(*self._driver_items)
+        for index, item in enumerate(visible):
+            self.drivers_tree.reattach(item, "", index)
 
     def select_all_updates(self):
         """Select all updates for installation"""
-        for item in self.updates_tree.get_children():
-            self.updates_tree.set(item, "Select", "☑️")
+        self._set_all_update_selections("☑️")
 
     def select_no_updates(self):
         """Deselect all updates"""
-        for item in self.updates_tree.get_children():
-            self.updates_tree.set(item, "Select", "☐")
+        self._set_all_update_selections("☐")
+
+    def _set_status(self, status):
+        """Update the status bar text if it changed"""
+        if status == self._last_status:
+            return
+        self._last_status = status
+        self.status_var.set(status)
+
+    def _set_ui_busy(self, status, text, *buttons):
+        """Disable the given buttons and start the progress bar"""
+        for button in buttons:
+            button.config(state=tk.DISABLED)
+        self._set_status(status)
+        self.progress_label.config(text=text)
+        self.progress.start()
+
+    def _set_ui_idle(self, *buttons, status=None):
+        """Stop the progress bar and re-enable the given buttons"""
+        self.progress.stop()
+        self.progress_label.config(text="")
+        for button in buttons:
+            button.config(state=tk.NORMAL)
+        if status is not None:
+            self._set_status(status)
+
+    def _set_all_update_selections(self, value):
+        """Set the Select column of every update row to value"""
+        tree = self.updates_tree
+        # Only rewrite rows whose checkbox actually changes
+        for item in tree.get_children():
+            if tree.set(item, "Select") != value:
+                tree.set(item, "Select", value)
 
     def on_update_item_click(self, event):
         """Handle click on update item for checkbox toggle"""
@@ -503,12 +720,10 @@ class DriverUpdaterGUI:
 
     def clear_log(self):
         """Clear the log display"""
-        self.log_text.delete(1.0, tk.END)
+        self.logger.clear_gui()
 
     def save_log(self):
         """Save log to file"""
-        from tkinter import filedialog
-
         filename = filedialog.asksaveasfilename(
             defaultextension=".log",
             filetypes=[
@@ -519,36 +734,76 @@ class DriverUpdaterGUI:
         )
         if filename:
             try:
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(self.log_text.get(1.0, tk.END))
+                # The logger already writes everything to a file; copy it
+                # rather than pulling the whole widget text into Python
+                log_file_path = self.logger.get_log_file_path()
+                if log_file_path and os.path.isfile(log_file_path):
+                    shutil.copyfile(log_file_path, filename)
+                else:
+                    with open(filename, "w", encoding="utf-8") as f:
+                        f.write(self.log_text.get(1.0, tk.END))
                 messagebox.showinfo("Success", f"Log saved to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save log: {str(e)}")
 
+    def _get_static_system_info(self):
+        """Return the system details that cannot change while running"""
+        if self._static_sysinfo is None:
+            self._static_sysinfo = "\n".join(
+                [
+                    f"System: {platform.system()} {platform.release()}",
+                    f"Version: {platform.version()}",
+                    f"Architecture: {platform.architecture()[0]}",
+                    f"Processor: {platform.processor()}",
+                    f"CPU Cores: {psutil.cpu_count()}",
+                    f"Memory: {psutil.virtual_memory().total // (1024**3)} GB",
+                    f"Python Version: {platform.python_version()}",
+                ]
+            )
+        return self._static_sysinfo
+
+    def _format_system_report(self):
+        """Return the last system report as display lines"""
+        report = self._system_report
+        if not report:
+            return ""
+
+        system_info = report.get("system_info") or {}
+        disk_space = report.get("disk_space") or {}
+        lines = ["System Status:"]
+        if system_info.get("os_name"):
+            lines.append(
+                f"OS: {system_info['os_name']} (build {system_info.get('os_build', '?')})"
+            )
+        if system_info.get("model"):
+            lines.append(
+                f"Model: {system_info.get('manufacturer', '')} {system_info['model']}".strip()
+            )
+        lines.append(f"Pending Reboot: {'Yes' if report.get('pending_reboot') else 'No'}")
+        if disk_space:
+            lines.append(
+                f"Disk Space ({disk_space['path']}): {disk_space['free_gb']} GB free "
+                f"of {disk_space['total_gb']} GB"
+            )
+        if report.get("uptime"):
+            lines.append(f"Uptime: {report['uptime']}")
+        return "\n".join(lines) + "\n\n"
+
     def load_system_info(self):
         """Load and display system information"""
         try:
-            import platform
-
-            import psutil
-
-            info_text = []
-            info_text.append(f"System: {platform.system()} {platform.release()}")
-            info_text.append(f"Version: {platform.version()}")
-            info_text.append(f"Architecture: {platform.architecture()[0]}")
-            info_text.append(f"Processor: {platform.processor()}")
-            info_text.append(f"CPU Cores: {psutil.cpu_count()}")
-            info_text.append(f"Memory: {psutil.virtual_memory().total // (1024**3)} GB")
-            info_text.append(f"Python Version: {platform.python_version()}")
-            info_text.append("")
-            info_text.append("Driver Updater Configuration:")
-            info_text.append(f"Verbose Mode: {self.verbose_mode.get()}")
-            info_text.append(f"Auto Install: {self.auto_install.get()}")
-            info_text.append(f"Relaxed Validation: {self.relaxed_validation.get()}")
+            info_text = (
+                f"{self._get_static_system_info()}\n"
+                "\n"
+                f"{self._format_system_report()}"
+                "Driver Updater Configuration:\n"
+                f"Verbose Mode: {self.verbose_mode.get()}\n"
+                f"Auto Install: {self.auto_install.get()}\n"
+                f"Relaxed Validation: {self.relaxed_validation.get()}"
+            )
 
             self.system_info_text.config(state=tk.NORMAL)
-            self.system_info_text.delete(1.0, tk.END)
-            self.system_info_text.insert(1.0, "\n".join(info_text))
+            self.system_info_text.replace(1.0, tk.END, info_text)
             self.system_info_text.config(state=tk.DISABLED)
 
         except Exception as e:
@@ -580,122 +835,96 @@ class DriverUpdaterGUI:
 
     def start_scan(self):
         """Enhanced driver scanning with verbose output"""
+        verbose = self.verbose_mode.get()
         if self.scanning:
             return
 
         self.scanning = True
-        self.scan_btn.config(state=tk.DISABLED)
-        self.check_updates_btn.config(state=tk.DISABLED)
-
-        # Enhanced status messages
-        self.status_var.set("🔍 Scanning system drivers...")
-        self.progress_label.config(text="Initializing driver scan...")
-        self.progress.start()
+        self._set_ui_busy(
+            "🔍 Scanning system drivers...",
+            "Initializing driver scan...",
+            self.scan_btn,
+            self.check_updates_btn,
+        )
 
-        # Clear previous data
-        for item in self.drivers_tree.get_children():
-            self.drivers_tree.delete(item)
+        # Clear previous data, including rows hidden by the filter
+        if self._driver_items:
+            self.drivers_tree.delete(*self._driver_items)
+        self._driver_items = []
+        self._driver_items_by_category = defaultdict(list)
         self.drivers_data = []
 
-        if self.verbose_mode.get():
-            self.logger.info("=" * 60)
-            self.logger.info("STARTING ENHANCED DRIVER SCAN")
-            self.logger.info("=" * 60)
+        if verbose:
+            self.logger.info("%s\n%s\n%s", _BAR, "STARTING ENHANCED DRIVER SCAN", _BAR)
             self.logger.info(f"Scan options:")
-            self.logger.info(f"  - Verbose mode: {self.verbose_mode.get()}")
+            self.logger.info(f"  - Verbose mode: {verbose}")
             self.logger.info(f"  - Relaxed validation: {self.relaxed_validation.get()}")
 
-        # Start scanning thread
-        scan_thread = threading.Thread(target=self.scan_drivers_thread)
-        scan_thread.daemon = True
-        scan_thread.start()
+        # Start scanning thread; Tk variables are read here, not in the worker
+        self._pool.submit(self.scan_drivers_thread, verbose)
 
-    def scan_drivers_thread(self):
+    def scan_drivers_thread(self, verbose):
         """Enhanced driver scanning thread with progress updates"""
         try:
-            if self.verbose_mode.get():
+            if verbose:
                 self.logger.info("Initializing WMI connection...")
 
             # Update progress
-            self.root.after(
-                0,
-                lambda: self.progress_label.config(
-                    text="Connecting to Windows Management Interface..."
-                ),
+            self._post(
+                self.progress_label.config,
+                {"text": "Connecting to Windows Management Interface..."},
             )
 
             self.drivers_data = self.scanner.scan_all_drivers()
 
-            if self.verbose_mode.get():
-                self.logger.info(f"Scan completed successfully!")
-                self.logger.info(f"Found {len(self.drivers_data)} drivers total")
+            if verbose:
+                self.logger.info("Scan completed successfully!")
+                self.logger.info("Found %d drivers total", len(self.drivers_data))
 
                 # Log driver categories
                 categories = self.scanner.get_driver_categories(self.drivers_data)
                 for category, drivers in categories.items():
                     if drivers:
-                        self.logger.info(f"  - {category}: {len(drivers)} drivers")
+                        self.logger.info("  - %s: %d drivers", category, len(drivers))
 
-            self.root.after(0, self.on_scan_complete)
+            self._post(self.on_scan_complete)
         except Exception as e:
-            self.logger.error(f"Enhanced scan error: {str(e)}")
-            if self.verbose_mode.get():
-                import traceback
-
-                self.logger.error(f"Detailed error: {traceback.format_exc()}")
-            self.root.after(0, self.on_scan_error, str(e))
+            self.logger.exception("Enhanced scan error: %s", e)
+            self._post(self.on_scan_error, str(e))
 
     def on_scan_complete(self):
         """Enhanced scan completion handler"""
-        self.progress.stop()
-        self.progress_label.config(text="")
         self.scanning = False
-        self.scan_btn.config(state=tk.NORMAL)
-        self.check_updates_btn.config(state=tk.NORMAL)
+        self._set_ui_idle(self.scan_btn, self.check_updates_btn)
 
-        # Enhanced driver display with categories and colors
+        # Enhanced driver display with categories and colors; the status
+        # colour comes from a row tag so each row takes a single insert
         for driver in self.drivers_data:
+            status = driver.status.lower()
+            tag = next(
+                (tag for keyword, tag in STATUS_TAGS if keyword in status), "unknown"
+            )
+
             item = self.drivers_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    driver.get("device_name", "Unknown"),
-                    driver.get("driver_name", "Unknown"),
-                    driver.get("version", "Unknown"),
-                    driver.get("date", "Unknown"),
-                    driver.get("status", "Unknown"),
-                    driver.get("manufacturer", "Unknown"),
-                    driver.get("driver_type", "Unknown"),
-                ),
+                "", tk.END, values=DRIVER_ROW(driver), tags=(tag,)
             )
+            self._driver_items.append(item)
+            self._driver_items_by_category[driver.category].append(item)
 
-            # Color code by status
-            status = driver.get("status", "").lower()
-            if "error" in status or "problem" in status:
-                self.drivers_tree.set(
-                    item, "Status", "⚠️ " + driver.get("status", "Unknown")
-                )
-            elif "ok" in status or "working" in status:
-                self.drivers_tree.set(
-                    item, "Status", "✅ " + driver.get("status", "Unknown")
-                )
+        # Keep the current filter applied to the new rows
+        self.filter_drivers()
 
         # Update stats
         self.driver_stats.config(text=f"Found {len(self.drivers_data)} drivers")
-        self.status_var.set(f"🟢 Scan complete - Found {len(self.drivers_data)} drivers")
+        self._set_status(f"🟢 Scan complete - Found {len(self.drivers_data)} drivers")
 
         if self.verbose_mode.get():
-            self.logger.info("=" * 60)
-            self.logger.info("DRIVER SCAN SUMMARY")
-            self.logger.info("=" * 60)
+            self.logger.info("%s\n%s\n%s", _BAR, "DRIVER SCAN SUMMARY", _BAR)
 
     def on_scan_error(self, error_msg):
         """Enhanced scan error handler"""
-        self.progress.stop()
-        self.progress_label.config(text="")
         self.scanning = False
-        self.scan_btn.config(state=tk.NORMAL)
-        self.status_var.set("🔴 Scan failed")
+        self._set_ui_idle(self.scan_btn, status="🔴 Scan failed")
 
         error_dialog = messagebox.showerror(
             "Enhanced Scan Error",
@@ -708,105 +937,114 @@ class DriverUpdaterGUI:
         if self.checking_updates or not self.drivers_data:
             return
 
-        self.checking_updates = True
-        self.check_updates_btn.config(state=tk.DISABLED)
-        self.install_btn.config(state=tk.DISABLED)
+        verbose = self.verbose_mode.get()
+        relaxed = self.relaxed_validation.get()
+        force_refresh = self.force_refresh.get()
 
-        self.status_var.set("🌐 Checking for driver updates...")
-        self.progress_label.config(text="Initializing update check...")
-        self.progress.start()
+        self.checking_updates = True
+        self._set_ui_busy(
+            "🌐 Checking for driver updates...",
+            "Initializing update check...",
+            self.check_updates_btn,
+            self.install_btn,
+        )
 
         # Clear previous updates
-        for item in self.updates_tree.get_children():
-            self.updates_tree.delete(item)
+        self.updates_tree.delete(*self.updates_tree.get_children())
         self.updates_available = []
+        self._updates_by_device = {}
 
-        if self.verbose_mode.get():
-            self.logger.info("=" * 60)
-            self.logger.info("STARTING ENHANCED UPDATE CHECK")
-            self.logger.info("=" * 60)
+        if verbose:
+            self.logger.info("%s\n%s\n%s", _BAR, "STARTING ENHANCED UPDATE CHECK", _BAR)
             self.logger.info(
                 f"Checking {len(self.drivers_data)} drivers for updates..."
             )
-            self.logger.info(f"Relaxed validation: {self.relaxed_validation.get()}")
+            self.logger.info(f"Relaxed validation: {relaxed}")
 
-        # Start update check thread
-        update_thread = threading.Thread(target=self.check_updates_thread)
-        update_thread.daemon = True
-        update_thread.start()
+        # Start update check thread; Tk variables are read here, not in the worker
+        self._pool.submit(self.check_updates_thread, verbose, relaxed, force_refresh)
 
-    def check_updates_thread(self):
+    def check_updates_thread(self, verbose, relaxed, force_refresh):
         """Enhanced update checking thread with detailed progress"""
         try:
-            if self.verbose_mode.get():
+            if verbose:
                 self.logger.info("Contacting manufacturer websites...")
 
             # Enhanced update checker with relaxed validation
-            self.update_checker.set_relaxed_validation(self.relaxed_validation.get())
-            self.update_checker.set_verbose_mode(self.verbose_mode.get())
+            self.update_checker.set_relaxed_validation(relaxed)
+            self.update_checker.set_verbose_mode(verbose)
 
             self.updates_available = self.update_checker.check_for_updates(
-                self.drivers_data, progress_callback=self.update_progress_callback
+                self.drivers_data,
+                progress_callback=partial(self.update_progress_callback, verbose=verbose),
+                force_refresh=force_refresh,
             )
 
-            if self.verbose_mode.get():
-                self.logger.info(f"Update check completed!")
+            # Work out each row here so the Tk thread only inserts
+            updates_by_device = {}
+            for update in self.updates_available:
+                updates_by_device.setdefault(update.get("device_name"), update)
+                priority = self.calculate_update_priority(update)
+                update["_priority"] = priority
+                update["_row"] = (
+                    # Selection checkbox; high priority updates start selected
+                    "☑️" if priority == "High" else "☐",
+                    update.get("device_name", "Unknown"),
+                    update.get("current_version", "Unknown"),
+                    update.get("new_version", "Unknown"),
+                    update.get("download_size", "Unknown"),
+                    priority,
+                    "🟢 Available",
+                )
+                # Name as shown in the installation progress label
+                update["_short_name"] = (update.get("device_name") or "Unknown")[:30]
+                # Entry for the installation confirmation, less its number
+                update["_details_line"] = (
+                    f"{update.get('device_name', 'Unknown')}\n"
+                    f"   Current: {update.get('current_version', 'Unknown')}\n"
+                    f"   New: {update.get('new_version', 'Unknown')}\n"
+                    f"   Size: {update.get('download_size', 'Unknown')}\n\n"
+                )
+            self._updates_by_device = updates_by_device
+
+            if verbose:
+                self.logger.info("Update check completed!")
                 self.logger.info(
-                    f"Found {len(self.updates_available)} available updates"
+                    "Found %d available updates", len(self.updates_available)
                 )
                 for update in self.updates_available:
                     self.logger.info(
-                        f"  - {update.get('device_name')}: {update.get('current_version')} → {update.get('new_version')}"
+                        "  - %s: %s → %s",
+                        update.get("device_name"),
+                        update.get("current_version"),
+                        update.get("new_version"),
                     )
 
-            self.root.after(0, self.on_update_check_complete)
+            self._post(self.on_update_check_complete)
         except Exception as e:
-            self.logger.error(f"Enhanced update check error: {str(e)}")
-            if self.verbose_mode.get():
-                import traceback
+            self.logger.exception("Enhanced update check error: %s", e)
+            self._post(self.on_update_check_error, str(e))
 
-                self.logger.error(f"Detailed error: {traceback.format_exc()}")
-            self.root.after(0, self.on_update_check_error, str(e))
-
-    def update_progress_callback(self, current, total, device_name):
+    def update_progress_callback(self, current, total, device_name, verbose=False):
         """Callback for update check progress"""
-        if self.verbose_mode.get():
-            self.logger.info(f"Checking {current}/{total}: {device_name}")
-        self.root.after(
-            0,
-            lambda: self.progress_label.config(
-                text=f"Checking updates {current}/{total}: {device_name[:30]}..."
-            ),
+        if verbose:
+            self.logger.info("Checking %d/%d: %s", current, total, device_name)
+        self._post_progress(
+            f"Checking updates {current}/{total}: {device_name[:30]}...",
+            final=current == total,
         )
 
     def on_update_check_complete(self):
         """Enhanced update check completion"""
-        self.progress.stop()
-        self.progress_label.config(text="")
         self.checking_updates = False
-        self.check_updates_btn.config(state=tk.NORMAL)
+        self._set_ui_idle(self.check_updates_btn)
 
         # Enhanced updates display with priority and selection
         for update in self.updates_available:
-            priority = self.calculate_update_priority(update)
-            item = self.updates_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    "☐",  # Selection checkbox
-                    update.get("device_name", "Unknown"),
-                    update.get("current_version", "Unknown"),
-                    update.get("new_version", "Unknown"),
-                    update.get("download_size", "Unknown"),
-                    priority,
-                    "🟢 Available",
-                ),
+            self.updates_tree.insert(
+                "", tk.END, values=update["_row"], tags=(update["_priority"],)
             )
 
-            # Auto-select high priority updates
-            if priority == "High":
-                self.updates_tree.set(item, "Select", "☑️")
-
         if self.updates_available and self.system_utils.is_admin():
             self.install_btn.config(state=tk.NORMAL)
 
@@ -814,41 +1052,29 @@ class DriverUpdaterGUI:
         self.update_stats.config(
             text=f"Found {len(self.updates_available)} available updates"
         )
-        self.status_var.set(
+        self._set_status(
             f"🟢 Update check complete - {len(self.updates_available)} updates available"
         )
 
         if self.verbose_mode.get():
-            self.logger.info("=" * 60)
-            self.logger.info("UPDATE CHECK SUMMARY")
-            self.logger.info("=" * 60)
+            self.logger.info("%s\n%s\n%s", _BAR, "UPDATE CHECK SUMMARY", _BAR)
 
     def calculate_update_priority(self, update):
         """Calculate update priority based on device type and version difference"""
-        device_name = update.get("device_name", "").lower()
+        device_name = update.get("device_name") or ""
 
-        # High priority for graphics, security, and critical drivers
-        if any(
-            keyword in device_name
-            for keyword in ["graphics", "display", "security", "chipset"]
-        ):
+        if HIGH_PRIORITY_PATTERN.search(device_name):
             return "High"
-        # Medium priority for audio and network
-        elif any(
-            keyword in device_name
-            for keyword in ["audio", "network", "ethernet", "wifi"]
-        ):
+        elif MEDIUM_PRIORITY_PATTERN.search(device_name):
             return "Medium"
         else:
             return "Low"
 
     def on_update_check_error(self, error_msg):
         """Enhanced update check error handler"""
-        self.progress.stop()
-        self.progress_label.config(text="")
         self.checking_updates = False
-        self.check_updates_btn.config(state=tk.NORMAL)
-        self.status_var.set("🔴 Update check failed")
+        self._set_ui_idle(self.check_updates_btn, status="🔴 Update check failed")
+        self._updates_by_device = {}
 
         messagebox.showerror(
             "Enhanced Update Check Error",
@@ -859,18 +1085,20 @@ class DriverUpdaterGUI:
 
     def start_installation(self):
         """Enhanced interactive installation process"""
+        verbose = self.verbose_mode.get()
+        interactive = not self.auto_install.get()
         if not self.updates_available or self.installing:
             return
 
         # Get selected updates
         selected_updates = []
         for item in self.updates_tree.get_children():
-            if self.updates_tree.set(item, "Select") == "☑️":
-                device_name = self.updates_tree.set(item, "Device")
-                for update in self.updates_available:
-                    if update.get("device_name") == device_name:
-                        selected_updates.append(update)
-                        break
+            # One Tcl round-trip per row for all of its values
+            values = self.updates_tree.item(item, "values")
+            if values[SELECT_COLUMN] == "☑️":
+                update = self._updates_by_device.get(values[DEVICE_COLUMN])
+                if update:
+                    selected_updates.append(update)
 
         if not selected_updates:
             messagebox.showwarning(
@@ -879,44 +1107,39 @@ class DriverUpdaterGUI:
             return
 
         # Enhanced confirmation dialog
-        if not self.auto_install.get():
+        if interactive:
             result = self.show_installation_confirmation(selected_updates)
             if result != "yes":
                 return
 
         self.installing = True
-        self.install_btn.config(state=tk.DISABLED)
-        self.status_var.set("⚡ Installing driver updates...")
-        self.progress_label.config(text="Preparing installation...")
-        self.progress.start()
+        self._set_ui_busy(
+            "⚡ Installing driver updates...",
+            "Preparing installation...",
+            self.install_btn,
+        )
 
-        if self.verbose_mode.get():
-            self.logger.info("=" * 60)
-            self.logger.info("STARTING ENHANCED INSTALLATION")
-            self.logger.info("=" * 60)
+        if verbose:
+            self.logger.info("%s\n%s\n%s", _BAR, "STARTING ENHANCED INSTALLATION", _BAR)
             self.logger.info(f"Installing {len(selected_updates)} selected updates")
-            self.logger.info(f"Interactive mode: {not self.auto_install.get()}")
+            self.logger.info(f"Interactive mode: {interactive}")
 
         # Start installation thread
-        install_thread = threading.Thread(
-            target=self.install_updates_thread, args=(selected_updates,)
+        self._pool.submit(
+            self.install_updates_thread, selected_updates, verbose, interactive
         )
-        install_thread.daemon = True
-        install_thread.start()
 
-    def show_installation_confirmation(self, selected_updates):
-        """Show detailed installation confirmation dialog"""
-        # Create custom dialog
+    def _ensure_confirm_dialog(self):
+        """Build the installation confirmation dialog on first use"""
+        if self._confirm_dialog is not None:
+            return self._confirm_dialog
+
+        # Create custom dialog; it is hidden between uses, not destroyed
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Confirm Driver Installation")
         dialog.geometry("600x400")
         dialog.transient(self.root)
-        dialog.grab_set()
-
-        # Center the dialog
-        dialog.geometry(
-            "+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50)
-        )
 
         # Header
         header = ttk.Label(
@@ -931,107 +1154,99 @@ class DriverUpdaterGUI:
         info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
 
         # Details text
-        details_text = scrolledtext.ScrolledText(info_frame, height=10, width=70)
-        details_text.pack(fill=tk.BOTH, expand=True)
-
-        details_content = []
-        details_content.append("The following driver updates will be installed:\n")
-        for i, update in enumerate(selected_updates, 1):
-            details_content.append(f"{i}. {update.get('device_name', 'Unknown')}")
-            details_content.append(
-                f"   Current: {update.get('current_version', 'Unknown')}"
-            )
-            details_content.append(f"   New: {update.get('new_version', 'Unknown')}")
-            details_content.append(f"   Size: {update.get('download_size', 'Unknown')}")
-            details_content.append("")
-
-        details_content.append("SAFETY MEASURES:")
-        details_content.append("✓ System restore point will be created automatically")
-        details_content.append("✓ Current drivers will be backed up")
-        details_content.append("✓ Digital signature verification (if enabled)")
-        details_content.append("✓ Rollback available if installation fails")
-
-        details_text.insert(1.0, "\n".join(details_content))
-        details_text.config(state=tk.DISABLED)
+        self._confirm_details_text = scrolledtext.ScrolledText(
+            info_frame, height=10, width=70
+        )
+        self._confirm_details_text.pack(fill=tk.BOTH, expand=True)
 
         # Button frame
         button_frame = ttk.Frame(dialog)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
 
-        result = [None]  # Use list to allow modification in nested function
-
-        def on_yes():
-            result[0] = "yes"
-            dialog.destroy()
-
-        def on_no():
-            result[0] = "no"
-            dialog.destroy()
+        self._confirm_result = tk.StringVar(dialog)
 
         ttk.Button(
             button_frame,
             text="✅ Install Updates",
-            command=on_yes,
+            command=lambda: self._confirm_result.set("yes"),
             style="Action.TButton",
         ).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(button_frame, text="❌ Cancel", command=on_no).pack(side=tk.LEFT)
+        ttk.Button(
+            button_frame,
+            text="❌ Cancel",
+            command=lambda: self._confirm_result.set("no"),
+        ).pack(side=tk.LEFT)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._confirm_result.set("no"))
 
-        # Wait for dialog to close
-        dialog.wait_window()
-        return result[0]
+        self._confirm_dialog = dialog
+        return dialog
 
-    def install_updates_thread(self, selected_updates):
-        """Enhanced installation thread with interactive prompts"""
-        try:
-            success_count = 0
-            self.installer.set_verbose_mode(self.verbose_mode.get())
-            self.installer.set_interactive_mode(not self.auto_install.get())
+    def show_installation_confirmation(self, selected_updates):
+        """Show detailed installation confirmation dialog"""
+        dialog = self._ensure_confirm_dialog()
 
-            for i, update in enumerate(selected_updates):
-                if self.verbose_mode.get():
-                    self.logger.info(
-                        f"Installing update {i+1}/{len(selected_updates)}: {update.get('device_name')}"
-                    )
+        details = "".join(
+            f"{i}. {update['_details_line']}"
+            for i, update in enumerate(selected_updates, 1)
+        )
 
-                self.root.after(
-                    0,
-                    lambda i=i, total=len(selected_updates), name=update.get(
-                        "device_name"
-                    ): self.progress_label.config(
-                        text=f"Installing {i+1}/{total}: {name[:30]}"
-                    ),
-                )
+        details_text = self._confirm_details_text
+        details_text.config(state=tk.NORMAL)
+        details_text.replace(1.0, tk.END, _CONFIRM_HEADER + details + _SAFETY_BLOCK)
+        details_text.config(state=tk.DISABLED)
 
-                if self.installer.install_single_update_interactive(update):
-                    success_count += 1
-                    if self.verbose_mode.get():
-                        self.logger.info(
-                            f"✅ Successfully installed: {update.get('device_name')}"
-                        )
-                else:
-                    if self.verbose_mode.get():
-                        self.logger.error(
-                            f"❌ Failed to install: {update.get('device_name')}"
-                        )
+        # Center the dialog
+        dialog.geometry(
+            "+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50)
+        )
+        self._confirm_result.set("")
+        dialog.deiconify()
+        dialog.grab_set()
+
+        # Wait for a button or the close box, then hide the dialog again
+        dialog.wait_variable(self._confirm_result)
+        dialog.grab_release()
+        dialog.withdraw()
+        return self._confirm_result.get()
 
-            self.root.after(
-                0, self.on_installation_complete, success_count, len(selected_updates)
+    def install_updates_thread(self, selected_updates, verbose, interactive):
+        """Enhanced installation thread with interactive prompts"""
+        try:
+            self.installer.set_verbose_mode(verbose)
+            self.installer.set_interactive_mode(interactive)
+
+            total = len(selected_updates)
+            if verbose:
+                for i, update in enumerate(selected_updates, 1):
+                    name = update.get("device_name", "Unknown")
+                    self.logger.info("Installing update %d/%d: %s", i, total, name)
+
+            def on_progress(done, total, update, success):
+                name = update.get("device_name", "Unknown")
+                self._post_progress(
+                    f"Finished {done}/{total}: {update['_short_name']}",
+                    final=done == total,
+                )
+                if verbose:
+                    if success:
+                        self.logger.info("✅ Successfully installed: %s", name)
+                    else:
+                        self.logger.error("❌ Failed to install: %s", name)
+
+            success_count = self.installer.install_many(
+                selected_updates, executor=self.install_pool, on_progress=on_progress
             )
 
-        except Exception as e:
-            self.logger.error(f"Enhanced installation error: {str(e)}")
-            if self.verbose_mode.get():
-                import traceback
+            self._post(self.on_installation_complete, success_count, total)
 
-                self.logger.error(f"Detailed error: {traceback.format_exc()}")
-            self.root.after(0, self.on_installation_error, str(e))
+        except Exception as e:
+            self.logger.exception("Enhanced installation error: %s", e)
+            self._post(self.on_installation_error, str(e))
 
     def on_installation_complete(self, success_count, total_count):
         """Enhanced installation completion handler"""
-        self.progress.stop()
-        self.progress_label.config(text="")
         self.installing = False
-        self.install_btn.config(state=tk.NORMAL)
+        self._set_ui_idle(self.install_btn)
 
         # Enhanced completion message
         if success_count == total_count:
@@ -1050,25 +1265,20 @@ class DriverUpdaterGUI:
         message += "\n\nPlease restart your computer to complete the installation."
 
         if self.verbose_mode.get():
-            self.logger.info("=" * 60)
-            self.logger.info("INSTALLATION SUMMARY")
-            self.logger.info("=" * 60)
+            self.logger.info("%s\n%s\n%s", _BAR, "INSTALLATION SUMMARY", _BAR)
             self.logger.info(f"Total updates: {total_count}")
             self.logger.info(f"Successful: {success_count}")
             self.logger.info(f"Failed: {total_count - success_count}")
 
         messagebox.showinfo(title, f"{icon} {message}")
-        self.status_var.set(
+        self._set_status(
             f"🟢 Installation complete - {success_count}/{total_count} successful"
         )
 
     def on_installation_error(self, error_msg):
         """Enhanced installation error handler"""
-        self.progress.stop()
-        self.progress_label.config(text="")
         self.installing = False
-        self.install_btn.config(state=tk.NORMAL)
-        self.status_var.set("🔴 Installation failed")
+        self._set_ui_idle(self.install_btn, status="🔴 Installation failed")
 
         messagebox.showerror(
             "Enhanced Installation Error",
@@ -1079,34 +1289,35 @@ class DriverUpdaterGUI:
 
     def create_restore_point(self):
         """Enhanced restore point creation"""
-        if self.verbose_mode.get():
+        verbose = self.verbose_mode.get()
+        if verbose:
             self.logger.info("Creating system restore point...")
 
-        self.status_var.set("💾 Creating system restore point...")
+        self._set_status("💾 Creating system restore point...")
 
         try:
             success = self.system_utils.create_restore_point(
                 "Driver Updater - Manual Restore Point"
             )
             if success:
-                if self.verbose_mode.get():
+                if verbose:
                     self.logger.info("✅ System restore point created successfully")
                 messagebox.showinfo(
                     "Success", "💾 System restore point created successfully!"
                 )
-                self.status_var.set("🟢 Restore point created")
+                self._set_status("🟢 Restore point created")
             else:
-                if self.verbose_mode.get():
+                if verbose:
                     self.logger.error("❌ Failed to create system restore point")
                 messagebox.showerror(
                     "Error",
                     "❌ Failed to create system restore point.\nCheck the log for details.",
                 )
-                self.status_var.set("🔴 Restore point failed")
+                self._set_status("🔴 Restore point failed")
         except Exception as e:
             self.logger.error(f"Error creating restore point: {str(e)}")
             messagebox.showerror("Error", f"❌ Error creating restore point:\n{str(e)}")
-            self.status_var.set("🔴 Restore point error")
+            self._set_status("🔴 Restore point error")
 
     def run(self):
         """Start the enhanced GUI application"""
@@ -1118,6 +1329,30 @@ class DriverUpdaterGUI:
         except Exception as e:
             self.logger.error(f"Application error: {str(e)}")
             raise
+        finally:
+            self._shutdown_workers()
+
+    def _shutdown_workers(self):
+        """Stop background work, then remove the installer's temp files"""
+        # Don't start queued work once the window is gone, but give running
+        # downloads and installs a moment to finish
+        self._pool.shutdown(wait=False)
+        self.install_pool.shutdown(wait=False)
+        running = self._pool.cancel_pending() + self.install_pool.cancel_pending()
+        _, still_running = wait(running, timeout=SHUTDOWN_TIMEOUT)
+
+        if still_running:
+            # The temp dir is still in use, so leave it. Exiting here skips the
+            # interpreter's join of the pool threads, which would keep the
+            # process alive with no window until they finished
+            self.logger.warning(
+                "Exiting with %d background tasks still running", len(still_running)
+            )
+            self.logger.close()
+            os._exit(0)
+
+        # Remove downloads and backups now rather than leaving it to GC
+        self.installer.cleanup()
 
 
 def main():
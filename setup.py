@@ -3,11 +3,20 @@ Setup script for Windows Driver Updater
 Handles initial configuration and dependency verification
 """
 
+import importlib
+import importlib.metadata
 import json
 import os
 import subprocess
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Marker file written once the working directories have been created
+SETUP_MARKER = ".setup_done"
+
+# Oldest pip major version run in-process rather than as a subprocess
+MIN_INPROCESS_PIP = 20
 
 
 def check_python_version():
@@ -27,66 +36,106 @@ def check_windows_version():
     return True
 
 
+def load_pip_main():
+    """Return pip's in-process entry point, or None if it is not usable"""
+    try:
+        # pip._internal is not a public API; only trust the layout of
+        # releases that have pip._internal.cli.main
+        if int(importlib.metadata.version("pip").split(".")[0]) < MIN_INPROCESS_PIP:
+            return None
+        from pip._internal.cli.main import main as pip_main
+
+        return pip_main
+    except (ImportError, ValueError, importlib.metadata.PackageNotFoundError):
+        return None
+
+
+def run_pip(*args, in_process=True):
+    """Run a pip command in this interpreter, or in a subprocess as a fallback"""
+    pip_main = load_pip_main() if in_process else None
+    if pip_main is None:
+        subprocess.check_call([sys.executable, "-m", "pip", *args])
+        return
+
+    returncode = pip_main(list(args))
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, ["pip", *args])
+
+
+def configure_pywin32():
+    """Run the pywin32 post-install step"""
+    try:
+        print("Configuring pywin32...")
+        subprocess.check_call([sys.executable, "-m", "pywin32_postinstall", "-install"])
+    except subprocess.CalledProcessError:
+        print("Warning: pywin32 configuration may have failed, but continuing...")
+
+
 def install_dependencies():
     """Install required Python packages"""
     try:
         print("Installing dependencies...")
 
-        # Upgrade pip first
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "--upgrade", "pip"]
-        )
+        # Upgrade pip first; this replaces pip's own files, so it runs out of
+        # process and the install below loads the upgraded pip
+        run_pip("install", "--upgrade", "pip", in_process=False)
 
         # Install requirements
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
-        )
-
-        # Configure pywin32 after installation
-        try:
-            print("Configuring pywin32...")
-            subprocess.check_call(
-                [sys.executable, "-m", "pywin32_postinstall", "-install"]
-            )
-        except subprocess.CalledProcessError:
-            print("Warning: pywin32 configuration may have failed, but continuing...")
-
-        print("Dependencies installed successfully!")
-        return True
+        run_pip("install", "-r", "requirements.txt")
+        # Let the import checks below see the newly installed packages
+        importlib.invalidate_caches()
 
     except subprocess.CalledProcessError as e:
         print(f"ERROR: Failed to install dependencies: {e}")
         return False
 
+    # win32api only imports once the pywin32 post-install has run
+    configure_pywin32()
+    if not verify_dependencies():
+        print("ERROR: Dependencies still missing after installation")
+        return False
+
+    print("Dependencies installed successfully!")
+    return True
+
+
+def can_import(module_name):
+    """Check whether a module imports cleanly"""
+    try:
+        importlib.import_module(module_name)
+        return True
+    except ImportError:
+        return False
+
 
 def verify_dependencies():
     """Verify all required modules can be imported"""
+    # Package name and the module it provides
     required_modules = [
-        "tkinter",
-        "requests",
-        "psutil",
-        "wmi",
-        "win32api",
-        "beautifulsoup4",
-        "packaging",
+        ("tkinter", "tkinter"),
+        ("requests", "requests"),
+        ("psutil", "psutil"),
+        ("wmi", "wmi"),
+        ("win32api", "win32api"),
+        ("beautifulsoup4", "bs4"),
+        ("packaging", "packaging"),
     ]
 
+    # Import in parallel, report in the listed order
+    with ThreadPoolExecutor(max_workers=len(required_modules)) as executor:
+        results = {
+            package: executor.submit(can_import, module)
+            for package, module in required_modules
+        }
+
     missing_modules = []
 
-    for module in required_modules:
-        try:
-            if module == "beautifulsoup4":
-                import bs4
-            elif module == "wmi":
-                import wmi  # Try lowercase first
-            elif module == "win32api":
-                import win32api
-            else:
-                __import__(module)
-            print(f"  ✓ {module}")
-        except ImportError:
-            missing_modules.append(module)
-            print(f"  ✗ {module}")
+    for package, future in results.items():
+        if future.result():
+            print(f"  ✓ {package}")
+        else:
+            missing_modules.append(package)
+            print(f"  ✗ {package}")
 
     if missing_modules:
         print(f"Missing modules: {', '.join(missing_modules)}")
@@ -100,11 +149,16 @@ def create_directories():
     """Create necessary directories"""
     directories = ["logs", "temp", "backups", "downloads"]
 
+    # The marker only short-cuts setup while every directory is still there
+    if os.path.exists(SETUP_MARKER) and all(map(os.path.isdir, directories)):
+        return
+
     for directory in directories:
-        dir_path = Path(directory)
-        dir_path.mkdir(exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
         print(f"Created directory: {directory}")
 
+    open(SETUP_MARKER, "w").close()
+
 
 def load_config():
     """Load and validate configuration"""
@@ -120,12 +174,18 @@ def load_config():
         return None
 
 
+@lru_cache(maxsize=1)
+def _is_user_admin():
+    """Check the process token once; elevation cannot change while running"""
+    import ctypes
+
+    return bool(ctypes.windll.shell32.IsUserAnAdmin())
+
+
 def check_admin_privileges():
     """Check if running with admin privileges"""
     try:
-        import ctypes
-
-        is_admin = ctypes.windll.shell32.IsUserAnAdmin()
+        is_admin = _is_user_admin()
 
         if is_admin:
             print("Running with administrator privileges ✓")
@@ -166,14 +226,10 @@ def main():
     # Install/verify dependencies
     if not verify_dependencies():
         print("\nInstalling missing dependencies...")
+        # Installation verifies the dependencies again once pip is done
         if not install_dependencies():
             return False
 
-        # Verify again after installation
-        if not verify_dependencies():
-            print("ERROR: Dependencies still missing after installation")
-            return False
-
     print("\n" + "=" * 40)
     print("Setup completed successfully!")
     print("\nYou can now run the application using:")
@@ -3,6 +3,7 @@ Test script for Windows Driver Updater
 Performs basic functionality tests without making system changes
 """
 
+import importlib.util
 import os
 import sys
 import traceback
@@ -16,61 +17,22 @@ def test_imports():
     """Test all required imports"""
     print("Testing imports...")
 
-    try:
-        import tkinter
-
-        print("  ✓ tkinter")
-    except ImportError as e:
-        print(f"  ✗ tkinter: {e}")
-        return False
-
-    try:
-        import requests
-
-        print("  ✓ requests")
-    except ImportError as e:
-        print(f"  ✗ requests: {e}")
-        return False
-
-    try:
-        import psutil
-
-        print("  ✓ psutil")
-    except ImportError as e:
-        print(f"  ✗ psutil: {e}")
-        return False
-
-    try:
-        import wmi
-
-        print("  ✓ wmi")
-    except ImportError as e:
-        print(f"  ✗ wmi: {e}")
-        return False
-
-    try:
-        import win32api
-
-        print("  ✓ win32api")
-    except ImportError as e:
-        print(f"  ✗ win32api: {e}")
-        return False
-
-    try:
-        from bs4 import BeautifulSoup
-
-        print("  ✓ beautifulsoup4")
-    except ImportError as e:
-        print(f"  ✗ beautifulsoup4: {e}")
-        return False
-
-    try:
-        from packaging import version
+    # Only locate each module; importing wmi would start COM here
+    required_modules = [
+        ("tkinter", "tkinter"),
+        ("requests", "requests"),
+        ("psutil", "psutil"),
+        ("wmi", "wmi"),
+        ("win32api", "win32api"),
+        ("beautifulsoup4", "bs4"),
+        ("packaging", "packaging"),
+    ]
 
-        print("  ✓ packaging")
-    except ImportError as e:
-        print(f"  ✗ packaging: {e}")
-        return False
+    for package, module in required_modules:
+        if importlib.util.find_spec(module) is None:
+            print(f"  ✗ {package}: module '{module}' not found")
+            return False
+        print(f"  ✓ {package}")
 
     return True
 
@@ -120,8 +82,8 @@ def test_modules():
     try:
         from driver_installer import DriverInstaller
 
-        installer = DriverInstaller(logger)
-        print("  ✓ DriverInstaller")
+        with DriverInstaller(logger):
+            print("  ✓ DriverInstaller")
     except Exception as e:
         print(f"  ✗ DriverInstaller: {e}")
         return False
@@ -218,6 +180,48 @@ def test_gui_creation():
         return False
 
 
+def test_driver_download():
+    """Test the streamed driver download against a fake response"""
+    print("\nTesting driver download...")
+
+    try:
+        from unittest import mock
+
+        from driver_installer import DriverInstaller
+        from utils.logger import Logger
+
+        payload = b"driver" * 1024
+        response = mock.Mock(headers={"content-length": str(len(payload))})
+        response.iter_content.return_value = [payload[:4096], payload[4096:]]
+
+        update = {
+            "device_name": "Test Device",
+            "manufacturer": "Test",
+            "new_version": "1.2.3.4",
+            "download_url": "https://example.com/driver.exe",
+        }
+
+        with DriverInstaller(Logger()) as installer:
+            installer.session = mock.Mock()
+            installer.session.get.return_value = response
+
+            file_path = installer._download_driver_interactive(update)
+            if not file_path:
+                print("  ✗ Download returned no file")
+                return False
+            with open(file_path, "rb") as f:
+                if f.read() != payload:
+                    print("  ✗ Downloaded file content does not match")
+                    return False
+
+        print(f"  ✓ Downloaded {os.path.basename(file_path)}")
+        return True
+
+    except Exception as e:
+        print(f"  ✗ Driver download failed: {e}")
+        return False
+
+
 def test_wmi_connection():
     """Test WMI connection"""
     print("\nTesting WMI connection...")
@@ -246,12 +250,17 @@ def main():
     print("Windows Driver Updater - Test Suite")
     print("=" * 40)
 
+    # Run in order on the main thread: the GUI test needs Tk's thread and the
+    # WMI test its own COM apartment, and the output reads top to bottom.
+    # CPU-heavy checks (parsing or hashing driver catalogs) belong in a
+    # ProcessPoolExecutor, since worker threads would not speed them up
     tests = [
         ("Imports", test_imports),
         ("Directory Structure", test_directories),
         ("Configuration", test_config),
         ("Custom Modules", test_modules),
         ("GUI Creation", test_gui_creation),
+        ("Driver Download", test_driver_download),
         ("WMI Connection", test_wmi_connection),
     ]
 
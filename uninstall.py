@@ -3,12 +3,75 @@ Uninstaller for Windows Driver Updater
 Removes application files and cleans up system
 """
 
+import fnmatch
 import os
 import shutil
+import stat
 import sys
 import winreg
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Directory trees are deleted in parallel; this is I/O, not CPU, bound
+REMOVE_WORKERS = (os.cpu_count() or 1) * 2
+
+# Lowercased substring identifying the application's processes
+PROCESS_NAME = "driverupdater"
+
+
+def _fast_rmtree(path):
+    """Delete a directory tree with one scandir pass per level
+
+    Returns False if the directory does not exist.
+    """
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        return False
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Junctions and directory links are removed, not followed
+                attributes = getattr(
+                    entry.stat(follow_symlinks=False), "st_file_attributes", 0
+                )
+                if attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                    os.rmdir(entry.path)
+                else:
+                    _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+    os.rmdir(path)
+    return True
+
+
+def _remove_path(path):
+    """Delete a file or directory tree; return False if it did not exist"""
+    try:
+        return _fast_rmtree(path)
+    except NotADirectoryError:
+        pass
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _remove_paths(paths):
+    """Delete paths in parallel and report each one in the given order"""
+    with ThreadPoolExecutor(max_workers=REMOVE_WORKERS) as executor:
+        futures = [(path, executor.submit(_remove_path, path)) for path in paths]
+
+    for path, future in futures:
+        try:
+            if future.result():
+                print(f"  ✓ Removed: {path}")
+        except Exception as e:
+            print(f"  ✗ Failed to remove {path}: {e}")
+
 
 def remove_registry_entries():
     """Remove registry entries created by the application"""
@@ -50,9 +113,10 @@ def remove_shortcuts():
 
     for shortcut in shortcuts:
         try:
-            if os.path.exists(shortcut):
-                os.remove(shortcut)
-                print(f"  ✓ Removed: {shortcut}")
+            os.remove(shortcut)
+            print(f"  ✓ Removed: {shortcut}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"  ✗ Failed to remove {shortcut}: {e}")
 
@@ -67,37 +131,28 @@ def remove_application_data():
         os.path.expanduser("~/Documents/DriverUpdater"),
     ]
 
-    for data_dir in data_dirs:
-        try:
-            if os.path.exists(data_dir):
-                shutil.rmtree(data_dir)
-                print(f"  ✓ Removed: {data_dir}")
-        except Exception as e:
-            print(f"  ✗ Failed to remove {data_dir}: {e}")
+    _remove_paths(data_dirs)
 
 
 def remove_temp_files():
     """Remove temporary files"""
     print("Removing temporary files...")
 
-    temp_dirs = [
-        os.path.expandvars("%TEMP%\\DriverUpdater"),
-        os.path.expandvars("%TEMP%\\driver_updater_*"),
-    ]
+    temp_root = os.path.expandvars("%TEMP%")
+    temp_paths = [os.path.join(temp_root, "DriverUpdater")]
 
-    for temp_pattern in temp_dirs:
-        try:
-            import glob
-
-            for temp_dir in glob.glob(temp_pattern):
-                if os.path.exists(temp_dir):
-                    if os.path.isdir(temp_dir):
-                        shutil.rmtree(temp_dir)
-                    else:
-                        os.remove(temp_dir)
-                    print(f"  ✓ Removed: {temp_dir}")
-        except Exception as e:
-            print(f"  ✗ Failed to remove temp files: {e}")
+    # One listing of %TEMP% finds the per-run driver_updater_* directories
+    try:
+        with os.scandir(temp_root) as entries:
+            temp_paths.extend(
+                entry.path
+                for entry in entries
+                if fnmatch.fnmatch(entry.name, "driver_updater_*")
+            )
+    except OSError as e:
+        print(f"  ✗ Failed to list temp files: {e}")
+
+    _remove_paths(temp_paths)
 
 
 def remove_installation_directory():
@@ -139,15 +194,16 @@ def stop_running_processes():
         import psutil
 
         processes_killed = 0
-        for proc in psutil.process_iter(["pid", "name", "exe"]):
+        # Only the name is needed to match, so skip resolving each exe path
+        for proc in psutil.process_iter(["pid", "name"]):
+            name = proc.info["name"]
+            if not name or PROCESS_NAME not in name.lower():
+                continue
             try:
-                if proc.info["name"] and "driverupdater" in proc.info["name"].lower():
-                    proc.terminate()
-                    proc.wait(timeout=5)
-                    processes_killed += 1
-                    print(
-                        f"  ✓ Stopped process: {proc.info['name']} (PID: {proc.info['pid']})"
-                    )
+                proc.terminate()
+                proc.wait(timeout=5)
+                processes_killed += 1
+                print(f"  ✓ Stopped process: {name} (PID: {proc.info['pid']})")
             except (psutil.NoSuchProcess, psutil.TimeoutExpired):
                 pass
 
@@ -1,20 +1,105 @@
 import json
+import os
+import random
 import re
+import shutil
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
-from packaging import version
+from requests.adapters import HTTPAdapter
+
+# Results of earlier checks, keyed by device and installed version, so a
+# re-run within UPDATE_CACHE_TTL does not contact the manufacturer again
+UPDATE_CACHE_PATH = os.path.expandvars(
+    "%LOCALAPPDATA%\\DriverUpdater\\update_cache.json"
+)
+UPDATE_CACHE_TTL = 24 * 60 * 60
+
+# Update checks are independent HTTP round-trips and run in parallel
+UPDATE_CHECK_WORKERS = 16
+# At most this many of those checks talk to any one manufacturer host at once
+HOST_CONCURRENCY = 4
+# Minimum spacing in seconds between checks started against one host
+HOST_MIN_INTERVAL = 0.5
+# Drivers from one manufacturer are checked in batches of up to this size
+UPDATE_BATCH_SIZE = 25
+
+# Read size when streaming a driver download to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Drives the simulated Microsoft and generic update results
+_RNG = random.Random()
+
+# NVIDIA product lines recognised in device names
+_NVIDIA_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"geforce\s+(rtx|gtx)\s+(\d+)", r"quadro\s+(\w+)", r"tesla\s+(\w+)")
+]
+# Vendor and device IDs in a PCI hardware ID, e.g. PCI\VEN_10DE&DEV_1234&...
+_HWID_RE = re.compile(r"VEN_([0-9A-F]{4})&DEV_([0-9A-F]{4})", re.IGNORECASE)
+# Download sizes such as "500 MB"
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(KB|MB|GB)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
+def _parse_version_tuple(version_string: str) -> tuple:
+    """Split a dotted numeric version such as 31.0.15.3623 into ints"""
+    return tuple(int(part) for part in version_string.split("."))
+
+
+@lru_cache(maxsize=2048)
+def _version_key(version_string: str) -> tuple:
+    """Comparable form of a Windows A.B.C.D driver version; missing parts are 0"""
+    parts = _parse_version_tuple(version_string)
+    return parts + (0,) * (4 - len(parts))
 
 
 class UpdateChecker:
     """Class to check for driver updates from manufacturer websites"""
 
-    def __init__(self, logger):
+    # Manufacturer-specific update checkers, by method name
+    _UPDATE_CHECKERS = {
+        "nvidia": "_check_nvidia_updates",
+        "amd": "_check_amd_updates",
+        "intel": "_check_intel_updates",
+        "realtek": "_check_realtek_updates",
+        "microsoft": "_check_microsoft_updates",
+        "generic": "_check_generic_updates",
+    }
+
+    # Common manufacturer URLs
+    MANUFACTURER_URLS = {
+        "nvidia": "https://www.nvidia.com/drivers/",
+        "amd": "https://www.amd.com/support/",
+        "intel": "https://downloadcenter.intel.com/",
+        "realtek": "https://www.realtek.com/downloads/",
+        "microsoft": "https://catalog.update.microsoft.com/",
+    }
+
+    # One pattern naming every checker key, so a driver is routed with a
+    # single scan of its manufacturer and device name
+    _MFG_RE = re.compile(
+        "|".join(f"(?P<{key}>{re.escape(key)})" for key in _UPDATE_CHECKERS),
+        re.IGNORECASE,
+    )
+
+    def __init__(self, logger, session: Optional[requests.Session] = None):
         self.logger = logger
-        self.session = requests.Session()
+        # Callers doing many downloads can share one pooled session
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=UPDATE_CHECK_WORKERS,
+                pool_maxsize=UPDATE_CHECK_WORKERS * 2,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -26,24 +111,18 @@ class UpdateChecker:
         self.verbose_mode = False
         self.progress_callback = None
 
-        # Manufacturer-specific update checkers
-        self.update_checkers = {
-            "nvidia": self._check_nvidia_updates,
-            "amd": self._check_amd_updates,
-            "intel": self._check_intel_updates,
-            "realtek": self._check_realtek_updates,
-            "microsoft": self._check_microsoft_updates,
-            "generic": self._check_generic_updates,
-        }
+        # Per-host semaphores bounding concurrent checks, created on demand
+        self._host_limits = {}
+        self._host_limits_lock = threading.Lock()
+        # Time each host's most recent check was scheduled to start
+        self._last_hit = {}
 
-        # Common manufacturer URLs
-        self.manufacturer_urls = {
-            "nvidia": "https://www.nvidia.com/drivers/",
-            "amd": "https://www.amd.com/support/",
-            "intel": "https://downloadcenter.intel.com/",
-            "realtek": "https://www.realtek.com/downloads/",
-            "microsoft": "https://catalog.update.microsoft.com/",
+        # Manufacturer-specific update checkers, bound once per instance
+        self.update_checkers = {
+            mfg_key: getattr(self, method_name)
+            for mfg_key, method_name in self._UPDATE_CHECKERS.items()
         }
+        self.manufacturer_urls = self.MANUFACTURER_URLS
 
     def set_relaxed_validation(self, enabled):
         """Enable or disable relaxed validation"""
@@ -58,10 +137,15 @@ class UpdateChecker:
         self.verbose_mode = enabled
 
     def check_for_updates(
-        self, drivers_data: List[Dict[str, Any]], progress_callback=None
+        self,
+        drivers_data: List[Dict[str, Any]],
+        progress_callback=None,
+        force_refresh=False,
     ) -> List[Dict[str, Any]]:
         """Enhanced update checking with progress callbacks"""
         self.progress_callback = progress_callback
+        cache = self._load_update_cache()
+        now = time.time()
 
         if self.verbose_mode:
             self.logger.info(
@@ -69,49 +153,80 @@ class UpdateChecker:
             )
             self.logger.info(f"Relaxed validation: {self.relaxed_validation}")
 
-        updates_available = []
-
-        for i, driver in enumerate(drivers_data):
-            try:
-                if self.progress_callback:
-                    self.progress_callback(
-                        i + 1, len(drivers_data), driver.get("device_name", "Unknown")
-                    )
-
+        total = len(drivers_data)
+        results = [None] * total
+        done = 0
+
+        # Answer what the cache can, and group the rest by manufacturer so
+        # each group is checked as a batch
+        batches = {}
+        for index, driver in enumerate(drivers_data):
+            cached = cache.get(self._cache_key(driver))
+            if (
+                not force_refresh
+                and cached
+                and now - cached.get("timestamp", 0) < UPDATE_CACHE_TTL
+            ):
+                results[index] = cached.get("update")
+                done += 1
                 if self.verbose_mode:
                     self.logger.info(
-                        f"Checking updates for driver {i+1}/{len(drivers_data)}: {driver.get('device_name', 'Unknown')}"
+                        f"Using cached result for {driver.get('device_name', 'Unknown')}"
                     )
-
-                update_info = self._check_driver_update(driver)
-                if update_info:
-                    updates_available.append(update_info)
-                    if self.verbose_mode:
-                        self.logger.info(
-                            f"  ✅ Update found: {update_info.get('new_version', 'Unknown version')}"
-                        )
-                elif self.verbose_mode:
-                    self.logger.info(f"  ℹ️ No update available")
-
-                # Reduced delay for better user experience
-                time.sleep(0.5)
-
-            except Exception as e:
-                if self.verbose_mode:
-                    self.logger.error(
-                        f"  ❌ Error checking {driver.get('device_name', 'Unknown')}: {str(e)}"
-                    )
-                else:
-                    self.logger.error(
-                        f"Error checking updates for {driver.get('device_name', 'Unknown')}: {str(e)}"
+                if self.progress_callback:
+                    self.progress_callback(
+                        done, total, driver.get("device_name", "Unknown")
                     )
-
-                # In relaxed mode, continue even with errors
-                if self.relaxed_validation:
-                    continue
-                else:
-                    # In strict mode, you might want to stop or handle differently
-                    continue
+            else:
+                mfg_key = self._resolve_manufacturer(driver)
+                batches.setdefault(mfg_key, []).append(index)
+
+        with ThreadPoolExecutor(max_workers=UPDATE_CHECK_WORKERS) as executor:
+            futures = {}
+            for mfg_key, indexes in batches.items():
+                for start in range(0, len(indexes), UPDATE_BATCH_SIZE):
+                    chunk = indexes[start : start + UPDATE_BATCH_SIZE]
+                    batch = [drivers_data[index] for index in chunk]
+                    futures[executor.submit(self._check_batch, mfg_key, batch)] = chunk
+
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    # Keep going with the remaining drivers, in relaxed and
+                    # strict mode alike
+                    self.logger.error(f"Error checking a batch of updates: {str(e)}")
+                    batch_results = [(None, False)] * len(chunk)
+
+                for index, (update_info, checked) in zip(chunk, batch_results):
+                    driver = drivers_data[index]
+                    device_name = driver.get("device_name", "Unknown")
+                    done += 1
+
+                    if self.progress_callback:
+                        self.progress_callback(done, total, device_name)
+
+                    results[index] = update_info
+                    # Only completed checks are cached, so a transient error
+                    # is retried on the next run instead of hiding updates
+                    if checked:
+                        cache[self._cache_key(driver)] = {
+                            "timestamp": now,
+                            "update": update_info,
+                        }
+                    if update_info:
+                        if self.verbose_mode:
+                            self.logger.info(
+                                f"  ✅ Update found for {device_name}: {update_info.get('new_version', 'Unknown version')}"
+                            )
+                    elif self.verbose_mode:
+                        self.logger.info(f"  ℹ️ No update available for {device_name}")
+
+        # Report updates in scan order rather than completion order
+        updates_available = [update for update in results if update]
+
+        self._save_update_cache(cache)
 
         if self.verbose_mode:
             self.logger.info(
@@ -120,28 +235,92 @@ class UpdateChecker:
 
         return updates_available
 
-    def _check_driver_update(self, driver: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Check for updates for a specific driver"""
-        manufacturer = driver.get("manufacturer", "").lower()
-        device_name = driver.get("device_name", "")
-        hardware_id = driver.get("hardware_id", "")
-        current_version = driver.get("version", "")
+    def _cache_key(self, driver: Dict[str, Any]) -> str:
+        """Key of a driver's entry in the update cache"""
+        return f"{driver.get('device_id', '')}|{driver.get('version', '')}"
+
+    def _check_batch(
+        self, mfg_key: str, drivers: List[Dict[str, Any]]
+    ) -> List[Tuple[Optional[Dict[str, Any]], bool]]:
+        """Check a batch of drivers from one manufacturer"""
+        host = urlparse(self.manufacturer_urls.get(mfg_key, "")).netloc
+        with self._host_limit(host):
+            self._wait_for_host(host)
+            results = []
+            for driver in drivers:
+                if self.verbose_mode:
+                    self.logger.info(
+                        f"Checking updates for driver: {driver.get('device_name', 'Unknown')}"
+                    )
+                results.append(self._check_driver_update(driver, mfg_key))
+
+        return results
+
+    def _wait_for_host(self, host: str):
+        """Sleep until HOST_MIN_INTERVAL has passed since the host's last check"""
+        with self._host_limits_lock:
+            now = time.monotonic()
+            start = max(now, self._last_hit.get(host, 0.0) + HOST_MIN_INTERVAL)
+            self._last_hit[host] = start
+
+        if start > now:
+            time.sleep(start - now)
+
+    def _host_limit(self, host: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent checks against a host"""
+        with self._host_limits_lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = threading.BoundedSemaphore(HOST_CONCURRENCY)
+                self._host_limits[host] = limit
+            return limit
+
+    def _load_update_cache(self) -> Dict[str, Any]:
+        """Load cached update-check results"""
+        try:
+            with open(UPDATE_CACHE_PATH, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable update cache: {str(e)}")
+            return {}
 
+    def _save_update_cache(self, cache: Dict[str, Any]):
+        """Write update-check results, replacing the cache file atomically"""
+        try:
+            os.makedirs(os.path.dirname(UPDATE_CACHE_PATH), exist_ok=True)
+            temp_path = UPDATE_CACHE_PATH + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(temp_path, UPDATE_CACHE_PATH)
+        except Exception as e:
+            self.logger.warning(f"Could not save update cache: {str(e)}")
+
+    def _resolve_manufacturer(self, driver: Dict[str, Any]) -> str:
+        """Get the update_checkers key handling a driver"""
+        text = f"{driver.get('manufacturer', '')}\n{driver.get('device_name', '')}"
+        found = {match.lastgroup for match in self._MFG_RE.finditer(text)}
+        if not found:
+            return "generic"
+
+        # Several may match; the first in _UPDATE_CHECKERS order wins
+        return next(mfg_key for mfg_key in self._UPDATE_CHECKERS if mfg_key in found)
+
+    def _check_driver_update(
+        self, driver: Dict[str, Any], mfg_key: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Check a driver; return (update or None, whether the check completed)"""
         # Determine manufacturer-specific checker
-        checker_func = None
-        for mfg_key, checker in self.update_checkers.items():
-            if mfg_key in manufacturer or mfg_key in device_name.lower():
-                checker_func = checker
-                break
-
-        if not checker_func:
-            checker_func = self.update_checkers["generic"]
+        if mfg_key is None:
+            mfg_key = self._resolve_manufacturer(driver)
+        checker_func = self.update_checkers[mfg_key]
 
         try:
-            return checker_func(driver)
+            return checker_func(driver), True
         except Exception as e:
             self.logger.error(f"Error in manufacturer-specific update check: {str(e)}")
-            return None
+            return None, False
 
     def _check_nvidia_updates(self, driver: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Check for NVIDIA driver updates"""
@@ -184,6 +363,8 @@ class UpdateChecker:
 
         except Exception as e:
             self.logger.error(f"Error checking NVIDIA updates: {str(e)}")
+            # A failed check is not "no update"; don't let it be cached
+            raise
 
         return None
 
@@ -220,6 +401,8 @@ class UpdateChecker:
 
         except Exception as e:
             self.logger.error(f"Error checking AMD updates: {str(e)}")
+            # A failed check is not "no update"; don't let it be cached
+            raise
 
         return None
 
@@ -252,6 +435,8 @@ class UpdateChecker:
 
         except Exception as e:
             self.logger.error(f"Error checking Intel updates: {str(e)}")
+            # A failed check is not "no update"; don't let it be cached
+            raise
 
         return None
 
@@ -285,6 +470,8 @@ class UpdateChecker:
 
         except Exception as e:
             self.logger.error(f"Error checking Realtek updates: {str(e)}")
+            # A failed check is not "no update"; don't let it be cached
+            raise
 
         return None
 
@@ -295,9 +482,7 @@ class UpdateChecker:
         try:
             # Would integrate with Windows Update API
             # For demo purposes, occasionally return an update
-            import random
-
-            if random.random() < 0.1:  # 10% chance of update
+            if _RNG.random() < 0.1:  # 10% chance of update
                 current_version = driver.get("version", "0.0.0.0")
                 new_version = self._generate_mock_version(current_version)
 
@@ -315,6 +500,8 @@ class UpdateChecker:
 
         except Exception as e:
             self.logger.error(f"Error checking Microsoft updates: {str(e)}")
+            # A failed check is not "no update"; don't let it be cached
+            raise
 
         return None
 
@@ -335,9 +522,7 @@ class UpdateChecker:
                     pass
 
             # For demo purposes, occasionally return an update
-            import random
-
-            if random.random() < 0.05:  # 5% chance of update
+            if _RNG.random() < 0.05:  # 5% chance of update
                 current_version = driver.get("version", "0.0.0.0")
                 new_version = self._generate_mock_version(current_version)
 
@@ -355,15 +540,17 @@ class UpdateChecker:
 
         except Exception as e:
             self.logger.error(f"Error in generic update check: {str(e)}")
+            # A failed check is not "no update"; don't let it be cached
+            raise
 
         return None
 
-    def _extract_nvidia_gpu_series(self, device_name: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _extract_nvidia_gpu_series(device_name: str) -> Optional[str]:
         """Extract NVIDIA GPU series from device name"""
-        patterns = [r"geforce\s+(rtx|gtx)\s+(\d+)", r"quadro\s+(\w+)", r"tesla\s+(\w+)"]
-
-        for pattern in patterns:
-            match = re.search(pattern, device_name, re.IGNORECASE)
+        for pattern in _NVIDIA_PATTERNS:
+            match = pattern.search(device_name)
             if match:
                 return match.group(0)
 
@@ -373,9 +560,7 @@ class UpdateChecker:
         """Parse hardware ID to extract vendor and device IDs"""
         try:
             # Example: PCI\VEN_10DE&DEV_1234&SUBSYS_...
-            match = re.search(
-                r"VEN_([0-9A-F]{4})&DEV_([0-9A-F]{4})", hardware_id, re.IGNORECASE
-            )
+            match = _HWID_RE.search(hardware_id)
             if match:
                 return match.group(1), match.group(2)
         except:
@@ -387,41 +572,26 @@ class UpdateChecker:
         """Generate a mock newer version for demonstration"""
         try:
             # Parse current version
-            parts = current_version.split(".")
+            parts = _parse_version_tuple(current_version)
             if len(parts) >= 2:
-                major = int(parts[0])
-                minor = int(parts[1])
-                build = int(parts[2]) if len(parts) > 2 else 0
-                revision = int(parts[3]) if len(parts) > 3 else 0
+                major, minor, build, revision = (parts + (0, 0))[:4]
 
                 # Increment build number
-                build += 1
-
-                return f"{major}.{minor}.{build}.{revision}"
+                return f"{major}.{minor}.{build + 1}.{revision}"
 
         except:
             pass
 
         return "1.0.0.1"
 
-    def _is_version_newer(self, new_version: str, current_version: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _is_version_newer(new_version: str, current_version: str) -> bool:
         """Compare versions to determine if new version is newer"""
         try:
-            return version.parse(new_version) > version.parse(current_version)
-        except:
-            # Fallback comparison
-            try:
-                new_parts = [int(x) for x in new_version.split(".")]
-                current_parts = [int(x) for x in current_version.split(".")]
-
-                # Pad shorter version with zeros
-                max_len = max(len(new_parts), len(current_parts))
-                new_parts.extend([0] * (max_len - len(new_parts)))
-                current_parts.extend([0] * (max_len - len(current_parts)))
-
-                return new_parts > current_parts
-            except:
-                return False
+            return _version_key(new_version) > _version_key(current_version)
+        except (ValueError, AttributeError):
+            return False
 
     def download_driver(self, update_info: Dict[str, Any], download_path: str) -> bool:
         """Download a driver update"""
@@ -435,9 +605,11 @@ class UpdateChecker:
             response = self.session.get(download_url, stream=True)
             response.raise_for_status()
 
+            # Copy in C with 1 MiB reads instead of looping over 8 KiB chunks;
+            # decode_content keeps gzip/deflate handling from iter_content
+            response.raw.decode_content = True
             with open(download_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
 
             self.logger.info(f"Driver downloaded successfully to {download_path}")
             return True
@@ -476,10 +648,12 @@ class UpdateChecker:
             self.logger.error(f"Error verifying download: {str(e)}")
             return False
 
-    def _parse_size_string(self, size_str: str) -> Optional[int]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_size_string(size_str: str) -> Optional[int]:
         """Parse size string like '500 MB' to bytes"""
         try:
-            match = re.search(r"(\d+(?:\.\d+)?)\s*(KB|MB|GB)", size_str, re.IGNORECASE)
+            match = _SIZE_RE.search(size_str)
             if match:
                 size = float(match.group(1))
                 unit = match.group(2).upper()
@@ -1,12 +1,141 @@
+import atexit
 import logging
 import os
+import queue
+import sys
+import threading
+import time
 import tkinter as tk
+from collections import deque
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+# GUI log lines are buffered and written to the widget in batches
+GUI_FLUSH_INTERVAL_MS = 100
+GUI_BUFFER_MAX_LINES = 5000
+# The widget keeps about this many lines, trimming the oldest 100 at a time
+GUI_MAX_LINES = 1000
+
+# The log file is written through a buffer this size and flushed when the
+# listener runs out of queued records, or at once for errors
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+# DEBUG records allowed through to the file per second (bursts up to this)
+DEBUG_RECORDS_PER_SECOND = 20
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to its owner, except for errors"""
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue drains"""
+
+    def dequeue(self, block):
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return super().dequeue(block)
+
+
+class RateLimitFilter(logging.Filter):
+    """Collapse repeated records and cap the rate of DEBUG records"""
+
+    def __init__(self, handler, debug_per_second=DEBUG_RECORDS_PER_SECOND):
+        super().__init__()
+        self._handler = handler
+        self._rate = debug_per_second
+        self._tokens = float(debug_per_second)
+        self._last_refill = time.monotonic()
+        self._last_key = None
+        self._last_record = None
+        self._repeat = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        key = (record.levelno, record.msg, record.args)
+        with self._lock:
+            # Identical consecutive records are counted, not written;
+            # records with a traceback are always kept
+            if record.exc_info is None and key == self._last_key:
+                self._repeat += 1
+                return False
+
+            if record.levelno == logging.DEBUG:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._rate, self._tokens + (now - self._last_refill) * self._rate
+                )
+                self._last_refill = now
+                if self._tokens < 1:
+                    return False
+                self._tokens -= 1
+
+            previous, repeat = self._last_record, self._repeat
+            self._last_key, self._last_record, self._repeat = key, record, 0
+
+        if repeat:
+            self._emit_repeat(previous, repeat)
+        return True
+
+    def flush(self):
+        """Write out the count for a record that is still repeating"""
+        with self._lock:
+            previous, repeat = self._last_record, self._repeat
+            self._last_key = self._last_record = None
+            self._repeat = 0
+        if repeat:
+            self._emit_repeat(previous, repeat)
+
+    def _emit_repeat(self, previous, repeat):
+        summary = logging.makeLogRecord(
+            {
+                "name": previous.name,
+                "levelno": previous.levelno,
+                "levelname": previous.levelname,
+                "msg": "Previous message repeated %d more times",
+                "args": (repeat,),
+            }
+        )
+        # Straight to the handler, so the summary is not filtered itself
+        self._handler.emit(summary)
 
 
 class Logger:
     """Enhanced logging utility for the Driver Updater"""
 
+    LEVEL_INDICATORS = {
+        "INFO": "ℹ️ INFO",
+        "WARNING": "⚠️ WARN",
+        "ERROR": "❌ ERROR",
+        "DEBUG": "🔍 DEBUG",
+        "SUCCESS": "✅ SUCCESS",
+    }
+    _LEVEL_PREFIXES = {
+        level: f"{text}: " for level, text in LEVEL_INDICATORS.items()
+    }
+
     def __init__(self, log_level=logging.INFO):
         self.logger = logging.getLogger("DriverUpdater")
         self.logger.setLevel(log_level)
@@ -34,19 +163,39 @@ class Logger:
         console_formatter = logging.Formatter("%(levelname)s: %(message)s")
 
         # File handler
-        file_handler = logging.FileHandler(self.log_file_path, encoding="utf-8")
+        file_handler = BufferedFileHandler(self.log_file_path, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
 
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+
+        # Callers only enqueue records; a listener thread does the writing
+        self._queue = queue.Queue(-1)
+        queue_handler = QueueHandler(self._queue)
+        self._rate_filter = RateLimitFilter(queue_handler)
+        queue_handler.addFilter(self._rate_filter)
+        self.logger.addHandler(queue_handler)
+
+        # Bound once, since the wrappers below run for every message
+        self._debug = self.logger.debug
+        self._info = self.logger.info
+        self._warning = self.logger.warning
+        self._error = self.logger.error
+        self._critical = self.logger.critical
+        self._exception = self.logger.exception
+        self._listener = FlushingQueueListener(
+            self._queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.close)
 
         # GUI handler placeholder
         self.gui_text_widget = None
+        self._gui_pending = deque(maxlen=GUI_BUFFER_MAX_LINES)
+        self._gui_lock = threading.Lock()
 
         self.info("Logger initialized")
 
@@ -54,6 +203,8 @@ class Logger:
         """Add GUI text widget for log display with enhanced formatting"""
         self.gui_text_widget = text_widget
         self.auto_scroll_var = auto_scroll_var
+        # Lines written to the widget, so trimming needs no read-back
+        self._gui_line_count = 0
 
         # Configure text widget for better appearance
         if hasattr(text_widget, "tag_configure"):
@@ -77,78 +228,117 @@ class Logger:
             )
 
         self.info("Enhanced GUI log handler added")
+        self._flush_gui()
 
-    def _write_to_gui(self, level, message):
-        """Write formatted message to GUI with color coding"""
+    def _write_to_gui(self, level, message, args=()):
+        """Queue a message for the GUI; _flush_gui writes it on the Tk thread"""
         if self.gui_text_widget:
-            try:
-                timestamp = datetime.now().strftime("%H:%M:%S")
-
-                # Insert timestamp
-                self.gui_text_widget.insert(tk.END, f"[{timestamp}] ", "TIMESTAMP")
+            # The timestamp and %-style args are formatted at flush time
+            created = time.time()
+            with self._gui_lock:
+                self._gui_pending.append((created, level, message, args))
 
-                # Insert level indicator with emoji
-                level_indicators = {
-                    "INFO": "ℹ️ INFO",
-                    "WARNING": "⚠️ WARN",
-                    "ERROR": "❌ ERROR",
-                    "DEBUG": "🔍 DEBUG",
-                    "SUCCESS": "✅ SUCCESS",
-                }
+    def _flush_gui(self):
+        """Write queued messages to the GUI with color coding"""
+        with self._gui_lock:
+            batch = list(self._gui_pending)
+            self._gui_pending.clear()
 
-                level_text = level_indicators.get(level, level)
-                self.gui_text_widget.insert(tk.END, f"{level_text}: ", level)
-
-                # Insert message
-                self.gui_text_widget.insert(tk.END, f"{message}\n")
+        try:
+            if batch:
+                prefixes = self._LEVEL_PREFIXES
+
+                # One insert call for the whole batch, as (text, tag) pairs
+                chunks = []
+                # Records arrive in bursts; format each second's time once
+                second = stamp = None
+                for created, level, message, args in batch:
+                    if int(created) != second:
+                        second = int(created)
+                        stamp = time.strftime("[%H:%M:%S] ", time.localtime(second))
+                    if args:
+                        message = message % args
+                    self._gui_line_count += message.count("\n") + 1
+                    prefix = prefixes.get(level) or f"{level}: "
+                    chunks.extend(
+                        (
+                            stamp,
+                            "TIMESTAMP",
+                            prefix,
+                            level,
+                            f"{message}\n",
+                            (),
+                        )
+                    )
+                self.gui_text_widget.insert(tk.END, *chunks)
 
                 # Auto-scroll if enabled
                 if self.auto_scroll_var and self.auto_scroll_var.get():
-                    self.gui_text_widget.see(
-                        tk.END
-                    )  # Limit text widget size (keep last 1000 lines)
-                lines = self.gui_text_widget.get("1.0", tk.END).split("\n")
-                if len(lines) > 1000:
-                    # Remove first 100 lines
-                    self.gui_text_widget.delete("1.0", f"{100}.0")
-
-            except Exception as e:
-                # Fallback to basic logging if GUI update fails
-                pass
-
-    def debug(self, message):
+                    self.gui_text_widget.see(tk.END)
+
+                # Limit text widget size (keep last GUI_MAX_LINES lines)
+                if self._gui_line_count > GUI_MAX_LINES:
+                    # Remove the oldest lines, leaving room for 100 more;
+                    # a batch can add more than 100 at once
+                    excess = self._gui_line_count - (GUI_MAX_LINES - 100)
+                    self.gui_text_widget.delete("1.0", f"{excess + 1}.0")
+                    self._gui_line_count -= excess
+        except Exception as e:
+            # The records are already in the log file; report the failure
+            # where there is a console (the windowed exe has no stderr)
+            if sys.stderr:
+                sys.stderr.write(f"GUI log update failed: {e!r}\n")
+        finally:
+            self.gui_text_widget.after(GUI_FLUSH_INTERVAL_MS, self._flush_gui)
+
+    def clear_gui(self):
+        """Clear the GUI log display"""
+        if self.gui_text_widget:
+            self.gui_text_widget.delete("1.0", tk.END)
+            self._gui_line_count = 0
+
+    def debug(self, message, *args):
         """Log debug message"""
-        self.logger.debug(message)
+        self._debug(message, *args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """Log info message"""
-        self.logger.info(message)
-        self._write_to_gui("INFO", message)
+        self._info(message, *args)
+        self._write_to_gui("INFO", message, args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning message"""
-        self.logger.warning(message)
-        self._write_to_gui("WARNING", message)
+        self._warning(message, *args)
+        self._write_to_gui("WARNING", message, args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """Log error message"""
-        self.logger.error(message)
-        self._write_to_gui("ERROR", message)
+        self._error(message, *args)
+        self._write_to_gui("ERROR", message, args)
 
-    def success(self, message):
+    def success(self, message, *args):
         """Log success message (custom level)"""
-        self.logger.info(message)
-        self._write_to_gui("SUCCESS", message)
+        self._info(message, *args)
+        self._write_to_gui("SUCCESS", message, args)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """Log critical message"""
-        self.logger.critical(message)
-        self._write_to_gui("ERROR", message)
+        self._critical(message, *args)
+        self._write_to_gui("ERROR", message, args)
 
-    def exception(self, message):
+    def exception(self, message, *args):
         """Log exception with traceback"""
-        self.logger.exception(message)
-        self._write_to_gui(f"EXCEPTION: {message}")
+        self._exception(message, *args)
+        self._write_to_gui("ERROR", f"EXCEPTION: {message}", args)
+
+    def close(self):
+        """Write out queued records and stop the listener thread"""
+        if self._listener is not None:
+            self._rate_filter.flush()
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
 
     def get_log_file_path(self):
         """Get the current log file path"""
@@ -168,17 +358,22 @@ class Logger:
     def clean_old_logs(self, keep_days=30):
         """Clean up log files older than specified days"""
         try:
-            import time
-
             cutoff_time = time.time() - (keep_days * 24 * 60 * 60)
 
             cleaned_count = 0
-            for log_file in self.get_all_log_files():
-                if os.path.getmtime(log_file) < cutoff_time:
+            # One directory pass; DirEntry.stat() saves a second lookup per file
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (
+                        name.startswith("driver_updater_") and name.endswith(".log")
+                    ):
+                        continue
                     try:
-                        os.remove(log_file)
-                        cleaned_count += 1
-                    except:
+                        if entry.stat().st_mtime < cutoff_time:
+                            os.remove(entry.path)
+                            cleaned_count += 1
+                    except OSError:
                         pass
 
             if cleaned_count > 0:
@@ -193,11 +388,5 @@ class Logger:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         session_start = f"NEW SESSION STARTED: {timestamp}"
 
-        self.logger.info(separator)
-        self.logger.info(session_start)
-        self.logger.info(separator)
-
-        if self.gui_text_widget:
-            self._write_to_gui(separator)
-            self._write_to_gui(session_start)
-            self._write_to_gui(separator)
+        # One multi-line record, so the banner is written in a single piece
+        self.info("%s\n%s\n%s", separator, session_start, separator)
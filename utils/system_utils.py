@@ -1,11 +1,98 @@
+import csv
 import ctypes
+import io
+import json
 import os
+import platform
 import subprocess
 import sys
 import winreg
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
 
+# Operating system, computer and first processor details as one JSON object
+SYSTEM_INFO_SCRIPT = (
+    "@{"
+    "os = Get-CimInstance Win32_OperatingSystem"
+    " | Select-Object Caption, Version, BuildNumber, OSArchitecture; "
+    "cs = Get-CimInstance Win32_ComputerSystem"
+    " | Select-Object Manufacturer, Model, TotalPhysicalMemory; "
+    "cpu = Get-CimInstance Win32_Processor"
+    " | Select-Object -First 1 Name, Manufacturer, MaxClockSpeed"
+    "} | ConvertTo-Json -Compress"
+)
+
+# Registry keys that exist only while a reboot is pending
+REBOOT_PENDING_KEYS = (
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\WindowsUpdate\Auto Update\RebootRequired",
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Component Based Servicing\RebootPending",
+)
+
+# File moves queued for the next boot; the value is a REG_MULTI_SZ
+SESSION_MANAGER_KEY = r"SYSTEM\CurrentControlSet\Control\Session Manager"
+PENDING_RENAMES_VALUE = "PendingFileRenameOperations"
+RRF_RT_ANY = 0x0000FFFF
+# An empty REG_MULTI_SZ is at most two UTF-16 nulls
+EMPTY_MULTI_SZ_BYTES = 4
+
+
+def _cim_text(value) -> str:
+    """Render a CIM property as the stripped text wmic used to print"""
+    return "" if value is None else str(value).strip()
+
+
+@lru_cache(maxsize=1)
+def _is_user_admin() -> bool:
+    """Check the process token once; elevation cannot change while running"""
+    try:
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _is_windows_10_or_later() -> bool:
+    """Check the OS build once; it cannot change while running"""
+    try:
+        version = platform.version()
+        # Windows 10 build numbers start from 10240
+        build_number = int(version.split(".")[-1])
+        return build_number >= 10240
+    except:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _disk_free_space_func():
+    """Look up GetDiskFreeSpaceExW once and declare its prototype"""
+    func = ctypes.windll.kernel32.GetDiskFreeSpaceExW
+    func.argtypes = [
+        ctypes.c_wchar_p,
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+@lru_cache(maxsize=1)
+def _reg_get_value_func():
+    """Look up RegGetValueW once and declare its prototype"""
+    func = ctypes.windll.advapi32.RegGetValueW
+    func.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_wchar_p,
+        ctypes.c_wchar_p,
+        ctypes.c_ulong,
+        ctypes.POINTER(ctypes.c_ulong),
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_ulong),
+    ]
+    func.restype = ctypes.c_long
+    return func
+
 
 class SystemUtils:
     """System utility functions for Windows"""
@@ -15,10 +102,7 @@ class SystemUtils:
 
     def is_admin(self) -> bool:
         """Check if running with administrator privileges"""
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
+        return _is_user_admin()
 
     def elevate_privileges(self):
         """Restart application with administrator privileges"""
@@ -38,6 +122,10 @@ class SystemUtils:
         self, description: str = "Driver Updater Checkpoint"
     ) -> bool:
         """Create a system restore point"""
+        if not self.is_admin():
+            self.logger.error("Administrator privileges are required to create a restore point")
+            return False
+
         try:
             self.logger.info(f"Creating system restore point: {description}")
 
@@ -73,89 +161,34 @@ class SystemUtils:
         try:
             info = {}
 
-            # Operating System info
+            # Operating system, computer and processor info in one query
             result = subprocess.run(
-                [
-                    "wmic",
-                    "os",
-                    "get",
-                    "Caption,Version,BuildNumber,Architecture",
-                    "/format:csv",
-                ],
+                ["powershell", "-NoProfile", "-Command", SYSTEM_INFO_SCRIPT],
                 capture_output=True,
                 text=True,
                 creationflags=subprocess.CREATE_NO_WINDOW,
             )
 
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                if len(lines) > 1:
-                    # Parse CSV output (skip header)
-                    for line in lines[1:]:
-                        if line.strip():
-                            fields = line.split(",")
-                            if len(fields) >= 5:
-                                info["os_architecture"] = fields[1].strip()
-                                info["os_build"] = fields[2].strip()
-                                info["os_name"] = fields[3].strip()
-                                info["os_version"] = fields[4].strip()
-                                break
-
-            # Computer info
-            result = subprocess.run(
-                [
-                    "wmic",
-                    "computersystem",
-                    "get",
-                    "TotalPhysicalMemory,Manufacturer,Model",
-                    "/format:csv",
-                ],
-                capture_output=True,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
+            if result.returncode == 0 and result.stdout.strip():
+                data = json.loads(result.stdout)
 
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                if len(lines) > 1:
-                    for line in lines[1:]:
-                        if line.strip():
-                            fields = line.split(",")
-                            if len(fields) >= 4:
-                                info["manufacturer"] = fields[1].strip()
-                                info["model"] = fields[2].strip()
-                                memory_bytes = fields[3].strip()
-                                if memory_bytes.isdigit():
-                                    info["total_memory_gb"] = round(
-                                        int(memory_bytes) / (1024**3), 2
-                                    )
-                                break
-
-            # Processor info
-            result = subprocess.run(
-                [
-                    "wmic",
-                    "cpu",
-                    "get",
-                    "Name,Manufacturer,MaxClockSpeed",
-                    "/format:csv",
-                ],
-                capture_output=True,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
+                os_info = data.get("os") or {}
+                info["os_architecture"] = _cim_text(os_info.get("OSArchitecture"))
+                info["os_build"] = _cim_text(os_info.get("BuildNumber"))
+                info["os_name"] = _cim_text(os_info.get("Caption"))
+                info["os_version"] = _cim_text(os_info.get("Version"))
 
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                if len(lines) > 1:
-                    for line in lines[1:]:
-                        if line.strip():
-                            fields = line.split(",")
-                            if len(fields) >= 4:
-                                info["cpu_manufacturer"] = fields[1].strip()
-                                info["cpu_max_speed"] = fields[2].strip()
-                                info["cpu_name"] = fields[3].strip()
-                                break
+                computer_info = data.get("cs") or {}
+                info["manufacturer"] = _cim_text(computer_info.get("Manufacturer"))
+                info["model"] = _cim_text(computer_info.get("Model"))
+                memory_bytes = computer_info.get("TotalPhysicalMemory")
+                if memory_bytes:
+                    info["total_memory_gb"] = round(int(memory_bytes) / (1024**3), 2)
+
+                cpu_info = data.get("cpu") or {}
+                info["cpu_manufacturer"] = _cim_text(cpu_info.get("Manufacturer"))
+                info["cpu_max_speed"] = _cim_text(cpu_info.get("MaxClockSpeed"))
+                info["cpu_name"] = _cim_text(cpu_info.get("Name"))
 
             return info
 
@@ -166,45 +199,28 @@ class SystemUtils:
     def check_pending_reboot(self) -> bool:
         """Check if system has pending reboot"""
         try:
-            # Check various registry locations for pending reboot
-            reboot_required = False
-
-            # Check Windows Update reboot required
-            try:
-                key = winreg.OpenKey(
-                    winreg.HKEY_LOCAL_MACHINE,
-                    r"SOFTWARE\Microsoft\Windows\CurrentVersion\WindowsUpdate\Auto Update\RebootRequired",
-                )
-                winreg.CloseKey(key)
-                reboot_required = True
-            except FileNotFoundError:
-                pass
-
-            # Check Component Based Servicing reboot required
-            try:
-                key = winreg.OpenKey(
-                    winreg.HKEY_LOCAL_MACHINE,
-                    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Component Based Servicing\RebootPending",
-                )
-                winreg.CloseKey(key)
-                reboot_required = True
-            except FileNotFoundError:
-                pass
-
-            # Check Session Manager reboot required
-            try:
-                key = winreg.OpenKey(
-                    winreg.HKEY_LOCAL_MACHINE,
-                    r"SYSTEM\CurrentControlSet\Control\Session Manager",
-                )
-                value, _ = winreg.QueryValueEx(key, "PendingFileRenameOperations")
-                winreg.CloseKey(key)
-                if value:
-                    reboot_required = True
-            except (FileNotFoundError, OSError):
-                pass
-
-            return reboot_required
+            # Windows Update and Component Based Servicing create these keys
+            # while a reboot is required
+            for path in REBOOT_PENDING_KEYS:
+                try:
+                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path):
+                        return True
+                except FileNotFoundError:
+                    pass
+
+            # Check Session Manager reboot required. Only the size of the
+            # value is needed, and RegGetValueW gets it without opening the key
+            size = ctypes.c_ulong(0)
+            status = _reg_get_value_func()(
+                winreg.HKEY_LOCAL_MACHINE,
+                SESSION_MANAGER_KEY,
+                PENDING_RENAMES_VALUE,
+                RRF_RT_ANY,
+                None,
+                None,
+                ctypes.byref(size),
+            )
+            return status == 0 and size.value > EMPTY_MULTI_SZ_BYTES
 
         except Exception as e:
             self.logger.error(f"Error checking pending reboot: {str(e)}")
@@ -213,16 +229,18 @@ class SystemUtils:
     def get_windows_version(self) -> str:
         """Get Windows version string"""
         try:
-            result = subprocess.run(
-                ["ver"],
-                capture_output=True,
-                text=True,
-                shell=True,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-
-            if result.returncode == 0:
-                return result.stdout.strip()
+            # Same text `ver` prints, without starting cmd.exe
+            v = sys.getwindowsversion()
+            version = f"{v.major}.{v.minor}.{v.build}"
+            try:
+                with winreg.OpenKey(
+                    winreg.HKEY_LOCAL_MACHINE,
+                    r"SOFTWARE\Microsoft\Windows NT\CurrentVersion",
+                ) as key:
+                    version += f".{winreg.QueryValueEx(key, 'UBR')[0]}"
+            except OSError:
+                pass
+            return f"Microsoft Windows [Version {version}]"
         except:
             pass
 
@@ -230,15 +248,7 @@ class SystemUtils:
 
     def is_windows_10_or_later(self) -> bool:
         """Check if running Windows 10 or later"""
-        try:
-            import platform
-
-            version = platform.version()
-            # Windows 10 build numbers start from 10240
-            build_number = int(version.split(".")[-1])
-            return build_number >= 10240
-        except:
-            return False
+        return _is_windows_10_or_later()
 
     def get_installed_updates(self) -> List[str]:
         """Get list of installed Windows updates"""
@@ -246,9 +256,9 @@ class SystemUtils:
             updates = []
 
             powershell_script = """
-            Get-HotFix | Select-Object -Property HotFixID, Description, InstalledOn | 
-            Sort-Object InstalledOn -Descending | 
-            ForEach-Object { "$($_.HotFixID)|$($_.Description)|$($_.InstalledOn)" }
+            Get-HotFix | Select-Object -Property HotFixID, Description, InstalledOn |
+            Sort-Object InstalledOn -Descending |
+            ConvertTo-Csv -NoTypeInformation
             """
 
             result = subprocess.run(
@@ -260,17 +270,17 @@ class SystemUtils:
             )
 
             if result.returncode == 0:
-                for line in result.stdout.strip().split("\n"):
-                    if line.strip() and "|" in line:
-                        parts = line.split("|")
-                        if len(parts) >= 3:
-                            updates.append(
-                                {
-                                    "id": parts[0].strip(),
-                                    "description": parts[1].strip(),
-                                    "installed_on": parts[2].strip(),
-                                }
-                            )
+                reader = csv.reader(io.StringIO(result.stdout))
+                next(reader, None)  # header row
+                for row in reader:
+                    if len(row) >= 3:
+                        updates.append(
+                            {
+                                "id": row[0].strip(),
+                                "description": row[1].strip(),
+                                "installed_on": row[2].strip(),
+                            }
+                        )
 
             return updates
 
@@ -284,12 +294,10 @@ class SystemUtils:
             free_bytes = ctypes.c_ulonglong(0)
             total_bytes = ctypes.c_ulonglong(0)
 
-            ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-                ctypes.c_wchar_p(path),
-                ctypes.pointer(free_bytes),
-                ctypes.pointer(total_bytes),
-                None,
-            )
+            if not _disk_free_space_func()(
+                path, ctypes.byref(free_bytes), ctypes.byref(total_bytes), None
+            ):
+                raise ctypes.WinError()
 
             free_gb = free_bytes.value / (1024**3)
             total_gb = total_bytes.value / (1024**3)
@@ -309,6 +317,10 @@ class SystemUtils:
 
     def run_system_file_checker(self) -> bool:
         """Run System File Checker (sfc /scannow)"""
+        if not self.is_admin():
+            self.logger.error("Administrator privileges are required to run System File Checker")
+            return False
+
         try:
             self.logger.info("Running System File Checker...")
 
@@ -336,6 +348,10 @@ class SystemUtils:
 
     def enable_system_restore(self) -> bool:
         """Enable System Restore on C: drive"""
+        if not self.is_admin():
+            self.logger.error("Administrator privileges are required to enable System Restore")
+            return False
+
         try:
             self.logger.info("Enabling System Restore...")
 
@@ -365,34 +381,31 @@ class SystemUtils:
     def get_system_uptime(self) -> str:
         """Get system uptime"""
         try:
-            result = subprocess.run(
-                ["wmic", "os", "get", "LastBootUpTime", "/format:csv"],
-                capture_output=True,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
+            # Milliseconds since boot, straight from the kernel
+            get_tick_count = ctypes.windll.kernel32.GetTickCount64
+            get_tick_count.restype = ctypes.c_uint64
+            seconds = get_tick_count() // 1000
 
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                for line in lines[1:]:
-                    if line.strip():
-                        fields = line.split(",")
-                        if len(fields) >= 2:
-                            boot_time_str = fields[1].strip()
-                            if boot_time_str:
-                                # Parse WMI datetime format
-                                boot_time = datetime.strptime(
-                                    boot_time_str[:14], "%Y%m%d%H%M%S"
-                                )
-                                uptime = datetime.now() - boot_time
-
-                                days = uptime.days
-                                hours, remainder = divmod(uptime.seconds, 3600)
-                                minutes, _ = divmod(remainder, 60)
-
-                                return f"{days} days, {hours} hours, {minutes} minutes"
+            days, remainder = divmod(seconds, 86400)
+            hours, remainder = divmod(remainder, 3600)
+            minutes, _ = divmod(remainder, 60)
+
+            return f"{days} days, {hours} hours, {minutes} minutes"
 
         except Exception as e:
             self.logger.error(f"Error getting system uptime: {str(e)}")
 
         return "Unknown"
+
+    def get_full_report(self) -> dict:
+        """Gather system info, reboot, disk space and uptime concurrently"""
+        # Each query waits on a subprocess, the registry or Win32, not the CPU
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                "system_info": executor.submit(self.get_system_info),
+                "pending_reboot": executor.submit(self.check_pending_reboot),
+                "disk_space": executor.submit(self.check_disk_space),
+                "uptime": executor.submit(self.get_system_uptime),
+            }
+
+        return {name: future.result() for name, future in futures.items()}